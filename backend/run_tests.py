@@ -41,28 +41,46 @@ def start_dynamodb_local():
         logger.error(f"Failed to start DynamoDB Local: {e}")
         return False
 
-def run_tests():
-    """Run the test suite"""
+def run_tests(paths=None):
+    """Run the test suite
+
+    With no arguments the full suite runs in parallel. Passing explicit
+    test paths (python backend/run_tests.py backend/tests/test_x.py)
+    runs just those files serially: for focused reruns, booting xdist
+    workers costs more than the tests themselves.
+    """
     logger.info("Running tests...")
-    
+
     # Set environment variables
     os.environ['DYNAMODB_LOCAL_ENDPOINT'] = 'http://localhost:8000'
     os.environ['AWS_ACCESS_KEY_ID'] = 'fake'
     os.environ['AWS_SECRET_ACCESS_KEY'] = 'fake'
     os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
-    
+
+    args = [
+        sys.executable, '-m', 'pytest',
+        '-v',
+        '--tb=short'
+    ]
+    if paths:
+        args += ['-p', 'no:xdist'] + list(paths)
+    else:
+        args += [
+            'backend/tests/',
+            # One worker per core: xdist_group marks keep each DAO table's
+            # tests serialized on a single worker, while ungrouped tests
+            # (model/validator units) spread across all remaining workers
+            '-n', 'auto',
+            '--dist=loadgroup'
+        ]
+
     try:
-        # Run pytest from backend directory
-        result = subprocess.run([
-            sys.executable, '-m', 'pytest', 
-            'backend/tests/', 
-            '-v', 
-            '--tb=short'
-        ], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
-        
+        # Run pytest from the repository root
+        result = subprocess.run(args, check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
         logger.info("All tests passed!")
         return True
-        
+
     except subprocess.CalledProcessError as e:
         logger.error(f"Tests failed with exit code {e.returncode}")
         return False
@@ -77,8 +95,8 @@ def main():
     else:
         logger.info("DynamoDB Local is already running")
     
-    # Run tests
-    success = run_tests()
+    # Run tests (any CLI arguments are treated as focused test paths)
+    success = run_tests(paths=sys.argv[1:])
     
     if success:
         logger.info("✅ All tests completed successfully")
@@ -34,8 +34,21 @@ class AuthService:
     
     def __init__(self):
         self.settings = get_settings()
-        self.user_dao = EncryptedUserConfigDAO()
-    
+        self._user_dao = None
+
+    @property
+    def user_dao(self) -> EncryptedUserConfigDAO:
+        """DAO built on first use
+
+        The module-level auth_service instance below is created at import
+        time; deferring the DAO keeps importing this module from opening a
+        DynamoDB connection.
+        """
+        if self._user_dao is None:
+            self._user_dao = EncryptedUserConfigDAO()
+        return self._user_dao
+
+
     def verify_tennis_site_credentials(self, username: str, password: str) -> bool:
         """Verify credentials against the tennis site"""
         try:
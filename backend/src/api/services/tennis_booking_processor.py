@@ -9,6 +9,7 @@ import os
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path for tennis script import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
@@ -37,7 +38,12 @@ class TennisBookingProcessor:
         self.poll_interval = 30  # seconds
         self.max_concurrent_bookings = 3
         self.processing_bookings = {}  # Track currently processing bookings
-        
+        self.prefetched_configs = {}  # request_id -> resolved tennis config
+        # Shared worker pool for booking execution: bounded at
+        # max_concurrent_bookings and reuses threads across polls instead
+        # of spawning a fresh thread per booking
+        self.booking_executor = None
+
     def start(self):
         """Start the booking processor"""
         if self.running:
@@ -57,6 +63,15 @@ class TennisBookingProcessor:
         self.running = False
         if self.processor_thread:
             self.processor_thread.join(timeout=10)
+        if self.booking_executor is not None:
+            self.booking_executor.shutdown(wait=False, cancel_futures=True)
+            self.booking_executor = None
+        # Release any warm Chrome instances the tennis script is pooling
+        try:
+            import tennis
+            tennis.shutdown_drivers()
+        except ImportError:
+            pass
         logger.info("Tennis booking processor stopped")
         
     def _process_loop(self):
@@ -89,9 +104,11 @@ class TennisBookingProcessor:
                 return
                 
             logger.info(f"Found {len(pending_bookings)} pending bookings to process")
-            
+
             # Process up to max_concurrent_bookings
-            for booking in pending_bookings[:self.max_concurrent_bookings]:
+            batch = pending_bookings[:self.max_concurrent_bookings]
+            self._prefetch_user_configs(batch)
+            for booking in batch:
                 if booking.request_id not in self.processing_bookings:
                     self._process_booking_request(booking)
                     
@@ -117,14 +134,60 @@ class TennisBookingProcessor:
                 
             if ready_bookings:
                 logger.info(f"Found {len(ready_bookings)} scheduled bookings ready for processing")
-                
-                for booking in ready_bookings[:self.max_concurrent_bookings]:
+
+                batch = ready_bookings[:self.max_concurrent_bookings]
+                self._prefetch_user_configs(batch)
+                for booking in batch:
                     if booking.request_id not in self.processing_bookings:
                         self._process_booking_request(booking)
                         
         except Exception as e:
             logger.error(f"Error processing scheduled bookings: {e}")
             
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        """Return the booking worker pool, creating it on first use
+
+        Created lazily (rather than in __init__) so manual processing and
+        a restart after stop() both get a live pool.
+        """
+        if self.booking_executor is None:
+            self.booking_executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_bookings,
+                thread_name_prefix='booking'
+            )
+        return self.booking_executor
+
+    def _prefetch_user_configs(self, bookings: List[BookingRequestModel]):
+        """Warm the tennis script's user-config cache for a batch of bookings
+
+        One BatchGetItem up front replaces a GetItem per booking inside
+        make_reservation; on any failure the per-user fallback still works.
+        """
+        if not bookings:
+            return
+
+        try:
+            import tennis
+            tennis.prefetch_user_configs(booking.user_id for booking in bookings)
+        except ImportError:
+            logger.debug("Tennis script module not available for config prefetch")
+            return
+        except Exception as e:
+            logger.warning(f"User-config prefetch failed, falling back to per-user lookups: {e}")
+            return
+
+        # Resolve the full per-booking config now, while the user cache is
+        # warm, so the worker thread can skip load_config entirely
+        for booking in bookings:
+            try:
+                config = tennis.load_config(booking.user_id, booking)
+            except Exception as e:
+                logger.debug(f"Config prefetch skipped for {booking.request_id}: {e}")
+                continue
+            self.prefetched_configs[booking.request_id] = config
+            # Overlap the next Chrome launch with the current booking run
+            tennis.prefetch_driver(config)
+
     def _process_booking_request(self, booking: BookingRequestModel):
         """Process a single booking request"""
         try:
@@ -138,14 +201,9 @@ class TennisBookingProcessor:
                 "Processing booking request"
             )
             
-            # Start processing in separate thread
-            processing_thread = threading.Thread(
-                target=self._execute_booking,
-                args=(booking,),
-                daemon=True
-            )
-            processing_thread.start()
-            
+            # Hand off to the shared worker pool
+            self._ensure_executor().submit(self._execute_booking, booking)
+
         except Exception as e:
             logger.error(f"Error starting booking processing for {booking.request_id}: {e}")
             self._handle_booking_failure(booking, str(e))
@@ -158,7 +216,10 @@ class TennisBookingProcessor:
             # Import tennis script
             try:
                 import tennis
-                success = tennis.make_reservation(booking.user_id, booking)
+                preloaded = self.prefetched_configs.pop(booking.request_id, None)
+                success = tennis.make_reservation(
+                    booking.user_id, booking, preloaded_config=preloaded
+                )
                 
                 if success:
                     self._handle_booking_success(booking)
@@ -2,7 +2,9 @@
 # ABOUTME: Handles user registration, password validation, session isolation, and security monitoring
 
 from typing import Optional, List, Dict, Any
+from collections import defaultdict
 from datetime import datetime, timedelta
+import heapq
 import logging
 import uuid
 from enum import Enum
@@ -15,6 +17,31 @@ from ...models import EncryptedUserConfig
 
 logger = logging.getLogger(__name__)
 
+# Special characters accepted by password validation, hoisted so every
+# call reuses one frozenset instead of rescanning a string literal per
+# character; isdisjoint runs the membership test at C level
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# Single-pass password criteria scan: each ASCII code maps to a bit and
+# OR-ing a password's bytes yields all four presence flags in one pass
+# instead of four generator sweeps
+_FLAG_LOWER, _FLAG_UPPER, _FLAG_DIGIT, _FLAG_SPECIAL = 1, 2, 4, 8
+
+def _char_flags(code: int) -> int:
+    char = chr(code)
+    if char.islower():
+        return _FLAG_LOWER
+    if char.isupper():
+        return _FLAG_UPPER
+    if char.isdigit():
+        return _FLAG_DIGIT
+    if char in _SPECIAL_CHARS:
+        return _FLAG_SPECIAL
+    return 0
+
+_CRITERIA_TABLE = bytes(_char_flags(code) for code in range(128))
+_ALL_FLAGS = _FLAG_LOWER | _FLAG_UPPER | _FLAG_DIGIT | _FLAG_SPECIAL
+
 class UserRole(str, Enum):
     """User role enumeration"""
     USER = "user"
@@ -40,15 +67,95 @@ class UserSession:
         self.status = SessionStatus.ACTIVE
         self.access_count = 1
 
+class _SessionStore(dict):
+    """active_sessions mapping that maintains a user_id -> session_id index
+
+    Per-user operations (get_user_sessions, revoke_all_sessions) walk only
+    that user's sessions instead of scanning every active session. The
+    index is kept in sync on every mutation so callers can treat the store
+    as a plain dict.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.by_user: Dict[str, set] = defaultdict(set)
+        # Min-heap of (expires_at, session_id); entries for sessions removed
+        # through other paths go stale and are skipped lazily at cleanup
+        self.expiry_heap: list = []
+
+    def __setitem__(self, session_id: str, session: UserSession):
+        super().__setitem__(session_id, session)
+        self.by_user[session.user_id].add(session_id)
+        heapq.heappush(self.expiry_heap, (session.expires_at, session_id))
+
+    def __delitem__(self, session_id: str):
+        session = self[session_id]
+        super().__delitem__(session_id)
+        user_sessions = self.by_user.get(session.user_id)
+        if user_sessions is not None:
+            user_sessions.discard(session_id)
+            if not user_sessions:
+                del self.by_user[session.user_id]
+
+    def update(self, other=(), **kwargs):
+        for session_id, session in dict(other, **kwargs).items():
+            self[session_id] = session
+
+    def pop(self, session_id, *default):
+        if session_id in self:
+            session = self[session_id]
+            del self[session_id]
+            return session
+        if default:
+            return default[0]
+        raise KeyError(session_id)
+
+    def clear(self):
+        super().clear()
+        self.by_user.clear()
+        self.expiry_heap.clear()
+
 class UserService:
     """Enhanced user management service"""
     
-    def __init__(self):
+    def __init__(self, resource=None):
         self.settings = get_settings()
-        self.user_dao = EncryptedUserConfigDAO()
-        self.system_config_dao = SystemConfigDAO()
-        self.active_sessions: Dict[str, UserSession] = {}  # In production, use Redis
-        
+        # Passing one injected resource through both DAOs keeps them on a
+        # single boto3 client (and its connection pool); the default is the
+        # process-wide shared connection. DAOs are built on first use so
+        # the module-level singleton below never opens a DynamoDB
+        # connection at import time.
+        self._resource = resource
+        self._user_dao = None
+        self._system_config_dao = None
+        self.active_sessions: Dict[str, UserSession] = _SessionStore()  # In production, use Redis
+        # Failed-login counters coalesced in memory between DynamoDB writes;
+        # user_id -> (user, first unflushed failure time)
+        self._pending_failed: Dict[str, tuple] = {}
+
+    @property
+    def user_dao(self) -> EncryptedUserConfigDAO:
+        """User DAO built lazily; settable so tests can inject a mock"""
+        if self._user_dao is None:
+            self._user_dao = EncryptedUserConfigDAO(resource=self._resource)
+        return self._user_dao
+
+    @user_dao.setter
+    def user_dao(self, dao):
+        self._user_dao = dao
+
+    @property
+    def system_config_dao(self) -> SystemConfigDAO:
+        """System config DAO built lazily; settable so tests can inject a mock"""
+        if self._system_config_dao is None:
+            self._system_config_dao = SystemConfigDAO(resource=self._resource)
+        return self._system_config_dao
+
+    @system_config_dao.setter
+    def system_config_dao(self, dao):
+        self._system_config_dao = dao
+
+
     def register_user(self, username: str, password: str, email: str = None, 
                      first_name: str = None, last_name: str = None) -> Optional[EncryptedUserConfig]:
         """
@@ -89,7 +196,7 @@ class UserService:
                 auto_booking_enabled=False,
                 role="user",
                 failed_login_attempts=0,
-                last_login=datetime.now(),
+                last_login=datetime.now().isoformat(),
                 account_locked_until=None
             )
             
@@ -156,7 +263,7 @@ class UserService:
             self.active_sessions[session.session_id] = session
             
             # Update last login
-            authenticated_user.last_login = datetime.now()
+            authenticated_user.last_login = datetime.now().isoformat()
             self.user_dao.update_user(authenticated_user)
             
             return {
@@ -222,13 +329,13 @@ class UserService:
         """
         if not password or len(password) < 8:
             return False
-        
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
-        
-        return has_upper and has_lower and has_digit and has_special
+
+        return (
+            any(c.isupper() for c in password)
+            and any(c.islower() for c in password)
+            and any(c.isdigit() for c in password)
+            and not _SPECIAL_CHARS.isdisjoint(password)
+        )
     
     def is_account_locked(self, user: EncryptedUserConfig) -> bool:
         """Check if user account is locked"""
@@ -237,19 +344,57 @@ class UserService:
         
         return datetime.now() < user.account_locked_until
     
+    # Successive failures inside this window share one DynamoDB write
+    FAILED_LOGIN_FLUSH_SECONDS = 30
+
     def handle_failed_login(self, user: EncryptedUserConfig):
-        """Handle failed login attempt"""
+        """Handle failed login attempt
+
+        The attempt counter is coalesced in memory and only written to
+        DynamoDB when the lock threshold trips, the flush window elapses,
+        or flush_failed_logins() runs - so a brute-force burst costs one
+        update instead of one per attempt.
+        """
+        pending = self._pending_failed.get(user.user_id)
+        if pending is not None:
+            pending_user, first_failure = pending
+            # Callers (authenticate_user_enhanced) re-fetch the user per
+            # attempt, so its persisted counter is stale while writes sit
+            # unflushed; carry the accumulated count forward or the lock
+            # threshold could never trip inside the flush window
+            user.failed_login_attempts = max(
+                user.failed_login_attempts, pending_user.failed_login_attempts
+            )
+        else:
+            first_failure = datetime.now()
+
         user.failed_login_attempts += 1
-        
+        self._pending_failed[user.user_id] = (user, first_failure)
+
         # Lock account after 5 failed attempts
         if user.failed_login_attempts >= 5:
             user.account_locked_until = datetime.now() + timedelta(minutes=30)
             logger.warning(f"Account locked due to failed login attempts: {user.username}")
-        
-        self.user_dao.update_user(user)
-    
+            self._flush_failed_login(user.user_id)
+        elif datetime.now() - first_failure >= timedelta(seconds=self.FAILED_LOGIN_FLUSH_SECONDS):
+            self._flush_failed_login(user.user_id)
+
+    def _flush_failed_login(self, user_id: str):
+        """Persist one user's coalesced failed-login counter"""
+        entry = self._pending_failed.pop(user_id, None)
+        if entry:
+            self.user_dao.update_user(entry[0])
+
+    def flush_failed_logins(self) -> int:
+        """Persist every coalesced failed-login counter; returns the flush count"""
+        user_ids = list(self._pending_failed)
+        for user_id in user_ids:
+            self._flush_failed_login(user_id)
+        return len(user_ids)
+
     def reset_failed_login_attempts(self, user: EncryptedUserConfig):
         """Reset failed login attempts after successful login"""
+        self._pending_failed.pop(user.user_id, None)
         if user.failed_login_attempts > 0:
             user.failed_login_attempts = 0
             user.account_locked_until = None
@@ -258,9 +403,10 @@ class UserService:
     def get_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all active sessions for a user"""
         user_sessions = []
-        
-        for session in self.active_sessions.values():
-            if session.user_id == user_id and session.status == SessionStatus.ACTIVE:
+
+        for session_id in self.active_sessions.by_user.get(user_id, ()):
+            session = self.active_sessions[session_id]
+            if session.status == SessionStatus.ACTIVE:
                 user_sessions.append({
                     "session_id": session.session_id,
                     "created_at": session.created_at,
@@ -294,10 +440,7 @@ class UserService:
         """Revoke all sessions for a user"""
         revoked_count = 0
         
-        sessions_to_revoke = [
-            session_id for session_id, session in self.active_sessions.items()
-            if session.user_id == user_id
-        ]
+        sessions_to_revoke = list(self.active_sessions.by_user.get(user_id, ()))
         
         for session_id in sessions_to_revoke:
             if self.revoke_session(session_id, user_id):
@@ -410,15 +553,27 @@ class UserService:
         if not password:
             return {"score": 0, "level": "very_weak"}
         
-        score = 0
+        flags = 0
+        if password.isascii():
+            for byte in password.encode('ascii'):
+                flags |= _CRITERIA_TABLE[byte]
+                if flags == _ALL_FLAGS:
+                    break
+        else:
+            # Rare non-ASCII passwords keep the Unicode-aware checks
+            flags |= _FLAG_UPPER if any(c.isupper() for c in password) else 0
+            flags |= _FLAG_LOWER if any(c.islower() for c in password) else 0
+            flags |= _FLAG_DIGIT if any(c.isdigit() for c in password) else 0
+            flags |= _FLAG_SPECIAL if not _SPECIAL_CHARS.isdisjoint(password) else 0
+
         criteria = {
             "length": len(password) >= 8,
-            "uppercase": any(c.isupper() for c in password),
-            "lowercase": any(c.islower() for c in password),
-            "numbers": any(c.isdigit() for c in password),
-            "special_chars": any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
+            "uppercase": bool(flags & _FLAG_UPPER),
+            "lowercase": bool(flags & _FLAG_LOWER),
+            "numbers": bool(flags & _FLAG_DIGIT),
+            "special_chars": bool(flags & _FLAG_SPECIAL)
         }
-        
+
         score = sum(criteria.values())
         
         if score == 5:
@@ -468,20 +623,28 @@ class UserService:
         return recommendations
     
     def cleanup_expired_sessions(self):
-        """Clean up expired sessions (should be run periodically)"""
+        """Clean up expired sessions (should be run periodically)
+
+        Pops the store's expiry heap until the earliest remaining session
+        is still valid, so the cost scales with the number of expired
+        sessions rather than with every active one.
+        """
         current_time = datetime.now()
-        expired_sessions = []
-        
-        for session_id, session in self.active_sessions.items():
-            if session.expires_at < current_time:
-                expired_sessions.append(session_id)
-        
-        for session_id in expired_sessions:
-            self.active_sessions[session_id].status = SessionStatus.EXPIRED
+        heap = self.active_sessions.expiry_heap
+        cleaned_count = 0
+
+        while heap and heap[0][0] < current_time:
+            _, session_id = heapq.heappop(heap)
+            session = self.active_sessions.get(session_id)
+            if session is None:
+                # Already revoked through another path; stale heap entry
+                continue
+            session.status = SessionStatus.EXPIRED
             del self.active_sessions[session_id]
-        
-        logger.info(f"Cleaned up {len(expired_sessions)} expired sessions")
-        return len(expired_sessions)
+            cleaned_count += 1
+
+        logger.info(f"Cleaned up {cleaned_count} expired sessions")
+        return cleaned_count
 
 # Global user service instance
 user_service = UserService()
\ No newline at end of file
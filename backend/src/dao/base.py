@@ -43,10 +43,14 @@ class DatabaseError(DAOError):
 class BaseDAO(Generic[T], ABC):
     """Base Data Access Object with common operations"""
     
-    def __init__(self, model_class: Type[T]):
+    def __init__(self, model_class: Type[T], resource=None):
         self.model_class = model_class
-        self.client = get_client()
-        self.resource = get_resource()
+        # Default to the process-wide resource so every DAO shares one
+        # keep-alive connection pool; callers may inject their own (e.g. a
+        # stubbed resource in unit tests, which must not touch the global
+        # connection at all)
+        self.resource = resource if resource is not None else get_resource()
+        self.client = self.resource.meta.client if resource is not None else get_client()
         self.table_name = self._get_table_name()
         self.table = self.resource.Table(self.table_name)
     
@@ -114,6 +118,18 @@ class BaseDAO(Generic[T], ABC):
             logger.error(f"Unexpected error creating {self.model_class.__name__}: {e}")
             raise DatabaseError(f"Failed to create item: {e}")
     
+    def _raw_put(self, item: Dict[str, Any]) -> None:
+        """Put a pre-serialized item without model or condition checks
+
+        Fast path for test setup: skips Pydantic validation, the
+        attribute_not_exists guard and the model round trip. Production
+        writes should keep going through create/update.
+        """
+        try:
+            self.table.put_item(Item=item)
+        except ClientError as e:
+            self._handle_client_error(e, 'raw_put')
+
     def get(self, **key_attrs) -> Optional[T]:
         """Get an item by primary key"""
         try:
@@ -14,8 +14,8 @@ logger = logging.getLogger(__name__)
 class BookingRequestDAO(BaseDAO[BookingRequest]):
     """Data Access Object for BookingRequest operations"""
     
-    def __init__(self):
-        super().__init__(BookingRequest)
+    def __init__(self, resource=None):
+        super().__init__(BookingRequest, resource=resource)
     
     def _get_table_name(self) -> str:
         """Get table name for BookingRequest"""
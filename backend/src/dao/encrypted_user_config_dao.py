@@ -4,6 +4,7 @@
 from typing import Optional, List, Dict, Any
 import logging
 import hashlib
+import time
 from datetime import datetime
 
 from .base import BaseDAO, NotFoundError
@@ -12,12 +13,27 @@ from ..security import get_credential_storage, CredentialStorage
 
 logger = logging.getLogger(__name__)
 
+# Attributes every projected get_user read must include: the model cannot
+# validate without them, so they are merged into any caller-supplied
+# projection
+_REQUIRED_PROJECTION_FIELDS = (
+    'user_id', 'username', 'password', 'email', 'first_name', 'last_name'
+)
+
+# Retry policy for keys DynamoDB throttles out of a BatchGetItem response:
+# exponential backoff capped at _BATCH_RETRY_MAX_SLEEP seconds, giving up
+# after _BATCH_RETRY_ATTEMPTS retries so sustained throttling can never
+# hot-loop the same batch forever
+_BATCH_RETRY_ATTEMPTS = 5
+_BATCH_RETRY_BASE_SLEEP = 0.05
+_BATCH_RETRY_MAX_SLEEP = 1.0
+
 
 class EncryptedUserConfigDAO(BaseDAO[EncryptedUserConfig]):
     """Enhanced Data Access Object for EncryptedUserConfig operations"""
     
-    def __init__(self):
-        super().__init__(EncryptedUserConfig)
+    def __init__(self, resource=None):
+        super().__init__(EncryptedUserConfig, resource=resource)
         self.credential_storage = get_credential_storage()
     
     def _get_table_name(self) -> str:
@@ -54,10 +70,31 @@ class EncryptedUserConfigDAO(BaseDAO[EncryptedUserConfig]):
         logger.info(f"Created encrypted user: {user_config.user_id}")
         return user_config
     
-    def get_user(self, user_id: str) -> Optional[EncryptedUserConfig]:
-        """Get user configuration by user ID with automatic decryption"""
+    def get_user(self, user_id: str, strong_consistency: bool = False,
+                 fields: Optional[List[str]] = None) -> Optional[EncryptedUserConfig]:
+        """Get user configuration by user ID with automatic decryption
+
+        Defaults to an eventually-consistent read: user config rarely
+        changes between bookings, and eventual consistency costs half the
+        read capacity with lower latency. Pass strong_consistency=True
+        for read-after-write paths that must see their own update.
+
+        Passing fields projects the read down to those attributes (plus
+        the ones the model requires), so callers that only need a slice
+        of the config don't pay read capacity for the whole item.
+        """
         try:
-            response = self.table.get_item(Key={'user_id': user_id})
+            get_kwargs: Dict[str, Any] = {
+                'Key': {'user_id': user_id},
+                'ConsistentRead': strong_consistency
+            }
+            if fields:
+                projected = list(dict.fromkeys(tuple(fields) + _REQUIRED_PROJECTION_FIELDS))
+                names = {f'#f{i}': name for i, name in enumerate(projected)}
+                get_kwargs['ProjectionExpression'] = ', '.join(names)
+                get_kwargs['ExpressionAttributeNames'] = names
+
+            response = self.table.get_item(**get_kwargs)
             
             if 'Item' not in response:
                 return None
@@ -69,6 +106,63 @@ class EncryptedUserConfigDAO(BaseDAO[EncryptedUserConfig]):
             logger.error(f"Error getting user {user_id}: {e}")
             raise
     
+    def get_users_batch(self, user_ids: List[str]) -> Dict[str, EncryptedUserConfig]:
+        """
+        Get multiple user configurations via BatchGetItem with automatic decryption
+
+        Args:
+            user_ids: User IDs to fetch (duplicates are collapsed)
+
+        Returns:
+            Mapping of user_id to decrypted configuration (missing IDs
+            omitted, as are keys still unprocessed after the retry budget)
+        """
+        users: Dict[str, EncryptedUserConfig] = {}
+        unique_ids = list(dict.fromkeys(user_ids))
+
+        try:
+            # BatchGetItem accepts at most 100 keys per request
+            for start in range(0, len(unique_ids), 100):
+                request_keys = [{'user_id': user_id} for user_id in unique_ids[start:start + 100]]
+                attempt = 0
+                while request_keys:
+                    response = self.resource.batch_get_item(
+                        RequestItems={self.table_name: {'Keys': request_keys}}
+                    )
+
+                    for item in response.get('Responses', {}).get(self.table_name, []):
+                        try:
+                            user = EncryptedUserConfig.from_storage_dict(item)
+                            users[user.user_id] = user
+                        except Exception as e:
+                            logger.warning(f"Failed to decrypt user record: {e}")
+                            continue
+
+                    # Retry any keys DynamoDB throttled out of the response,
+                    # backing off exponentially and giving up after the
+                    # retry budget rather than hot-looping under throttle
+                    request_keys = response.get('UnprocessedKeys', {}).get(self.table_name, {}).get('Keys', [])
+                    if not request_keys:
+                        break
+                    attempt += 1
+                    if attempt > _BATCH_RETRY_ATTEMPTS:
+                        logger.warning(
+                            f"Giving up on {len(request_keys)} unprocessed keys after "
+                            f"{_BATCH_RETRY_ATTEMPTS} retries; returning partial results"
+                        )
+                        break
+                    time.sleep(min(
+                        _BATCH_RETRY_BASE_SLEEP * (2 ** (attempt - 1)),
+                        _BATCH_RETRY_MAX_SLEEP
+                    ))
+
+            logger.debug(f"Batch fetched {len(users)} of {len(unique_ids)} users")
+            return users
+
+        except Exception as e:
+            logger.error(f"Error batch getting users: {e}")
+            raise
+
     def get_user_by_username(self, username: str) -> Optional[EncryptedUserConfig]:
         """
         Get user configuration by username
@@ -1,9 +1,11 @@
 # ABOUTME: SystemConfig Data Access Object with configuration management operations
 # ABOUTME: Provides validated CRUD operations and config queries for SystemConfig
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 import logging
 
+from botocore.exceptions import ClientError
+
 from .base import BaseDAO, NotFoundError
 from ..models.system_config import SystemConfig, ConfigCategory, DEFAULT_SYSTEM_CONFIGS
 
@@ -13,8 +15,12 @@ logger = logging.getLogger(__name__)
 class SystemConfigDAO(BaseDAO[SystemConfig]):
     """Data Access Object for SystemConfig operations"""
     
-    def __init__(self):
-        super().__init__(SystemConfig)
+    def __init__(self, resource=None):
+        super().__init__(SystemConfig, resource=resource)
+        # Set once the first Query reveals the table has no category-index,
+        # so later calls go straight to the Scan fallback instead of paying
+        # a doomed Query round trip every time
+        self._category_index_missing = False
     
     def _get_table_name(self) -> str:
         """Get table name for SystemConfig"""
@@ -58,25 +64,8 @@ class SystemConfigDAO(BaseDAO[SystemConfig]):
             return self.update(existing_config)
         else:
             # Create new configuration
-            from ..models.system_config import ConfigValueType
-            
-            # Determine value type
-            if isinstance(config_value, str):
-                value_type = ConfigValueType.STRING
-            elif isinstance(config_value, int):
-                value_type = ConfigValueType.INTEGER
-            elif isinstance(config_value, float):
-                value_type = ConfigValueType.FLOAT
-            elif isinstance(config_value, bool):
-                value_type = ConfigValueType.BOOLEAN
-            elif isinstance(config_value, list):
-                value_type = ConfigValueType.LIST
-            elif isinstance(config_value, dict):
-                value_type = ConfigValueType.DICT
-            else:
-                value_type = ConfigValueType.STRING
-                config_value = str(config_value)
-            
+            value_type, config_value = self._infer_value_type(config_value)
+
             new_config = SystemConfig(
                 config_key=config_key,
                 config_value=config_value,
@@ -88,6 +77,50 @@ class SystemConfigDAO(BaseDAO[SystemConfig]):
             
             return self.create_config(new_config)
     
+    @staticmethod
+    def _infer_value_type(config_value: Any) -> Tuple[Any, Any]:
+        """Determine the stored value type for a raw configuration value"""
+        from ..models.system_config import ConfigValueType
+
+        if isinstance(config_value, str):
+            return ConfigValueType.STRING, config_value
+        elif isinstance(config_value, int):
+            return ConfigValueType.INTEGER, config_value
+        elif isinstance(config_value, float):
+            return ConfigValueType.FLOAT, config_value
+        elif isinstance(config_value, bool):
+            return ConfigValueType.BOOLEAN, config_value
+        elif isinstance(config_value, list):
+            return ConfigValueType.LIST, config_value
+        elif isinstance(config_value, dict):
+            return ConfigValueType.DICT, config_value
+        else:
+            return ConfigValueType.STRING, str(config_value)
+
+    def batch_set_configs(
+        self,
+        items: List[Tuple[str, Any, ConfigCategory]]
+    ) -> List[SystemConfig]:
+        """Create multiple configurations with a single batched write
+
+        Each item is a (config_key, config_value, category) tuple. Backed by
+        BatchWriteItem, which only supports puts and deletes - existing items
+        are overwritten wholesale, so read-modify updates still go through
+        set_config per key.
+        """
+        configs = []
+        for config_key, config_value, category in items:
+            value_type, config_value = self._infer_value_type(config_value)
+            configs.append(SystemConfig(
+                config_key=config_key,
+                config_value=config_value,
+                value_type=value_type,
+                category=category,
+                description=f"Configuration for {config_key}"
+            ))
+
+        return self.batch_create(configs)
+
     def update_config(self, config: SystemConfig) -> SystemConfig:
         """Update system configuration"""
         existing_config = self.get_config(config.config_key)
@@ -104,14 +137,52 @@ class SystemConfigDAO(BaseDAO[SystemConfig]):
         
         return self.delete(config_key=config_key)
     
-    def get_configs_by_category(self, category: ConfigCategory) -> List[SystemConfig]:
-        """Get all configurations in a category"""
+    def get_configs_by_category(
+        self,
+        category: ConfigCategory,
+        key_prefix: Optional[str] = None
+    ) -> List[SystemConfig]:
+        """Get all configurations in a category
+
+        Prefers a Query against the category-index GSI so the read scales
+        with the matching items rather than the whole table; falls back to a
+        filtered Scan when the table was provisioned without the index. An
+        optional key_prefix is pushed down as a server-side begins_with
+        filter instead of post-filtering in Python.
+        """
         try:
-            response = self.table.scan(
-                FilterExpression='category = :category',
-                ExpressionAttributeValues={':category': category.value}
-            )
-            
+            values = {':category': category.value}
+            prefix_filter = 'begins_with(config_key, :prefix)'
+            if key_prefix:
+                values[':prefix'] = key_prefix
+
+            if not self._category_index_missing:
+                try:
+                    query_kwargs = {
+                        'IndexName': 'category-index',
+                        'KeyConditionExpression': 'category = :category',
+                        'ExpressionAttributeValues': values
+                    }
+                    if key_prefix:
+                        query_kwargs['FilterExpression'] = prefix_filter
+                    response = self.table.query(**query_kwargs)
+                except ClientError as e:
+                    error_code = e.response.get('Error', {}).get('Code', '')
+                    if error_code not in ('ResourceNotFoundException', 'ValidationException'):
+                        raise
+                    # Table created without the GSI - remember, and let the
+                    # filtered Scan below serve this and every later call
+                    self._category_index_missing = True
+
+            if self._category_index_missing:
+                scan_kwargs = {
+                    'FilterExpression': 'category = :category',
+                    'ExpressionAttributeValues': values
+                }
+                if key_prefix:
+                    scan_kwargs['FilterExpression'] += f' AND {prefix_filter}'
+                response = self.table.scan(**scan_kwargs)
+
             configs = []
             for item in response.get('Items', []):
                 config = self.model_class.from_dynamodb_item(item)
@@ -4,6 +4,8 @@
 from typing import Optional, List
 import logging
 
+from botocore.exceptions import ClientError
+
 from .base import BaseDAO, NotFoundError
 from ..models.user_config import UserConfig
 
@@ -13,8 +15,8 @@ logger = logging.getLogger(__name__)
 class UserConfigDAO(BaseDAO[UserConfig]):
     """Data Access Object for UserConfig operations"""
     
-    def __init__(self):
-        super().__init__(UserConfig)
+    def __init__(self, resource=None):
+        super().__init__(UserConfig, resource=resource)
     
     def _get_table_name(self) -> str:
         """Get table name for UserConfig"""
@@ -88,6 +90,26 @@ class UserConfigDAO(BaseDAO[UserConfig]):
     def user_exists(self, user_id: str) -> bool:
         """Check if user exists"""
         return self.exists(user_id=user_id)
+
+    def is_active(self, user_id: str) -> bool:
+        """Check a user's is_active flag with a projected GetItem
+
+        Transfers only the flag instead of the whole record; callers that
+        just need the status should prefer this over get_user.
+        """
+        try:
+            response = self.table.get_item(
+                Key={'user_id': user_id},
+                ProjectionExpression='is_active'
+            )
+        except ClientError as e:
+            self._handle_client_error(e, 'is_active')
+
+        item = response.get('Item')
+        if item is None:
+            raise NotFoundError(f"User {user_id} not found")
+
+        return bool(item.get('is_active'))
     
     def username_exists(self, username: str) -> bool:
         """Check if username is already taken"""
@@ -186,27 +208,38 @@ class UserConfigDAO(BaseDAO[UserConfig]):
         logger.warning(f"Failed authentication attempt for user: {username}")
         return None
     
-    def deactivate_user(self, user_id: str) -> bool:
-        """Deactivate a user account"""
-        user = self.get_user(user_id)
-        if not user:
-            raise NotFoundError(f"User {user_id} not found")
-        
-        user.deactivate()
-        self.update_user(user)
+    def _set_active(self, user_id: str, is_active: bool) -> UserConfig:
+        """Flip is_active with one conditional UpdateItem
+
+        ReturnValues='ALL_NEW' hands back the updated attributes, so callers
+        get the fresh user without the old get + update + re-read round trips.
+        """
+        try:
+            response = self.table.update_item(
+                Key={'user_id': user_id},
+                UpdateExpression='SET is_active = :is_active',
+                ConditionExpression='attribute_exists(user_id)',
+                ExpressionAttributeValues={':is_active': is_active},
+                ReturnValues='ALL_NEW'
+            )
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':
+                raise NotFoundError(f"User {user_id} not found")
+            self._handle_client_error(e, 'set_active')
+
+        return self.model_class.from_dynamodb_item(response['Attributes'])
+
+    def deactivate_user(self, user_id: str) -> UserConfig:
+        """Deactivate a user account, returning the updated user"""
+        user = self._set_active(user_id, False)
         logger.info(f"Deactivated user: {user_id}")
-        return True
-    
-    def activate_user(self, user_id: str) -> bool:
-        """Activate a user account"""
-        user = self.get_user(user_id)
-        if not user:
-            raise NotFoundError(f"User {user_id} not found")
-        
-        user.activate()
-        self.update_user(user)
+        return user
+
+    def activate_user(self, user_id: str) -> UserConfig:
+        """Activate a user account, returning the updated user"""
+        user = self._set_active(user_id, True)
         logger.info(f"Activated user: {user_id}")
-        return True
+        return user
     
     def update_user_preferences(
         self, 
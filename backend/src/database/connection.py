@@ -5,10 +5,20 @@ import boto3
 import os
 import logging
 from typing import Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 logger = logging.getLogger(__name__)
 
+# Shared client configuration: TCP keep-alive plus a connection pool wide
+# enough that concurrent DAO calls never queue behind a single socket.
+# Adaptive retries back off on throttling instead of hammering the table.
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+
 class DynamoDBConnection:
     """Manages DynamoDB connections for local and AWS environments"""
     
@@ -29,11 +39,12 @@ class DynamoDBConnection:
                         endpoint_url=self.local_endpoint,
                         region_name=self.region,
                         aws_access_key_id='fake',
-                        aws_secret_access_key='fake'
+                        aws_secret_access_key='fake',
+                        config=_BOTO_CONFIG
                     )
                 else:
                     logger.info("Connecting to AWS DynamoDB")
-                    self._dynamodb = boto3.client('dynamodb', region_name=self.region)
+                    self._dynamodb = boto3.client('dynamodb', region_name=self.region, config=_BOTO_CONFIG)
                     
                 # Test connection
                 self._dynamodb.list_tables()
@@ -56,11 +67,12 @@ class DynamoDBConnection:
                         endpoint_url=self.local_endpoint,
                         region_name=self.region,
                         aws_access_key_id='fake',
-                        aws_secret_access_key='fake'
+                        aws_secret_access_key='fake',
+                        config=_BOTO_CONFIG
                     )
                 else:
                     logger.info("Creating AWS DynamoDB resource")
-                    self._dynamodb_resource = boto3.resource('dynamodb', region_name=self.region)
+                    self._dynamodb_resource = boto3.resource('dynamodb', region_name=self.region, config=_BOTO_CONFIG)
                     
             except (ClientError, NoCredentialsError) as e:
                 logger.error(f"Failed to create DynamoDB resource: {e}")
@@ -3,14 +3,63 @@
 
 import boto3
 import logging
+import os
+import time
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from botocore.exceptions import ClientError
 from .connection import get_resource
+from .schemas import qualified_table_name
 import uuid
 
 logger = logging.getLogger(__name__)
 
+_CACHE_MISS = object()
+
+
+class _TTLCache:
+    """Tiny per-process TTL cache for read-mostly GetItem results
+
+    Opt-in via DDB_ENABLE_LOCAL_CACHE=1 (the test conftest sets it), so
+    production reads always go to the wire. Writers invalidate their key,
+    and the short TTL bounds staleness for anything they miss.
+    """
+
+    def __init__(self, ttl_seconds: float = 5.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Any, Any] = {}
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether local read caching is switched on for this process"""
+        return os.getenv('DDB_ENABLE_LOCAL_CACHE') == '1'
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value for key, or _CACHE_MISS"""
+        if not self.enabled():
+            return _CACHE_MISS
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return _CACHE_MISS
+
+        expiry, value = entry
+        if time.monotonic() >= expiry:
+            del self._entries[key]
+            return _CACHE_MISS
+
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache value for key until the TTL elapses"""
+        if self.enabled():
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key: Any) -> None:
+        """Drop any cached value for key"""
+        self._entries.pop(key, None)
+
+
 class DynamoDBOperations:
     """Basic CRUD operations for DynamoDB tables"""
     
@@ -18,8 +67,8 @@ class DynamoDBOperations:
         self.dynamodb = get_resource()
     
     def _get_table(self, table_name: str):
-        """Get table resource"""
-        return self.dynamodb.Table(table_name)
+        """Get table resource (honoring the per-process table suffix)"""
+        return self.dynamodb.Table(qualified_table_name(table_name))
     
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format"""
@@ -31,48 +80,81 @@ class UserConfigOperations(DynamoDBOperations):
     def __init__(self):
         super().__init__()
         self.table = self._get_table('UserConfigs')
-    
+        self._cache = _TTLCache()
+
+    def _build_config_item(self, user_id: str, config_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble a new UserConfigs item with timestamps and version"""
+        timestamp = self._get_timestamp()
+        item = {
+            'userId': user_id,
+            'username': config_data.get('username'),
+            'password': config_data.get('password'),  # Will be encrypted in Step 1.3
+            'websiteUrl': config_data.get('website_url'),
+            'venue': config_data.get('venue'),
+            'preferredCourt': config_data.get('preferred_court'),
+            'defaultDate': config_data.get('default_date'),
+            'defaultTime': config_data.get('default_time'),
+            'headless': config_data.get('headless', False),
+            'createdAt': timestamp,
+            'updatedAt': timestamp,
+            'version': 1
+        }
+
+        # Remove None values
+        return {k: v for k, v in item.items() if v is not None}
+
     def create_user_config(self, user_id: str, config_data: Dict[str, Any]) -> bool:
         """Create a new user configuration"""
         try:
-            timestamp = self._get_timestamp()
-            item = {
-                'userId': user_id,
-                'username': config_data.get('username'),
-                'password': config_data.get('password'),  # Will be encrypted in Step 1.3
-                'websiteUrl': config_data.get('website_url'),
-                'venue': config_data.get('venue'),
-                'preferredCourt': config_data.get('preferred_court'),
-                'defaultDate': config_data.get('default_date'),
-                'defaultTime': config_data.get('default_time'),
-                'headless': config_data.get('headless', False),
-                'createdAt': timestamp,
-                'updatedAt': timestamp,
-                'version': 1
-            }
-            
-            # Remove None values
-            item = {k: v for k, v in item.items() if v is not None}
-            
-            self.table.put_item(Item=item)
+            self.table.put_item(Item=self._build_config_item(user_id, config_data))
+            self._cache.invalidate(user_id)
             logger.info(f"User config created for user {user_id}")
             return True
-            
+
         except ClientError as e:
             logger.error(f"Failed to create user config for {user_id}: {e}")
             return False
-    
+
+    def create_user_config_and_return(self, user_id: str, config_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create a user configuration and return the stored item
+
+        One conditional PutItem replaces the usual create + read-back
+        pair: the item is fully assembled client-side, so a successful
+        write already tells us exactly what the table holds, and
+        attribute_not_exists guards against clobbering an existing user.
+        """
+        try:
+            item = self._build_config_item(user_id, config_data)
+            self.table.put_item(
+                Item=item,
+                ConditionExpression='attribute_not_exists(userId)'
+            )
+            self._cache.invalidate(user_id)
+            logger.info(f"User config created for user {user_id}")
+            return item
+
+        except ClientError as e:
+            logger.error(f"Failed to create user config for {user_id}: {e}")
+            return None
+
     def get_user_config(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user configuration"""
+        cached = self._cache.get(user_id)
+        if cached is not _CACHE_MISS:
+            logger.debug(f"User config cache hit for user {user_id}")
+            return cached
+
         try:
             response = self.table.get_item(Key={'userId': user_id})
             if 'Item' in response:
                 logger.info(f"User config retrieved for user {user_id}")
+                self._cache.put(user_id, response['Item'])
                 return response['Item']
             else:
                 logger.info(f"No config found for user {user_id}")
+                self._cache.put(user_id, None)
                 return None
-                
+
         except ClientError as e:
             logger.error(f"Failed to get user config for {user_id}: {e}")
             return None
@@ -124,6 +206,7 @@ class UserConfigOperations(DynamoDBOperations):
                 ExpressionAttributeValues=expression_values
             )
             
+            self._cache.invalidate(user_id)
             logger.info(f"User config updated for user {user_id}")
             return True
             
@@ -135,6 +218,7 @@ class UserConfigOperations(DynamoDBOperations):
         """Delete user configuration"""
         try:
             self.table.delete_item(Key={'userId': user_id})
+            self._cache.invalidate(user_id)
             logger.info(f"User config deleted for user {user_id}")
             return True
             
@@ -149,39 +233,84 @@ class BookingRequestOperations(DynamoDBOperations):
         super().__init__()
         self.table = self._get_table('BookingRequests')
     
+    def _build_request_item(self, request_id: str, user_id: str, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble a new BookingRequests item with timestamps and TTL"""
+        timestamp = self._get_timestamp()
+
+        # Calculate TTL (30 days from now)
+        ttl = int((datetime.now(timezone.utc).timestamp() + 30 * 24 * 60 * 60))
+
+        item = {
+            'requestId': request_id,
+            'userId': user_id,
+            'courtId': request_data.get('court_id'),
+            'date': request_data.get('date'),
+            'timeSlot': request_data.get('time_slot'),
+            'venue': request_data.get('venue'),
+            'status': 'pending',
+            'createdAt': timestamp,
+            'updatedAt': timestamp,
+            'ttl': ttl
+        }
+
+        # Remove None values
+        return {k: v for k, v in item.items() if v is not None}
+
     def create_booking_request(self, user_id: str, request_data: Dict[str, Any]) -> Optional[str]:
         """Create a new booking request"""
         try:
             request_id = str(uuid.uuid4())
-            timestamp = self._get_timestamp()
-            
-            # Calculate TTL (30 days from now)
-            ttl = int((datetime.now(timezone.utc).timestamp() + 30 * 24 * 60 * 60))
-            
-            item = {
-                'requestId': request_id,
-                'userId': user_id,
-                'courtId': request_data.get('court_id'),
-                'date': request_data.get('date'),
-                'timeSlot': request_data.get('time_slot'),
-                'venue': request_data.get('venue'),
-                'status': 'pending',
-                'createdAt': timestamp,
-                'updatedAt': timestamp,
-                'ttl': ttl
-            }
-            
-            # Remove None values
-            item = {k: v for k, v in item.items() if v is not None}
-            
-            self.table.put_item(Item=item)
+            self.table.put_item(Item=self._build_request_item(request_id, user_id, request_data))
             logger.info(f"Booking request created with ID {request_id}")
             return request_id
-            
+
         except ClientError as e:
             logger.error(f"Failed to create booking request: {e}")
             return None
-    
+
+    def create_booking_request_and_return(self, user_id: str, request_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create a booking request and return the stored item
+
+        Same single-round-trip contract as create_user_config_and_return:
+        the conditional PutItem both writes and verifies, so no follow-up
+        GetItem is needed.
+        """
+        try:
+            request_id = str(uuid.uuid4())
+            item = self._build_request_item(request_id, user_id, request_data)
+            self.table.put_item(
+                Item=item,
+                ConditionExpression='attribute_not_exists(requestId)'
+            )
+            logger.info(f"Booking request created with ID {request_id}")
+            return item
+
+        except ClientError as e:
+            logger.error(f"Failed to create booking request: {e}")
+            return None
+
+    def create_booking_requests_batch(self, user_id: str, requests_data: List[Dict[str, Any]]) -> List[str]:
+        """Create several booking requests with one batched write
+
+        Request IDs are minted client-side so all puts can share
+        BatchWriteItem round-trips; returns the IDs in input order.
+        """
+        try:
+            request_ids = []
+
+            with self.table.batch_writer() as batch:
+                for request_data in requests_data:
+                    request_id = str(uuid.uuid4())
+                    batch.put_item(Item=self._build_request_item(request_id, user_id, request_data))
+                    request_ids.append(request_id)
+
+            logger.info(f"Created {len(request_ids)} booking requests for user {user_id}")
+            return request_ids
+
+        except ClientError as e:
+            logger.error(f"Failed to create booking requests batch: {e}")
+            return []
+
     def get_booking_request(self, request_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Get booking request"""
         try:
@@ -265,12 +394,82 @@ class BookingRequestOperations(DynamoDBOperations):
             logger.error(f"Failed to get booking requests with status {status}: {e}")
             return []
 
+    def query_by_status_and_user(self, status: str, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get a user's booking requests with a given status
+
+        Queries the status-userId-index GSI, reading only the matching
+        rows instead of scanning (or over-fetching) the whole status
+        partition and filtering client-side.
+        """
+        try:
+            response = self.table.query(
+                IndexName='status-userId-index',
+                KeyConditionExpression='#status = :status AND userId = :userId',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={':status': status, ':userId': user_id},
+                Limit=limit
+            )
+
+            logger.info(f"Retrieved {len(response['Items'])} {status} booking requests for user {user_id}")
+            return response['Items']
+
+        except ClientError as e:
+            logger.error(f"Failed to query {status} booking requests for user {user_id}: {e}")
+            return []
+
+def create_user_config_and_booking_atomically(
+    user_ops: UserConfigOperations,
+    booking_ops: BookingRequestOperations,
+    user_id: str,
+    config_data: Dict[str, Any],
+    request_data: Dict[str, Any]
+) -> Tuple[bool, Optional[str]]:
+    """Create a user config and its first booking request in one transaction
+
+    TransactWriteItems lands both puts in a single RPC and guarantees
+    neither item exists without the other — unlike BatchWriteItem, which
+    can partially succeed. Returns (success, request_id).
+    """
+    try:
+        request_id = str(uuid.uuid4())
+        user_item = user_ops._build_config_item(user_id, config_data)
+        booking_item = booking_ops._build_request_item(request_id, user_id, request_data)
+
+        # The resource-derived client already applies the document
+        # transform, so the items go in as plain Python dicts — running
+        # them through TypeSerializer first would double-serialize
+        client = user_ops.dynamodb.meta.client
+        client.transact_write_items(TransactItems=[
+            {
+                'Put': {
+                    'TableName': user_ops.table.name,
+                    'Item': user_item
+                }
+            },
+            {
+                'Put': {
+                    'TableName': booking_ops.table.name,
+                    'Item': booking_item
+                }
+            }
+        ])
+
+        user_ops._cache.invalidate(user_id)
+        logger.info(f"Atomically created user config and booking request {request_id} for user {user_id}")
+        return True, request_id
+
+    except ClientError as e:
+        logger.error(f"Failed to atomically create user config and booking for {user_id}: {e}")
+        return False, None
+
+
 class SystemConfigOperations(DynamoDBOperations):
     """CRUD operations for SystemConfig table"""
     
     def __init__(self):
         super().__init__()
         self.table = self._get_table('SystemConfig')
+        self._cache = _TTLCache()
     
     def set_config(self, config_key: str, config_value: Any, description: str = "") -> bool:
         """Set system configuration"""
@@ -285,6 +484,7 @@ class SystemConfigOperations(DynamoDBOperations):
             }
             
             self.table.put_item(Item=item)
+            self._cache.invalidate(config_key)
             logger.info(f"System config set: {config_key}")
             return True
             
@@ -292,15 +492,46 @@ class SystemConfigOperations(DynamoDBOperations):
             logger.error(f"Failed to set system config {config_key}: {e}")
             return False
     
+    def set_configs(self, configs: Dict[str, Any], description_template: str = "Default {key} configuration") -> bool:
+        """Set multiple system configurations in a single batched write"""
+        try:
+            timestamp = self._get_timestamp()
+
+            with self.table.batch_writer() as batch:
+                for config_key, config_value in configs.items():
+                    batch.put_item(Item={
+                        'configKey': config_key,
+                        'configValue': config_value,
+                        'description': description_template.format(key=config_key.replace('_', ' ')),
+                        'lastModified': timestamp
+                    })
+
+            for config_key in configs:
+                self._cache.invalidate(config_key)
+
+            logger.info(f"System configs set: {len(configs)} keys")
+            return True
+
+        except ClientError as e:
+            logger.error(f"Failed to set system configs: {e}")
+            return False
+
     def get_config(self, config_key: str) -> Optional[Any]:
         """Get system configuration"""
+        cached = self._cache.get(config_key)
+        if cached is not _CACHE_MISS:
+            logger.debug(f"System config cache hit: {config_key}")
+            return cached
+
         try:
             response = self.table.get_item(Key={'configKey': config_key})
             if 'Item' in response:
                 logger.info(f"System config retrieved: {config_key}")
+                self._cache.put(config_key, response['Item']['configValue'])
                 return response['Item']['configValue']
             else:
                 logger.info(f"No system config found: {config_key}")
+                self._cache.put(config_key, None)
                 return None
                 
         except ClientError as e:
@@ -312,8 +543,12 @@ class SystemConfigOperations(DynamoDBOperations):
         try:
             response = self.table.scan()
             configs = {}
-            
+
             for item in response['Items']:
+                # Underscore-prefixed keys are internal metadata
+                # (e.g. the schema fingerprint), not configuration
+                if item['configKey'].startswith('_'):
+                    continue
                 configs[item['configKey']] = item['configValue']
             
             logger.info(f"Retrieved {len(configs)} system configs")
@@ -327,6 +562,7 @@ class SystemConfigOperations(DynamoDBOperations):
         """Delete system configuration"""
         try:
             self.table.delete_item(Key={'configKey': config_key})
+            self._cache.invalidate(config_key)
             logger.info(f"System config deleted: {config_key}")
             return True
             
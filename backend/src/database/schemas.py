@@ -2,13 +2,27 @@
 # ABOUTME: Defines table structures for UserConfigs, BookingRequests, and SystemConfig
 
 import boto3
+import hashlib
+import json
 import logging
+import os
 from botocore.exceptions import ClientError
 from typing import Dict, Any, List
 from .connection import get_client, get_resource
 
 logger = logging.getLogger(__name__)
 
+
+def qualified_table_name(base_name: str) -> str:
+    """Append the per-process table suffix to a base table name
+
+    Parallel test workers set DYNAMODB_TABLE_SUFFIX (e.g. to their xdist
+    worker id) so each owns a disjoint table namespace; production runs
+    leave it unset and get the plain names.
+    """
+    return f"{base_name}{os.getenv('DYNAMODB_TABLE_SUFFIX', '')}"
+
+
 class TableSchemas:
     """Manages DynamoDB table schemas and creation"""
     
@@ -16,7 +30,7 @@ class TableSchemas:
     def get_user_configs_schema() -> Dict[str, Any]:
         """Schema for UserConfigs table"""
         return {
-            'TableName': 'UserConfigs',
+            'TableName': qualified_table_name('UserConfigs'),
             'KeySchema': [
                 {
                     'AttributeName': 'userId',
@@ -46,7 +60,7 @@ class TableSchemas:
     def get_booking_requests_schema() -> Dict[str, Any]:
         """Schema for BookingRequests table"""
         return {
-            'TableName': 'BookingRequests',
+            'TableName': qualified_table_name('BookingRequests'),
             'KeySchema': [
                 {
                     'AttributeName': 'requestId',
@@ -107,6 +121,22 @@ class TableSchemas:
                     'Projection': {
                         'ProjectionType': 'ALL'
                     }
+                },
+                {
+                    'IndexName': 'status-userId-index',
+                    'KeySchema': [
+                        {
+                            'AttributeName': 'status',
+                            'KeyType': 'HASH'
+                        },
+                        {
+                            'AttributeName': 'userId',
+                            'KeyType': 'RANGE'
+                        }
+                    ],
+                    'Projection': {
+                        'ProjectionType': 'ALL'
+                    }
                 }
             ],
             'BillingMode': 'PAY_PER_REQUEST',
@@ -126,7 +156,7 @@ class TableSchemas:
     def get_system_config_schema() -> Dict[str, Any]:
         """Schema for SystemConfig table"""
         return {
-            'TableName': 'SystemConfig',
+            'TableName': qualified_table_name('SystemConfig'),
             'KeySchema': [
                 {
                     'AttributeName': 'configKey',
@@ -154,22 +184,79 @@ class TableSchemas:
 
 class TableManager:
     """Manages DynamoDB table operations"""
-    
+
+    # SystemConfig item holding the fingerprint of the schema the tables
+    # were created from; underscore prefix keeps it out of get_all_configs
+    FINGERPRINT_KEY = '_schema_fingerprint'
+
     def __init__(self):
         self.client = get_client()
         self.resource = get_resource()
         self.schemas = TableSchemas()
-    
-    def create_tables(self) -> bool:
-        """Create all required tables"""
-        tables = [
+
+    def _all_schemas(self) -> List[Dict[str, Any]]:
+        """All table schemas in creation order"""
+        return [
             self.schemas.get_user_configs_schema(),
             self.schemas.get_booking_requests_schema(),
             self.schemas.get_system_config_schema()
         ]
-        
+
+    def schema_fingerprint(self) -> str:
+        """Stable hash of every table schema definition"""
+        payload = json.dumps(self._all_schemas(), sort_keys=True).encode()
+        return hashlib.sha1(payload).hexdigest()
+
+    def _stored_fingerprint(self):
+        """Fingerprint recorded when the tables were last created, if any"""
+        try:
+            response = self.client.get_item(
+                TableName=qualified_table_name('SystemConfig'),
+                Key={'configKey': {'S': self.FINGERPRINT_KEY}}
+            )
+        except ClientError:
+            return None
+        item = response.get('Item')
+        return item['configValue']['S'] if item else None
+
+    def _store_fingerprint(self, fingerprint: str) -> None:
+        """Record the fingerprint of the freshly created schema"""
+        self.client.put_item(
+            TableName=qualified_table_name('SystemConfig'),
+            Item={
+                'configKey': {'S': self.FINGERPRINT_KEY},
+                'configValue': {'S': fingerprint}
+            }
+        )
+
+    def ensure_tables(self) -> bool:
+        """Create tables only if missing or built from an older schema
+
+        CreateTable/DeleteTable are the dominant fixed cost of a test
+        session, so when every table exists and the stored fingerprint
+        matches the current schema definitions the tables are reused
+        as-is; any mismatch triggers a full drop and recreate.
+        """
+        fingerprint = self.schema_fingerprint()
+
+        tables_exist = all(
+            self._table_exists(schema['TableName']) for schema in self._all_schemas()
+        )
+        if tables_exist and self._stored_fingerprint() == fingerprint:
+            logger.info("Tables match current schema fingerprint, reusing them")
+            return True
+
+        self.delete_all_tables()
+        if not self.create_tables():
+            return False
+
+        self._store_fingerprint(fingerprint)
+        return True
+
+    def create_tables(self) -> bool:
+        """Create all required tables"""
         success = True
-        for table_schema in tables:
+        for table_schema in self._all_schemas():
             if not self._create_table(table_schema):
                 success = False
         
@@ -212,7 +299,10 @@ class TableManager:
     
     def delete_all_tables(self) -> bool:
         """Delete all tables (for testing/cleanup)"""
-        table_names = ['UserConfigs', 'BookingRequests', 'SystemConfig']
+        table_names = [
+            qualified_table_name(name)
+            for name in ('UserConfigs', 'BookingRequests', 'SystemConfig')
+        ]
         success = True
         
         for table_name in table_names:
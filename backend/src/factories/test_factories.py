@@ -1,6 +1,7 @@
 # ABOUTME: Factory classes for generating test data with valid attributes
 # ABOUTME: Creates realistic test instances of UserConfig, BookingRequest, SystemConfig
 
+import functools
 import uuid
 import random
 from datetime import datetime, timedelta
@@ -10,6 +11,54 @@ from ..models.user_config import UserConfig
 from ..models.booking_request import BookingRequest, BookingStatus, BookingPriority
 from ..models.system_config import SystemConfig, ConfigCategory, ConfigValueType
 
+# Enum member tuples hoisted so random.choice does not rebuild a list per call
+_BOOKING_STATUSES = tuple(BookingStatus)
+_BOOKING_PRIORITIES = tuple(BookingPriority)
+_CONFIG_CATEGORIES = tuple(ConfigCategory)
+
+# Validated once per run and copied per call: model_copy skips re-running
+# the Pydantic validators, which dominate the cost of building test data.
+# Every field the factories randomize is overwritten on each copy, so the
+# template values themselves never leak into tests.
+
+
+@functools.lru_cache(maxsize=1)
+def _user_template() -> UserConfig:
+    """Cached, already-validated UserConfig template"""
+    return UserConfig(
+        user_id="template_user",
+        username="template_user",
+        password="TestPass123!",
+        email="template@test.com",
+        first_name="Test",
+        last_name="User"
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _booking_template() -> BookingRequest:
+    """Cached, already-validated BookingRequest template"""
+    return BookingRequest(
+        request_id="req_template",
+        user_id="template_user",
+        booking_date=(datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d'),
+        time_slot="De 08:00 AM a 09:00 AM",
+        court_id=1,
+        status=BookingStatus.PENDING
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _config_template() -> SystemConfig:
+    """Cached, already-validated SystemConfig template"""
+    return SystemConfig(
+        config_key="template_config",
+        config_value="template_value",
+        value_type=ConfigValueType.STRING,
+        category=ConfigCategory.SYSTEM,
+        description="Template configuration"
+    )
+
 
 class UserConfigFactory:
     """Factory for creating UserConfig test instances"""
@@ -62,8 +111,8 @@ class UserConfigFactory:
         
         # Apply overrides
         defaults.update(overrides)
-        
-        return UserConfig(**defaults)
+
+        return _user_template().model_copy(update=defaults)
     
     @classmethod
     def create_minimal(cls, **overrides) -> UserConfig:
@@ -78,8 +127,8 @@ class UserConfigFactory:
         }
         
         defaults.update(overrides)
-        return UserConfig(**defaults)
-    
+        return _user_template().model_copy(update=defaults)
+
     @classmethod
     def create_admin(cls, **overrides) -> UserConfig:
         """Create an admin UserConfig"""
@@ -152,8 +201,8 @@ class BookingRequestFactory:
             "booking_date": booking_date,
             "time_slot": random.choice(cls.TIME_SLOTS),
             "court_id": random.choice(cls.COURTS),
-            "status": random.choice(list(BookingStatus)),
-            "priority": random.choice(list(BookingPriority)),
+            "status": random.choice(_BOOKING_STATUSES),
+            "priority": random.choice(_BOOKING_PRIORITIES),
             "auto_retry": random.choice([True, False]),
             "max_retries": random.randint(1, 5),
             "retry_count": 0,
@@ -162,8 +211,8 @@ class BookingRequestFactory:
         
         # Apply overrides
         defaults.update(overrides)
-        
-        return BookingRequest(**defaults)
+
+        return _booking_template().model_copy(update=defaults)
     
     @classmethod
     def create_pending(cls, **overrides) -> BookingRequest:
@@ -251,7 +300,7 @@ class SystemConfigFactory:
             "config_key": config_key,
             "config_value": f"test_value_{random.randint(1, 999)}",
             "value_type": ConfigValueType.STRING,
-            "category": random.choice(list(ConfigCategory)),
+            "category": random.choice(_CONFIG_CATEGORIES),
             "description": f"Test configuration for {config_key}",
             "is_active": True,
             "is_required": random.choice([True, False]),
@@ -261,8 +310,8 @@ class SystemConfigFactory:
         
         # Apply overrides
         defaults.update(overrides)
-        
-        return SystemConfig(**defaults)
+
+        return _config_template().model_copy(update=defaults)
     
     @classmethod
     def create_string_config(cls, value: str = None, **overrides) -> SystemConfig:
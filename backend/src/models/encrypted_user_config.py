@@ -1,6 +1,7 @@
 # ABOUTME: Enhanced UserConfig model with encryption integration for sensitive data
 # ABOUTME: Extends base UserConfig with automatic encryption/decryption of sensitive fields
 
+from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import Field, validator
 import logging
@@ -10,31 +11,44 @@ from ..security import get_credential_storage, CredentialStorage
 
 logger = logging.getLogger(__name__)
 
+# Fields that are encrypted in storage. A module constant (rather than a
+# pydantic private attribute) so it is readable before the model's
+# __init__ has run, during pre-construction decryption
+_ENCRYPTED_FIELDS = frozenset({'username', 'password', 'email', 'phone_number'})
+
 
 class EncryptedUserConfig(UserConfig):
     """
-    Enhanced UserConfig with automatic encryption/decryption of sensitive fields
+    Enhanced UserConfig with automatic decryption of sensitive fields
     """
-    
-    # Track which fields are encrypted in storage
-    _encrypted_fields = {'username', 'password', 'email', 'phone_number'}
-    
+
+    # Account security state managed by the user service
+    role: str = Field(default="user", description="Application role for authorization")
+    auto_booking_enabled: bool = Field(default=False, description="Whether automatic booking is enabled")
+    failed_login_attempts: int = Field(default=0, ge=0, description="Consecutive failed login attempts")
+    account_locked_until: Optional[datetime] = Field(None, description="Lockout expiry after repeated failed logins")
+
+    @property
+    def _credential_storage(self) -> CredentialStorage:
+        """Process-wide credential storage service
+
+        Exposed as a property instead of instance state: assigning it in
+        __init__ before super().__init__ breaks under pydantic v2 (the
+        private-attribute store does not exist yet).
+        """
+        return get_credential_storage()
+
     def __init__(self, **data):
         """Initialize with automatic decryption if needed"""
-        # Get credential storage service
-        self._credential_storage = get_credential_storage()
-        
         # Decrypt sensitive fields if they appear to be encrypted
-        decrypted_data = self._decrypt_if_needed(data)
-        
-        super().__init__(**decrypted_data)
-    
+        super().__init__(**self._decrypt_if_needed(data))
+
     def _decrypt_if_needed(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Decrypt fields if they appear to be encrypted"""
         decrypted_data = data.copy()
         
         for field_name, value in data.items():
-            if (field_name in self._encrypted_fields and 
+            if (field_name in _ENCRYPTED_FIELDS and 
                 value and 
                 isinstance(value, str) and 
                 self._appears_encrypted(value)):
@@ -79,7 +93,7 @@ class EncryptedUserConfig(UserConfig):
             user_id or self.user_id
         )
         
-        logger.debug(f"Encrypted {len(self._encrypted_fields)} sensitive fields for storage")
+        logger.debug(f"Encrypted {len(_ENCRYPTED_FIELDS)} sensitive fields for storage")
         return encrypted_data
     
     @classmethod
@@ -168,7 +182,7 @@ class EncryptedUserConfig(UserConfig):
         """
         validation_summary = {}
         
-        for field_name in self._encrypted_fields:
+        for field_name in _ENCRYPTED_FIELDS:
             value = getattr(self, field_name, None)
             if value:
                 validation = self._credential_storage.validate_credential_strength(field_name, value)
@@ -229,7 +243,7 @@ class EncryptedUserConfig(UserConfig):
         data = self.dict()
         
         # Mask sensitive fields
-        for field_name in self._encrypted_fields:
+        for field_name in _ENCRYPTED_FIELDS:
             if field_name in data and data[field_name]:
                 if field_name == 'email':
                     # Mask email partially
@@ -295,7 +309,7 @@ class EncryptedUserConfig(UserConfig):
         """
         results = {}
         
-        for field_name in self._encrypted_fields:
+        for field_name in _ENCRYPTED_FIELDS:
             value = getattr(self, field_name, None)
             if value:
                 validation = self._credential_storage.validate_credential_strength(field_name, value)
@@ -313,7 +327,7 @@ class EncryptedUserConfig(UserConfig):
             Dictionary showing which fields are encrypted
         """
         return {
-            field_name: field_name in self._encrypted_fields
+            field_name: field_name in _ENCRYPTED_FIELDS
             for field_name in ['username', 'password', 'email', 'phone_number']
         }
     
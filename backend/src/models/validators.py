@@ -14,15 +14,18 @@ class ValidationError(Exception):
 
 class DateValidator:
     """Validates date formats and ranges"""
-    
+
+    # Compiled once at import; validators run on every model field, so
+    # per-call compilation (or re-cache lookups) would add up fast
+    _DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
     @staticmethod
     def validate_date_format(value: str) -> str:
         """Validate YYYY-MM-DD format"""
         if not isinstance(value, str):
             raise ValidationError("Date must be a string")
-        
-        pattern = r'^\d{4}-\d{2}-\d{2}$'
-        if not re.match(pattern, value):
+
+        if not DateValidator._DATE_RE.match(value):
             raise ValidationError("Date must be in YYYY-MM-DD format")
         
         try:
@@ -46,15 +49,16 @@ class DateValidator:
 
 class TimeValidator:
     """Validates time slot formats"""
-    
+
+    _SLOT_RE = re.compile(r'^De \d{2}:\d{2} (AM|PM) a \d{2}:\d{2} (AM|PM)$')
+
     @staticmethod
     def validate_time_slot(value: str) -> str:
         """Validate time slot format: 'De HH:MM AM/PM a HH:MM AM/PM'"""
         if not isinstance(value, str):
             raise ValidationError("Time slot must be a string")
-        
-        pattern = r'^De \d{2}:\d{2} (AM|PM) a \d{2}:\d{2} (AM|PM)$'
-        if not re.match(pattern, value):
+
+        if not TimeValidator._SLOT_RE.match(value):
             raise ValidationError("Time slot must be in format 'De HH:MM AM/PM a HH:MM AM/PM'")
         
         # Extract start and end times
@@ -113,7 +117,12 @@ class CourtValidator:
 
 class CredentialValidator:
     """Validates usernames and passwords"""
-    
+
+    _USERNAME_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+    _UPPERCASE_RE = re.compile(r'[A-Z]')
+    _LOWERCASE_RE = re.compile(r'[a-z]')
+    _DIGIT_RE = re.compile(r'\d')
+
     @staticmethod
     def validate_username(value: str) -> str:
         """Validate username format and length"""
@@ -127,8 +136,7 @@ class CredentialValidator:
             raise ValidationError("Username cannot be longer than 50 characters")
         
         # Allow alphanumeric and common special characters
-        pattern = r'^[a-zA-Z0-9._-]+$'
-        if not re.match(pattern, value):
+        if not CredentialValidator._USERNAME_RE.match(value):
             raise ValidationError("Username can only contain letters, numbers, dots, underscores, and hyphens")
         
         return value
@@ -146,13 +154,13 @@ class CredentialValidator:
             raise ValidationError("Password cannot be longer than 128 characters")
         
         # Check for at least one uppercase, lowercase, and digit
-        if not re.search(r'[A-Z]', value):
+        if not CredentialValidator._UPPERCASE_RE.search(value):
             raise ValidationError("Password must contain at least one uppercase letter")
-        
-        if not re.search(r'[a-z]', value):
+
+        if not CredentialValidator._LOWERCASE_RE.search(value):
             raise ValidationError("Password must contain at least one lowercase letter")
-        
-        if not re.search(r'\d', value):
+
+        if not CredentialValidator._DIGIT_RE.search(value):
             raise ValidationError("Password must contain at least one digit")
         
         return value
@@ -160,15 +168,16 @@ class CredentialValidator:
 
 class EmailValidator:
     """Validates email addresses"""
-    
+
+    _EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
     @staticmethod
     def validate_email(value: str) -> str:
         """Validate email format"""
         if not isinstance(value, str):
             raise ValidationError("Email must be a string")
-        
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, value):
+
+        if not EmailValidator._EMAIL_RE.match(value):
             raise ValidationError("Invalid email format")
         
         if len(value) > 254:
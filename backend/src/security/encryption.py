@@ -5,6 +5,8 @@ import os
 import base64
 import json
 import logging
+import threading
+import time
 from typing import Optional, Dict, Any, Union
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -25,6 +27,14 @@ class KeyManagementError(Exception):
     pass
 
 
+# How long one generated data key is reused across encrypt calls; fields
+# written together within the window share a single envelope key
+_DATA_KEY_REUSE_SECONDS = 60
+
+# Cap on cached plaintext data keys before the cache is dropped wholesale
+_DATA_KEY_CACHE_MAX = 256
+
+
 class EncryptionService:
     """
     Encryption service using AWS KMS with envelope encryption for performance.
@@ -42,6 +52,13 @@ class EncryptionService:
         self.kms_client = None
         self.master_key_id = None
         self._local_key = None
+        # Plaintext data keys by their KMS-encrypted blob: decrypting a
+        # record whose fields share one envelope key costs one KMS call
+        self._data_key_cache: Dict[bytes, bytes] = {}
+        # Most recently generated data key, reused across encrypt calls
+        # as (plaintext, ciphertext, created_at)
+        self._active_data_key: Optional[tuple] = None
+        self._data_key_lock = threading.Lock()
         self._initialize_encryption()
     
     def _initialize_encryption(self):
@@ -120,14 +137,45 @@ class EncryptionService:
             logger.error(f"Failed to generate data key: {e}")
             raise EncryptionError(f"Data key generation failed: {e}")
     
+    def _get_data_key(self) -> tuple:
+        """Return a (plaintext, ciphertext) data key, reusing a recent one
+
+        Each encrypt call used to generate its own data key, so a record
+        with N encrypted fields needed N KMS decrypts to read back.
+        Reusing one key for a short window means fields written together
+        share one envelope key, which the decrypt-side cache then resolves
+        with a single KMS round-trip.
+        """
+        now = time.monotonic()
+        with self._data_key_lock:
+            if self._active_data_key and now - self._active_data_key[2] < _DATA_KEY_REUSE_SECONDS:
+                return self._active_data_key[0], self._active_data_key[1]
+
+            plaintext, ciphertext = self._generate_data_key()
+            self._active_data_key = (plaintext, ciphertext, now)
+            self._data_key_cache[bytes(ciphertext)] = plaintext
+            return plaintext, ciphertext
+
     def _decrypt_data_key(self, encrypted_key: bytes) -> bytes:
-        """Decrypt data key using KMS"""
+        """Decrypt data key using KMS, serving repeats from the local cache"""
+        cache_key = bytes(encrypted_key)
+        with self._data_key_lock:
+            cached = self._data_key_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             response = self.kms_client.decrypt(CiphertextBlob=encrypted_key)
-            return response['Plaintext']
+            plaintext = response['Plaintext']
         except ClientError as e:
             logger.error(f"Failed to decrypt data key: {e}")
             raise EncryptionError(f"Data key decryption failed: {e}")
+
+        with self._data_key_lock:
+            if len(self._data_key_cache) >= _DATA_KEY_CACHE_MAX:
+                self._data_key_cache.clear()
+            self._data_key_cache[cache_key] = plaintext
+        return plaintext
     
     def encrypt(self, plaintext: str, context: Optional[Dict[str, str]] = None) -> str:
         """
@@ -195,8 +243,8 @@ class EncryptionService:
     def _encrypt_with_kms(self, plaintext: str, context: Optional[Dict[str, str]] = None) -> str:
         """Encrypt using KMS envelope encryption"""
         try:
-            # Generate data key
-            data_key, encrypted_data_key = self._generate_data_key()
+            # Get a data key (reused across fields written together)
+            data_key, encrypted_data_key = self._get_data_key()
             
             # Create Fernet cipher with data key
             fernet = Fernet(base64.urlsafe_b64encode(data_key[:32]))
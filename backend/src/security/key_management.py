@@ -4,14 +4,63 @@
 import os
 import json
 import logging
+import bisect
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Parsed metadata files keyed by path: (mtime_ns, keys, backups). Stores
+# and serves deep copies only: handing out the cached models themselves
+# would let one KeyManager's in-place mutations (e.g. rotate_master_key
+# deactivating a key) leak into every other instance — and, with flushes
+# debounced, leave the cache claiming file-backed state the file no
+# longer matches
+_METADATA_CACHE: Dict[str, tuple] = {}
+
+
+def _copy_models(models: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-copy a dict of pydantic models (cache snapshot in/out)"""
+    return {key: model.model_copy(deep=True) for key, model in models.items()}
+
+
+@functools.lru_cache(maxsize=8)
+def _metadata_path(environment: str) -> str:
+    """Resolve the metadata file path for an environment (cached per environment)"""
+    base_dir = os.path.join(os.path.dirname(__file__), '..', '..', '.keys')
+    return os.path.join(base_dir, f'{environment}_key_metadata.json')
+
+
+@functools.lru_cache(maxsize=16)
+def _metadata_dir(metadata_file: str) -> str:
+    """Resolve the directory containing a metadata file (cached per path)"""
+    return os.path.dirname(metadata_file)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_schedule(schedule: str) -> Optional[timedelta]:
+    """Parse a rotation schedule like '30d', '12h' or '2w' (cached)"""
+    try:
+        if schedule.endswith('d'):
+            return timedelta(days=int(schedule[:-1]))
+        if schedule.endswith('h'):
+            return timedelta(hours=int(schedule[:-1]))
+        if schedule.endswith('w'):
+            return timedelta(weeks=int(schedule[:-1]))
+    except ValueError:
+        pass
+    return None
+
 
 class Environment(str, Enum):
     """Supported environments"""
@@ -43,78 +92,194 @@ class KeyMetadata(BaseModel):
     is_active: bool = Field(default=True, description="Whether key is active")
     rotation_schedule: Optional[str] = Field(None, description="Rotation schedule (e.g., '30d')")
     description: Optional[str] = Field(None, description="Key description")
-    
+
+    # Cached (source string, parsed datetime) for the last rotation timestamp
+    _last_rotation_parse: Optional[tuple] = PrivateAttr(default=None)
+
     class Config:
         use_enum_values = True
 
+    def last_rotation_datetime(self) -> datetime:
+        """Parse the last rotation (or creation) timestamp, caching the result"""
+        source = self.last_rotated or self.created_at
+        cached = self._last_rotation_parse
+        if cached is None or cached[0] != source:
+            parsed = datetime.fromisoformat(source.replace('Z', '+00:00'))
+            self._last_rotation_parse = (source, parsed)
+            return parsed
+        return cached[1]
+
+
+class BackupRef(BaseModel):
+    """Lightweight reference to a backed-up key; full fields resolve via the original"""
+
+    key_id: str = Field(..., description="Backup key identifier")
+    backup_of: str = Field(..., description="Key this backup refers to")
+    created_at: str = Field(..., description="Backup creation timestamp")
+    is_active: bool = Field(default=False, description="Backups are never active")
+
 
 class KeyManager:
     """
     Environment-specific key management service
     """
     
-    def __init__(self, environment: Environment = Environment.DEVELOPMENT):
+    def __init__(self, environment: Environment = Environment.DEVELOPMENT, max_workers: int = 16):
         """
         Initialize key manager
-        
+
         Args:
             environment: Target environment
+            max_workers: Thread pool size for per-key KMS operations
         """
         self.environment = environment
-        self.kms_client = None
+        self.max_workers = max_workers
+        self._kms_client = None
         self.key_metadata_cache = {}
+        self._backups: Dict[str, BackupRef] = {}
+        self._by_type: Dict[KeyType, List[KeyMetadata]] = {}
+        self._current_master: Optional[KeyMetadata] = None
+        self._active_count = 0
+        self._dirty = False
+        self._batch_depth = 0
         self._initialize_key_manager()
     
     def _initialize_key_manager(self):
         """Initialize key manager based on environment"""
         try:
-            if self.environment != Environment.DEVELOPMENT:
-                self.kms_client = boto3.client('kms')
-            
-            # Load existing key metadata
+            # Load existing key metadata (the KMS client is built lazily)
             self._load_key_metadata()
-            
+
             logger.info(f"Key manager initialized for environment: {self.environment}")
         except Exception as e:
             logger.error(f"Failed to initialize key manager: {e}")
             raise KeyManagementError(f"Key manager initialization failed: {e}")
+
+    @property
+    def kms_client(self):
+        """Lazily constructed boto3 KMS client (None in development)"""
+        if self.environment == Environment.DEVELOPMENT:
+            return None
+        if self._kms_client is None:
+            # Match the connection pool to the thread pool so parallel
+            # per-key calls don't queue on botocore's default pool of 10
+            self._kms_client = boto3.client(
+                'kms', config=Config(max_pool_connections=self.max_workers)
+            )
+        return self._kms_client
     
     def _load_key_metadata(self):
         """Load key metadata from storage"""
         try:
             metadata_file = self._get_metadata_file_path()
             if os.path.exists(metadata_file):
-                with open(metadata_file, 'r') as f:
-                    data = json.load(f)
-                    self.key_metadata_cache = {
-                        key_id: KeyMetadata(**metadata)
-                        for key_id, metadata in data.items()
-                    }
+                stat = os.stat(metadata_file)
+                cached = _METADATA_CACHE.get(metadata_file)
+                if cached is not None and cached[0] == stat.st_mtime_ns:
+                    # File unchanged since last parse — hand out deep copies
+                    # so instances never share (and mutate) the cached models
+                    self.key_metadata_cache = _copy_models(cached[1])
+                    self._backups = _copy_models(cached[2])
+                else:
+                    with open(metadata_file, 'r') as f:
+                        data = json.load(f)
+                        self.key_metadata_cache = {}
+                        self._backups = {}
+                        # The metadata file is written by us, so skip re-validation
+                        # and build models through the fast model_construct path
+                        for key_id, metadata in data.items():
+                            if 'backup_of' in metadata:
+                                self._backups[key_id] = BackupRef.model_construct(**metadata)
+                            else:
+                                self.key_metadata_cache[key_id] = KeyMetadata.model_construct(**metadata)
+                    _METADATA_CACHE[metadata_file] = (
+                        stat.st_mtime_ns, _copy_models(self.key_metadata_cache), _copy_models(self._backups)
+                    )
+            self._rebuild_type_index()
         except Exception as e:
             logger.warning(f"Failed to load key metadata: {e}")
             self.key_metadata_cache = {}
+            self._backups = {}
+            self._by_type = {}
     
     def _save_key_metadata(self):
         """Save key metadata to storage"""
         try:
             metadata_file = self._get_metadata_file_path()
-            os.makedirs(os.path.dirname(metadata_file), exist_ok=True)
+            os.makedirs(_metadata_dir(metadata_file), exist_ok=True)
             
             data = {
-                key_id: metadata.dict()
+                key_id: metadata.model_dump(mode='json')
                 for key_id, metadata in self.key_metadata_cache.items()
             }
+            data.update({
+                backup_id: ref.model_dump(mode='json')
+                for backup_id, ref in self._backups.items()
+            })
             
-            with open(metadata_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write to a temp file and rename so a crash mid-write
+            # never leaves a truncated metadata file behind
+            tmp_file = metadata_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, metadata_file)
         except Exception as e:
             logger.error(f"Failed to save key metadata: {e}")
             raise KeyManagementError(f"Key metadata save failed: {e}")
     
+    def _mark_dirty(self):
+        """Mark metadata as modified and flush unless inside a batch"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self):
+        """Write pending metadata changes to storage"""
+        if self._dirty:
+            self._save_key_metadata()
+            self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer metadata writes until the end of the block
+
+        Allows bulk operations (e.g., key rotation) to persist once
+        instead of once per mutation.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
     def _get_metadata_file_path(self) -> str:
         """Get path to key metadata file"""
-        base_dir = os.path.join(os.path.dirname(__file__), '..', '..', '.keys')
-        return os.path.join(base_dir, f'{self.environment.value}_key_metadata.json')
+        return _metadata_path(self.environment.value)
+
+    def _rebuild_type_index(self):
+        """Rebuild the per-type index and active counter from the metadata cache"""
+        self._by_type = {}
+        self._current_master = None
+        self._active_count = 0
+        for metadata in self.key_metadata_cache.values():
+            self._by_type.setdefault(metadata.key_type, []).append(metadata)
+            if metadata.is_active:
+                self._active_count += 1
+        for keys in self._by_type.values():
+            keys.sort(key=lambda x: x.created_at)
+
+    def _index_key(self, metadata: KeyMetadata):
+        """Insert a key into the per-type index, keeping creation order"""
+        keys = self._by_type.setdefault(metadata.key_type, [])
+        bisect.insort(keys, metadata, key=lambda x: x.created_at)
+        if metadata.is_active:
+            self._active_count += 1
+        if metadata.key_type == KeyType.MASTER:
+            # A newer master may supersede the cached one
+            self._current_master = None
     
     def create_master_key(self, description: str = None) -> KeyMetadata:
         """
@@ -151,8 +316,9 @@ class KeyManager:
         )
         
         self.key_metadata_cache[key_id] = metadata
-        self._save_key_metadata()
-        
+        self._index_key(metadata)
+        self._mark_dirty()
+
         logger.info(f"Created development key: {key_id}")
         return metadata
     
@@ -197,8 +363,9 @@ class KeyManager:
             )
             
             self.key_metadata_cache[key_id] = metadata
-            self._save_key_metadata()
-            
+            self._index_key(metadata)
+            self._mark_dirty()
+
             logger.info(f"Created KMS key: {key_id} with alias: {alias_name}")
             return metadata
             
@@ -240,9 +407,13 @@ class KeyManager:
             
             if active_only and not metadata.is_active:
                 continue
-            
+
             keys.append(metadata)
-        
+
+        # Backups are stored as lightweight references alongside the primary cache
+        if key_type in (None, KeyType.BACKUP) and not active_only:
+            keys.extend(self._backups.values())
+
         return sorted(keys, key=lambda x: x.created_at, reverse=True)
     
     def get_current_master_key(self) -> Optional[KeyMetadata]:
@@ -252,8 +423,16 @@ class KeyManager:
         Returns:
             KeyMetadata for current master key or None if not found
         """
-        master_keys = self.list_keys(KeyType.MASTER, active_only=True)
-        return master_keys[0] if master_keys else None
+        cached = self._current_master
+        if cached is not None and cached.is_active:
+            return cached
+
+        master_keys = self._by_type.get(KeyType.MASTER, [])
+        for metadata in reversed(master_keys):
+            if metadata.is_active and metadata.environment == self.environment:
+                self._current_master = metadata
+                return metadata
+        return None
     
     def rotate_key(self, key_id: str, create_backup: bool = True) -> KeyMetadata:
         """
@@ -270,22 +449,24 @@ class KeyManager:
             old_metadata = self.get_key_metadata(key_id)
             if not old_metadata:
                 raise KeyManagementError(f"Key not found: {key_id}")
-            
-            # Create backup if requested
-            if create_backup:
-                self._create_backup_key(old_metadata)
-            
-            # Deactivate old key
-            old_metadata.is_active = False
-            old_metadata.last_rotated = self._get_timestamp()
-            
-            # Create new key
-            new_metadata = self.create_master_key(
-                description=f"Rotated {old_metadata.description}"
-            )
-            
-            self._save_key_metadata()
-            
+
+            with self.batch():
+                # Create backup if requested
+                if create_backup:
+                    self._create_backup_key(old_metadata)
+
+                # Deactivate old key
+                if old_metadata.is_active:
+                    self._active_count -= 1
+                old_metadata.is_active = False
+                old_metadata.last_rotated = self._get_timestamp()
+                self._mark_dirty()
+
+                # Create new key
+                new_metadata = self.create_master_key(
+                    description=f"Rotated {old_metadata.description}"
+                )
+
             logger.info(f"Key rotated: {key_id} -> {new_metadata.key_id}")
             return new_metadata
             
@@ -293,19 +474,17 @@ class KeyManager:
             logger.error(f"Failed to rotate key {key_id}: {e}")
             raise KeyManagementError(f"Key rotation failed: {e}")
     
-    def _create_backup_key(self, original_metadata: KeyMetadata) -> KeyMetadata:
-        """Create a backup of an existing key"""
-        backup_metadata = KeyMetadata(
+    def _create_backup_key(self, original_metadata: KeyMetadata) -> BackupRef:
+        """Create a backup reference to an existing key"""
+        backup_ref = BackupRef(
             key_id=f"backup-{original_metadata.key_id}",
-            key_type=KeyType.BACKUP,
-            environment=self.environment,
-            created_at=self._get_timestamp(),
-            description=f"Backup of {original_metadata.key_id}",
-            is_active=False
+            backup_of=original_metadata.key_id,
+            created_at=self._get_timestamp()
         )
-        
-        self.key_metadata_cache[backup_metadata.key_id] = backup_metadata
-        return backup_metadata
+
+        self._backups[backup_ref.key_id] = backup_ref
+        self._mark_dirty()
+        return backup_ref
     
     def schedule_key_rotation(self, key_id: str, schedule: str):
         """
@@ -320,7 +499,7 @@ class KeyManager:
             raise KeyManagementError(f"Key not found: {key_id}")
         
         metadata.rotation_schedule = schedule
-        self._save_key_metadata()
+        self._mark_dirty()
         
         logger.info(f"Scheduled rotation for key {key_id}: {schedule}")
     
@@ -331,38 +510,38 @@ class KeyManager:
         Returns:
             List of keys that need rotation
         """
-        due_keys = []
-        
-        for metadata in self.key_metadata_cache.values():
-            if not metadata.is_active or not metadata.rotation_schedule:
-                continue
-            
-            if self._is_rotation_due(metadata):
-                due_keys.append(metadata)
-        
-        return due_keys
-    
-    def _is_rotation_due(self, metadata: KeyMetadata) -> bool:
+        now = datetime.utcnow()
+        candidates = [
+            metadata for metadata in self.key_metadata_cache.values()
+            if metadata.is_active and metadata.rotation_schedule
+        ]
+
+        if self.environment == Environment.DEVELOPMENT or len(candidates) <= 1:
+            return [m for m in candidates if self._is_rotation_due(m, now)]
+
+        # KMS-backed environments may hit the network per key, so fan out
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(lambda m: self._is_rotation_due(m, now), candidates)
+            return [m for m, due in zip(candidates, results) if due]
+
+    def _is_rotation_due(self, metadata: KeyMetadata, now: datetime = None) -> bool:
         """Check if a key is due for rotation"""
         if not metadata.rotation_schedule:
             return False
-        
-        from datetime import datetime, timedelta
-        
+
+        if now is None:
+            now = datetime.utcnow()
+
         # Parse rotation schedule (e.g., '30d' for 30 days)
-        schedule = metadata.rotation_schedule
-        if schedule.endswith('d'):
-            days = int(schedule[:-1])
-            rotation_interval = timedelta(days=days)
-        else:
-            logger.warning(f"Unsupported rotation schedule format: {schedule}")
+        rotation_interval = _parse_schedule(metadata.rotation_schedule)
+        if rotation_interval is None:
+            logger.warning(f"Unsupported rotation schedule format: {metadata.rotation_schedule}")
             return False
         
         # Check if rotation is due
-        last_rotation = metadata.last_rotated or metadata.created_at
-        last_rotation_dt = datetime.fromisoformat(last_rotation.replace('Z', '+00:00'))
-        
-        return datetime.utcnow() - last_rotation_dt.replace(tzinfo=None) > rotation_interval
+        last_rotation_dt = metadata.last_rotation_datetime()
+
+        return now - last_rotation_dt.replace(tzinfo=None) > rotation_interval
     
     def get_environment_config(self) -> Dict[str, Any]:
         """
@@ -374,10 +553,10 @@ class KeyManager:
         config = {
             'environment': self.environment.value,
             'key_count': len(self.key_metadata_cache),
-            'active_keys': len([k for k in self.key_metadata_cache.values() if k.is_active]),
+            'active_keys': self._active_count,
             'master_key': None,
             'encryption_available': True,
-            'kms_enabled': self.kms_client is not None
+            'kms_enabled': self.environment != Environment.DEVELOPMENT
         }
         
         # Get current master key
@@ -417,7 +596,7 @@ class KeyManager:
                 'environment': self.environment.value,
                 'master_key_id': master_key.key_id,
                 'total_keys': len(self.key_metadata_cache),
-                'active_keys': len([k for k in self.key_metadata_cache.values() if k.is_active]),
+                'active_keys': self._active_count,
                 'keys_due_for_rotation': len(due_keys),
                 'timestamp': self._get_timestamp()
             }
@@ -432,30 +611,36 @@ class KeyManager:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.utcnow().isoformat()
 
 
 # Global key manager instances
 _key_managers = {}
+_key_managers_lock = threading.Lock()
 
 
 def get_key_manager(environment: Environment = Environment.DEVELOPMENT) -> KeyManager:
     """
     Get key manager instance for environment
-    
+
     Args:
         environment: Target environment
-        
+
     Returns:
         KeyManager instance
     """
-    global _key_managers
-    
-    if environment not in _key_managers:
-        _key_managers[environment] = KeyManager(environment)
-    
-    return _key_managers[environment]
+    # Fast path: plain dict lookup without taking the lock
+    key_manager = _key_managers.get(environment)
+    if key_manager is not None:
+        return key_manager
+
+    with _key_managers_lock:
+        # Re-check under the lock so only one thread constructs the manager
+        key_manager = _key_managers.get(environment)
+        if key_manager is None:
+            key_manager = KeyManager(environment)
+            _key_managers[environment] = key_manager
+        return key_manager
 
 
 def initialize_encryption_keys(environment: Environment = Environment.DEVELOPMENT) -> KeyMetadata:
@@ -5,6 +5,7 @@ import os
 import logging
 from database.schemas import TableManager
 from database.operations import UserConfigOperations, BookingRequestOperations, SystemConfigOperations
+from time_slots import TIME_SLOTS
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,22 +27,7 @@ def setup_database():
     # Set default system configurations
     configs = {
         'available_courts': [1, 2],
-        'available_time_slots': [
-            'De 08:00 AM a 09:00 AM',
-            'De 09:00 AM a 10:00 AM',
-            'De 10:00 AM a 11:00 AM',
-            'De 11:00 AM a 12:00 PM',
-            'De 12:00 PM a 01:00 PM',
-            'De 01:00 PM a 02:00 PM',
-            'De 02:00 PM a 03:00 PM',
-            'De 03:00 PM a 04:00 PM',
-            'De 04:00 PM a 05:00 PM',
-            'De 05:00 PM a 06:00 PM',
-            'De 06:00 PM a 07:00 PM',
-            'De 07:00 PM a 08:00 PM',
-            'De 08:00 PM a 09:00 PM',
-            'De 09:00 PM a 10:00 PM'
-        ],
+        'available_time_slots': list(TIME_SLOTS),
         'booking_window_days': 7,
         'max_concurrent_requests': 10,
         'default_timeout_seconds': 30,
@@ -50,10 +36,9 @@ def setup_database():
         'retry_delay_seconds': 5
     }
     
-    for key, value in configs.items():
-        if not system_config.set_config(key, value, f"Default {key.replace('_', ' ')} configuration"):
-            logger.error(f"Failed to set system config: {key}")
-            return False
+    if not system_config.set_configs(configs):
+        logger.error("Failed to set system configs")
+        return False
     
     logger.info("Database setup completed successfully")
     return True
@@ -0,0 +1,16 @@
+# ABOUTME: Canonical table of the hourly booking slots the tennis site offers
+# ABOUTME: Single source shared by the booking script and database seeding
+
+
+def format_time_slot(hour: int) -> str:
+    """Format an hourly slot like 'De 08:00 AM a 09:00 AM' (24h input)"""
+    def twelve_hour(h):
+        return (h % 12 or 12, 'AM' if h < 12 else 'PM')
+
+    start, start_period = twelve_hour(hour)
+    end, end_period = twelve_hour(hour + 1)
+    return f'De {start:02d}:00 {start_period} a {end:02d}:00 {end_period}'
+
+
+# Hourly booking slots offered by the venue, 8 AM through 10 PM (immutable)
+TIME_SLOTS = tuple(format_time_slot(hour) for hour in range(8, 22))
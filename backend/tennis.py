@@ -5,11 +5,19 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+import urllib3
 import os
+import threading
+import asyncio
+import atexit
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 import json
 import time
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 import sys
 
@@ -30,7 +38,7 @@ except ImportError:
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG for more detailed logging
+    level=os.getenv("LOG_LEVEL", "INFO"),
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('tennis_automation.log'),
@@ -39,6 +47,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Court ID -> tennis site area value (Cancha de Tenis 1 / 2)
+_COURT_ID_TO_AREA = MappingProxyType({
+    1: 5,
+    2: 7
+})
+
+# Area values accepted for booking (tennis courts only)
+_VALID_AREAS = frozenset(_COURT_ID_TO_AREA.values())
+
+# Config keys masked before logging
+_SENSITIVE_KEYS = frozenset({'password', 'tennis_password'})
+
+# The site offers hourly slots from 08:00 AM to 10:00 PM; the canonical
+# table lives in src/time_slots.py (shared with the database seeding) and
+# the reverse index is built once at import so a booking's slot can be
+# checked in O(1) before a browser is ever launched
+from time_slots import TIME_SLOTS as _TIME_SLOTS
+_TIME_SLOT_INDEX = {slot: index for index, slot in enumerate(_TIME_SLOTS)}
+
 def load_config(user_id: Optional[str] = None, booking_request: Optional[BookingRequestModel] = None) -> Dict[str, Any]:
     """
     Load configuration from DynamoDB or environment variables (fallback)
@@ -56,9 +83,9 @@ def load_config(user_id: Optional[str] = None, booking_request: Optional[Booking
     if DYNAMODB_AVAILABLE and user_id:
         try:
             config = load_config_from_dynamodb(user_id, booking_request)
-            logger.info(f"Configuration loaded from DynamoDB for user {user_id}")
+            logger.info("Configuration loaded from DynamoDB for user %s", user_id)
         except Exception as e:
-            logger.warning(f"Failed to load config from DynamoDB: {e}")
+            logger.warning("Failed to load config from DynamoDB: %s", e)
             config = {}
     
     # Fallback to environment variables if DynamoDB failed or not available
@@ -70,26 +97,95 @@ def load_config(user_id: Optional[str] = None, booking_request: Optional[Booking
     validate_config(config)
     
     # Log config (hide sensitive fields)
-    safe_config = {k: v if k not in ['password', 'tennis_password'] else '***' for k, v in config.items()}
-    logger.debug(f"Final config: {json.dumps(safe_config, indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        safe_config = {k: v if k not in _SENSITIVE_KEYS else '***' for k, v in config.items()}
+        logger.debug("Final config: %s", json.dumps(safe_config, indent=2))
     
     return config
 
-def load_config_from_dynamodb(user_id: str, booking_request: Optional[BookingRequestModel] = None) -> Dict[str, Any]:
+# Shared DAO plus a short-TTL user cache so batches of bookings for the
+# same user skip the DynamoDB round-trip and password decrypt. Tests that
+# patch the DAO class must reset _USER_DAO and clear _user_cache in their
+# setup so stale entries never cross test boundaries.
+_USER_DAO = None
+_USER_DAO_LOCK = threading.Lock()
+_USER_CACHE_TTL_SECONDS = 60
+_user_cache: Dict[str, tuple] = {}
+
+# The only user attributes the booking flow reads; projecting the fetch
+# down to these (plus what the model requires) trims read capacity
+_USER_CONFIG_FIELDS = (
+    'username', 'password', 'website_url', 'venue', 'headless',
+    'preferred_courts', 'default_date', 'default_time'
+)
+
+
+def _get_user_dao():
+    """Return the shared EncryptedUserConfigDAO, creating it on first use
+
+    Constructing a DAO builds a boto3 client (botocore model load plus a
+    fresh TLS connection pool), so every booking reuses this one instance.
+    """
+    global _USER_DAO
+    if _USER_DAO is None:
+        with _USER_DAO_LOCK:
+            if _USER_DAO is None:
+                _USER_DAO = EncryptedUserConfigDAO()
+    return _USER_DAO
+
+
+def _get_user_cached(user_id: str):
+    """Fetch a user config, reusing a cached copy for up to 60 seconds"""
+    now = time.monotonic()
+    cached = _user_cache.get(user_id)
+    if cached and now - cached[0] < _USER_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    user_config = _get_user_dao().get_user(user_id, fields=list(_USER_CONFIG_FIELDS))
+    _user_cache[user_id] = (now, user_config)
+    return user_config
+
+
+def invalidate_user_config(user_id: str) -> None:
+    """
+    Drop a user's cached config so the next booking re-reads DynamoDB
+
+    Callers that update an EncryptedUserConfig elsewhere (API handlers,
+    admin tooling) should invoke this so in-flight bookings don't run with
+    a stale credential or preference for up to the cache TTL.
+    """
+    _user_cache.pop(user_id, None)
+
+
+def prefetch_user_configs(user_ids) -> Dict[str, Any]:
+    """
+    Fetch many user configs in one BatchGetItem round-trip and warm the cache
+
+    Args:
+        user_ids: Iterable of user IDs (duplicates and Nones are dropped)
+
+    Returns:
+        Mapping of user_id to user configuration
+    """
+    unique_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id]
+    if not unique_ids:
+        return {}
+
+    configs = _get_user_dao().get_users_batch(unique_ids)
+    now = time.monotonic()
+    for user_id, user_config in configs.items():
+        _user_cache[user_id] = (now, user_config)
+    return configs
+
+
+def load_config_from_dynamodb(user_id: str, booking_request: Optional[BookingRequestModel] = None,
+                              preloaded: Optional[Any] = None) -> Dict[str, Any]:
     """Load configuration from DynamoDB for a specific user"""
-    user_dao = EncryptedUserConfigDAO()
-    
-    # Get user configuration
-    user_config = user_dao.get_user(user_id)
+    # Get user configuration (preloaded by a batch prefetch, or cached)
+    user_config = preloaded if preloaded is not None else _get_user_cached(user_id)
     if not user_config:
         raise ValueError(f"User configuration not found for user_id: {user_id}")
     
-    # Map court ID to tennis site area value
-    court_id_mapping = {
-        1: 5,  # Court 1 -> Area value 5 (Cancha de Tenis 1)
-        2: 7   # Court 2 -> Area value 7 (Cancha de Tenis 2)
-    }
-    
     # Base configuration from user
     config = {
         'username': user_config.username,
@@ -104,53 +200,121 @@ def load_config_from_dynamodb(user_id: str, booking_request: Optional[BookingReq
     
     # If we have a specific booking request, use its details
     if booking_request:
-        # Map our court ID to tennis site area value
-        if booking_request.court_id in court_id_mapping:
-            config['area_value'] = court_id_mapping[booking_request.court_id]
-        else:
+        # Map our court ID to tennis site area value (one dict probe
+        # instead of a membership test followed by a second lookup)
+        area_value = _COURT_ID_TO_AREA.get(booking_request.court_id)
+        if area_value is None:
             raise ValueError(f"Invalid court_id: {booking_request.court_id}")
-        
+        config['area_value'] = area_value
+
         config['date'] = booking_request.booking_date
         config['time_slot'] = booking_request.time_slot
     else:
         # Use user preferences or defaults
         preferred_courts = getattr(user_config, 'preferred_courts', [1])
-        config['area_value'] = court_id_mapping.get(preferred_courts[0], 5)
+        config['area_value'] = _COURT_ID_TO_AREA.get(preferred_courts[0], 5)
         config['date'] = getattr(user_config, 'default_date', '2025-04-01')
         config['time_slot'] = getattr(user_config, 'default_time', 'De 08:00 AM a 09:00 AM')
     
     return config
 
+def _env_bool(value: str) -> bool:
+    """Parse an environment flag the way the script always has ('true' only)"""
+    return value.lower() == 'true'
+
+
+# Table of (config key, env var, default, cast) driving the env fallback;
+# adding a field means adding a row here rather than another getenv line
+_ENV_SPEC = (
+    ('username', 'TENNIS_USERNAME', None, None),
+    ('password', 'TENNIS_PASSWORD', None, None),
+    ('website_url', 'TENNIS_WEBSITE_URL', 'https://parquesdelsol.sasweb.net/', None),
+    ('venue', 'TENNIS_VENUE', 'Parques del Sol', None),
+    ('area_value', 'TENNIS_AREA_VALUE', '5', int),
+    ('date', 'TENNIS_DATE', '2025-04-01', None),
+    ('time_slot', 'TENNIS_TIME_SLOT', 'De 08:00 AM a 09:00 AM', None),
+    ('headless', 'TENNIS_HEADLESS', 'false', _env_bool),
+)
+
+
 def load_config_from_env() -> Dict[str, Any]:
     """Load configuration from environment variables (fallback method)"""
-    config = {
-        'username': os.getenv('TENNIS_USERNAME'),
-        'password': os.getenv('TENNIS_PASSWORD'),
-        'website_url': os.getenv('TENNIS_WEBSITE_URL', 'https://parquesdelsol.sasweb.net/'),
-        'venue': os.getenv('TENNIS_VENUE', 'Parques del Sol'),
-        'area_value': int(os.getenv('TENNIS_AREA_VALUE', '5')),
-        'date': os.getenv('TENNIS_DATE', '2025-04-01'),
-        'time_slot': os.getenv('TENNIS_TIME_SLOT', 'De 08:00 AM a 09:00 AM'),
-        'headless': os.getenv('TENNIS_HEADLESS', 'false').lower() == 'true'
-    }
-    
+    config = {}
+    for key, env_var, default, cast in _ENV_SPEC:
+        value = os.getenv(env_var, default)
+        config[key] = cast(value) if cast is not None and value is not None else value
+
     return config
 
+# Digests of configs that already passed validation. The checks are pure
+# functions of the dict contents, so a booking rerun with an identical
+# config can skip them; the set is cleared rather than evicted per-entry
+# once it grows past the cap.
+_VALIDATED_DIGESTS: set = set()
+_MAX_VALIDATED_DIGESTS = 1024
+
+
 def validate_config(config: Dict[str, Any]) -> None:
     """Validate configuration has all required fields"""
+    try:
+        digest = hash(tuple(sorted(config.items())))
+    except TypeError:
+        digest = None
+
+    if digest is not None and digest in _VALIDATED_DIGESTS:
+        return
+
     required_fields = ['username', 'password', 'website_url', 'area_value', 'date', 'time_slot']
-    
+
     missing_fields = [field for field in required_fields if not config.get(field)]
     if missing_fields:
         raise ValueError(f"Missing required configuration fields: {', '.join(missing_fields)}")
-    
+
     # Validate area_value is valid for tennis courts
-    valid_area_values = [5, 7]  # Tennis courts only
-    if config['area_value'] not in valid_area_values:
-        raise ValueError(f"Invalid area_value: {config['area_value']}. Valid values: {valid_area_values}")
-    
+    if config['area_value'] not in _VALID_AREAS:
+        raise ValueError(f"Invalid area_value: {config['area_value']}. Valid values: {sorted(_VALID_AREAS)}")
+
+    if digest is not None:
+        if len(_VALIDATED_DIGESTS) >= _MAX_VALIDATED_DIGESTS:
+            _VALIDATED_DIGESTS.clear()
+        _VALIDATED_DIGESTS.add(digest)
+
     logger.debug("Configuration validation successful")
 
+# Sized as max(pool_size * 4, 20) so concurrent bookings never serialize
+# on the WebDriver client's default single-connection urllib3 pool
+_WEBDRIVER_HTTP_POOL_SIZE = 20
+
+
+# Resource patterns irrelevant to the DOM interactions the script performs;
+# blocking them keeps navigations to the HTML + JS that matter
+_BLOCKED_RESOURCE_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff", "*.woff2", "*.css",
+    "*google-analytics*", "*googletagmanager*", "*facebook*"
+]
+
+
+def _wait(driver, timeout: int = 10) -> WebDriverWait:
+    """WebDriverWait polling every 100ms instead of the 500ms default"""
+    return WebDriverWait(driver, timeout, poll_frequency=0.1)
+
+# Resolved chromedriver path, cached so only the first launch pays the
+# webdriver_manager update check
+_DRIVER_PATH: Optional[str] = None
+_DRIVER_PATH_LOCK = threading.Lock()
+
+
+def _resolve_chromedriver_path() -> str:
+    """Resolve chromedriver via webdriver_manager, caching the result"""
+    global _DRIVER_PATH
+
+    with _DRIVER_PATH_LOCK:
+        if _DRIVER_PATH is None:
+            _DRIVER_PATH = ChromeDriverManager().install()
+        return _DRIVER_PATH
+
+
 def setup_driver(config: Dict[str, Any]) -> webdriver.Chrome:
     """Set up and configure the Chrome WebDriver"""
     options = webdriver.ChromeOptions()
@@ -160,130 +324,340 @@ def setup_driver(config: Dict[str, Any]) -> webdriver.Chrome:
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
-    
+    # Return from navigation at DOMContentLoaded instead of waiting for
+    # every late asset; explicit waits gate each step on what it needs
+    options.page_load_strategy = 'eager'
+
+    block_resources = config.get('block_resources', True)
+    if block_resources:
+        # Belt-and-suspenders alongside the CDP blocklist set after launch
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
     try:
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        env_path = os.getenv('CHROMEDRIVER_PATH')
+        if env_path:
+            # Pre-baked driver (Docker/Lambda images): no resolution at all
+            driver = webdriver.Chrome(service=Service(env_path), options=options)
+        else:
+            try:
+                # Selenium Manager (bundled since Selenium 4.11) resolves the
+                # driver locally without webdriver_manager's network checks
+                driver = webdriver.Chrome(options=options)
+            except WebDriverException:
+                logger.debug("Selenium Manager resolution failed, falling back to webdriver_manager")
+                driver = webdriver.Chrome(service=Service(_resolve_chromedriver_path()), options=options)
+        _widen_command_executor_pool(driver)
+        if block_resources:
+            _block_static_resources(driver)
         logger.debug("WebDriver initialized successfully")
         return driver
     except WebDriverException as e:
-        logger.error(f"Failed to initialize WebDriver: {e}")
+        logger.error("Failed to initialize WebDriver: %s", e)
         raise
 
-def make_reservation(user_id: Optional[str] = None, booking_request: Optional[BookingRequestModel] = None) -> bool:
+def _block_static_resources(driver) -> None:
+    """Block images/fonts/CSS/analytics via CDP so navigations stay lean"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_RESOURCE_URLS})
+    except Exception as e:
+        logger.debug("Could not enable CDP resource blocking: %s", e)
+
+
+def _widen_command_executor_pool(driver) -> None:
+    """
+    Rebuild the WebDriver client's urllib3 pool with a larger maxsize
+
+    The local command executor defaults to a single keep-alive connection,
+    which silently serializes commands (and drops connections) when
+    bookings run concurrently.
+    """
+    try:
+        executor = driver.command_executor
+        executor._conn = urllib3.PoolManager(
+            timeout=executor.get_timeout(),
+            maxsize=_WEBDRIVER_HTTP_POOL_SIZE
+        )
+    except Exception as e:
+        logger.debug("Could not resize WebDriver connection pool: %s", e)
+
+
+# Warm Chrome instances reused across bookings
+_DRIVER_POOL: queue.Queue = queue.Queue()
+
+# Screenshot disk writes run off the booking thread; the directory is
+# created once up front so the hot path never touches the filesystem
+_SCREENSHOT_POOL = ThreadPoolExecutor(max_workers=2)
+os.makedirs("screenshots", exist_ok=True)
+
+
+def _write_screenshot(png: bytes, path: str) -> None:
+    """Persist a captured screenshot (runs on the screenshot pool)"""
+    # Validate before open(): a non-bytes payload (e.g. a mocked driver in
+    # tests) would otherwise fail mid-write and leave an empty file behind
+    if not isinstance(png, (bytes, bytearray)):
+        logger.warning("Skipping screenshot %s: expected bytes, got %s",
+                       path, type(png).__name__)
+        return
+    try:
+        with open(path, 'wb') as f:
+            f.write(png)
+        logger.info("Screenshot saved as %s", path)
+    except Exception as e:
+        logger.warning("Failed to save screenshot %s: %s", path, e)
+
+
+def _quit_driver_quietly(driver) -> None:
+    """Quit a driver, ignoring errors from already-dead sessions"""
+    try:
+        driver.quit()
+        logger.info("WebDriver closed")
+    except WebDriverException:
+        pass
+
+
+def shutdown_drivers() -> None:
+    """Quit any warm drivers left in the pool
+
+    Registered atexit, and callable by long-running hosts (the booking
+    processor's stop()) that want to release Chrome before process exit.
+    """
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        _quit_driver_quietly(driver)
+
+
+atexit.register(shutdown_drivers)
+
+# Single worker so background warm-ups launch one Chrome at a time
+_DRIVER_PREFETCH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='driver-prefetch')
+
+
+def prefetch_driver(config: Dict[str, Any]):
+    """Launch a WebDriver in the background and park it in the warm pool
+
+    Chrome startup dominates reservation latency, so hosts that know more
+    bookings are coming can overlap the next launch with the current run.
+    Returns the Future so callers may wait on it; a failed warm-up is only
+    logged and the next acquire_driver falls back to a cold start.
+    """
+    def _warm():
+        # Checked at launch time, not submit time: bookings drain the pool
+        # while warm-ups queue, and an already-stocked pool needs no more
+        if not _DRIVER_POOL.empty():
+            return
+        try:
+            _DRIVER_POOL.put(setup_driver(config))
+            logger.debug("Prefetched warm WebDriver into pool")
+        except Exception as e:
+            logger.warning("Driver prefetch failed: %s", e)
+
+    return _DRIVER_PREFETCH_POOL.submit(_warm)
+
+
+@contextmanager
+def acquire_driver(config: Dict[str, Any]):
+    """
+    Check out a warm WebDriver, creating one only when no idle driver exists
+
+    On success the driver is wiped (cookies, local/session storage) and
+    returned to the pool; on any error it is quit so a broken session is
+    never reused.
+    """
+    try:
+        driver = _DRIVER_POOL.get_nowait()
+        logger.debug("Reusing warm WebDriver from pool")
+    except queue.Empty:
+        driver = setup_driver(config)
+
+    try:
+        yield driver
+    except Exception:
+        _quit_driver_quietly(driver)
+        raise
+    else:
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            _DRIVER_POOL.put(driver)
+        except WebDriverException:
+            _quit_driver_quietly(driver)
+
+
+# Selenium locators for the booking flow, built once at import instead
+# of allocating a fresh (By, value) tuple on every call
+_LOCATOR_LOGIN_USERNAME = (By.ID, "number")
+_LOCATOR_RESERVATIONS_LINK = (By.LINK_TEXT, "Reservations")
+_LOCATOR_RESERVATION_FORM = (By.ID, "reservation-form")
+_LOCATOR_CONFIRM_BUTTON = (By.ID, "confirm")
+_LOCATOR_SUCCESS_MESSAGE = (By.CLASS_NAME, "success-message")
+
+
+def make_reservation(user_id: Optional[str] = None, booking_request: Optional[BookingRequestModel] = None,
+                     *, preloaded_config: Optional[Dict[str, Any]] = None) -> bool:
     """
     Main function to handle the reservation process
-    
+
     Args:
         user_id: User ID to load configuration for
         booking_request: Specific booking request to process
-        
+        preloaded_config: Already-resolved configuration dict; when given,
+            the load_config lookup (and its DynamoDB read) is skipped
+
     Returns:
         True if reservation was successful, False otherwise
     """
-    config = load_config(user_id, booking_request)
-    driver = None
-    
     try:
-        logger.info(f"Starting reservation process for user_id: {user_id}")
+        config = preloaded_config if preloaded_config is not None else load_config(user_id, booking_request)
+
+        # Reject unknown slots before paying for a browser; the form fill
+        # would only fail much later inside the page
+        if config['time_slot'] not in _TIME_SLOT_INDEX:
+            raise ValueError(f"Unknown time_slot: {config['time_slot']}")
+
+        logger.info("Starting reservation process for user_id: %s", user_id)
         if booking_request:
-            logger.info(f"Processing booking request: {booking_request.request_id}")
-        
-        driver = setup_driver(config)
-        driver.get(config['website_url'])
-        logger.debug(f"Navigated to {config['website_url']}")
-        time.sleep(2)
-        
-        # Log in
-        logger.info("Attempting to log in")
-        username = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "number"))
-        )
-        logger.debug("Found username field")
-        password = driver.find_element(By.ID, "pass")
-        logger.debug("Found password field")
-        
-        username.send_keys(config['username'])
-        time.sleep(1)
-        password.send_keys(config['password'])
-        time.sleep(1)
-        
-        login_button = driver.find_element(By.CLASS_NAME, "btn1")
-        logger.debug("Found login button")
-        login_button.click()
-        time.sleep(2)
-        logger.info("Login successful")
-        
-        # Navigate to Reservations
-        logger.info("Navigating to Reservations page")
-        reservations_link = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.LINK_TEXT, "Reservations"))
-        )
-        logger.debug("Found Reservations link")
-        reservations_link.click()
-        time.sleep(2)
-        
-        # Fill reservation form
-        logger.info("Filling reservation form")
-        form = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "reservation-form"))
-        )
-        logger.debug("Found reservation form")
-        
-        # Find and fill form fields
-        venue_field = driver.find_element(By.ID, "venue")
-        date_field = driver.find_element(By.ID, "date")
-        time_field = driver.find_element(By.ID, "time")
-        
-        # Select area (court) - this is the key mapping
-        area_dropdown = driver.find_element(By.ID, "area")
-        area_dropdown.send_keys(str(config['area_value']))  # Use mapped area value
-        time.sleep(1)
-        
-        logger.debug("Found and filled form fields")
-        
-        venue_field.send_keys(config['venue'])
-        time.sleep(1)
-        date_field.send_keys(config['date'])
-        time.sleep(1)
-        time_field.send_keys(config['time_slot'])
-        time.sleep(1)
-        
-        # Take screenshot before confirmation
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = f"screenshots/reservation_{timestamp}.png"
-        os.makedirs("screenshots", exist_ok=True)
-        driver.save_screenshot(screenshot_path)
-        logger.info(f"Screenshot saved as {screenshot_path}")
-        
-        # Confirm reservation
-        confirm_button = driver.find_element(By.ID, "confirm")
-        logger.debug("Found confirm button")
-        confirm_button.click()
-        time.sleep(2)
-        
-        # Wait for confirmation message
-        success_message = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "success-message"))
-        )
-        logger.debug("Found success message")
+            logger.info("Processing booking request: %s", booking_request.request_id)
+
+        with acquire_driver(config) as driver:
+            wait = _wait(driver)
+            driver.get(config['website_url'])
+            logger.debug("Navigated to %s", config['website_url'])
+
+            # Log in - fill both fields and submit in a single in-page script
+            # instead of one WebDriver round-trip per field
+            logger.info("Attempting to log in")
+            wait.until(
+                EC.presence_of_element_located(_LOCATOR_LOGIN_USERNAME)
+            )
+            logger.debug("Found login form")
+            driver.execute_script("""
+                const u = document.getElementById('number');
+                u.value = arguments[0];
+                u.dispatchEvent(new Event('input', {bubbles: true}));
+                const p = document.getElementById('pass');
+                p.value = arguments[1];
+                p.dispatchEvent(new Event('input', {bubbles: true}));
+                document.querySelector('.btn1').click();
+            """, config['username'], config['password'])
+            logger.info("Login successful")
+
+            # Navigate to Reservations
+            logger.info("Navigating to Reservations page")
+            reservations_link = wait.until(
+                EC.presence_of_element_located(_LOCATOR_RESERVATIONS_LINK)
+            )
+            logger.debug("Found Reservations link")
+            reservations_link.click()
+
+            # Fill reservation form
+            logger.info("Filling reservation form")
+            form = wait.until(
+                EC.presence_of_element_located(_LOCATOR_RESERVATION_FORM)
+            )
+            logger.debug("Found reservation form")
+
+            # Fill area (the key court mapping), venue, date and time in one
+            # round-trip, firing the events the page's listeners expect
+            driver.execute_script("""
+                const fill = (id, value) => {
+                    const el = document.getElementById(id);
+                    el.value = value;
+                    el.dispatchEvent(new Event('input', {bubbles: true}));
+                    el.dispatchEvent(new Event('change', {bubbles: true}));
+                };
+                fill('area', arguments[0]);
+                fill('venue', arguments[1]);
+                fill('date', arguments[2]);
+                fill('time', arguments[3]);
+            """, str(config['area_value']), config['venue'], config['date'], config['time_slot'])
+            logger.debug("Filled form fields")
+
+            # Capture the framebuffer, then hand the disk write to the
+            # screenshot pool so the confirm click isn't delayed behind I/O
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            screenshot_path = f"screenshots/reservation_{timestamp}.png"
+            png = driver.get_screenshot_as_png()
+            _SCREENSHOT_POOL.submit(_write_screenshot, png, screenshot_path)
+
+            # Confirm reservation
+            confirm_button = driver.find_element(*_LOCATOR_CONFIRM_BUTTON)
+            logger.debug("Found confirm button")
+            confirm_button.click()
+
+            # Wait for confirmation message
+            success_message = wait.until(
+                EC.presence_of_element_located(_LOCATOR_SUCCESS_MESSAGE)
+            )
+            logger.debug("Found success message")
         
-        logger.info("Reservation made successfully!")
-        return True
+            logger.info("Reservation made successfully!")
+            return True
         
     except TimeoutException as e:
-        logger.error(f"Timeout while waiting for element: {e}")
+        logger.error("Timeout while waiting for element: %s", e)
         return False
     except WebDriverException as e:
-        logger.error(f"WebDriver error: {e}")
+        logger.error("WebDriver error: %s", e)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return False
-    finally:
-        if driver:
-            driver.quit()
-            logger.info("WebDriver closed")
+
+async def make_reservation_async(user_id: Optional[str] = None,
+                                 booking_request: Optional[BookingRequestModel] = None,
+                                 executor: Optional[ThreadPoolExecutor] = None) -> bool:
+    """
+    Run a single blocking reservation on a worker thread
+
+    Args:
+        user_id: User ID to load configuration for
+        booking_request: Specific booking request to process
+        executor: Optional thread pool to run on (defaults to the loop's)
+
+    Returns:
+        True if reservation was successful, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, make_reservation, user_id, booking_request)
+
+
+async def make_reservations_batch(items, max_concurrency: int = 5):
+    """
+    Execute multiple reservations concurrently
+
+    Each item is a dict of make_reservation kwargs. Bookings run in
+    parallel browser sessions bounded by max_concurrency; combined with
+    the driver pool each worker checks out a warm browser instead of
+    spawning one.
+
+    Args:
+        items: Iterable of dicts with 'user_id' / 'booking_request' keys
+        max_concurrency: Maximum simultaneous browser sessions
+
+    Returns:
+        List of results in input order (True/False or the raised exception)
+    """
+    items = list(items)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # One BatchGetItem for the whole batch instead of a get_user per booking
+    if DYNAMODB_AVAILABLE:
+        try:
+            prefetch_user_configs(item.get('user_id') for item in items)
+        except Exception as e:
+            logger.warning("User-config prefetch failed, falling back to per-user lookups: %s", e)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        async def one(item):
+            async with semaphore:
+                return await make_reservation_async(executor=executor, **item)
+
+        return await asyncio.gather(*(one(item) for item in items), return_exceptions=True)
+
 
 if __name__ == "__main__":
     success = make_reservation()
@@ -2,12 +2,65 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 import time
 import json
 import os
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import Select
+from dotenv import dotenv_values
+from concurrent.futures import ThreadPoolExecutor
+
+# Success-path screenshots are opt-in; error paths always capture
+DEBUG_SCREENSHOTS = os.getenv("DEBUG_SCREENSHOTS", "0") == "1"
+_SS_POOL = ThreadPoolExecutor(max_workers=2)
+
+def snap(driver, name):
+    """Save a debug screenshot, writing to disk off-thread (no-op unless DEBUG_SCREENSHOTS=1)"""
+    if not DEBUG_SCREENSHOTS:
+        return
+    path = f"screenshots/{name}_{time.strftime('%Y%m%d_%H%M%S')}.png"
+    png = driver.get_screenshot_as_png()
+    _SS_POOL.submit(lambda: open(path, 'wb').write(png))
+    print(f"Screenshot queued: {path}")
+
+def wait(driver, timeout=10):
+    """WebDriverWait polling every 100ms instead of the 500ms default"""
+    return WebDriverWait(driver, timeout, poll_frequency=0.1)
+
+def click_when_ready(driver, locator, timeout=10):
+    """Click an element as soon as it is clickable, re-resolving it if the
+    page swaps the node out from under us (no companion sleeps needed)"""
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        try:
+            el = wait(driver, max(0.1, end - time.monotonic())).until(
+                EC.element_to_be_clickable(locator)
+            )
+            el.click()
+            return el
+        except StaleElementReferenceException:
+            continue
+    raise TimeoutException(f"never clickable: {locator}")
+
+def wait_for_selector_mo(driver, css, timeout_ms=10000):
+    """Wait for a CSS selector using an in-page MutationObserver.
+
+    Resolves the moment the node appears instead of on the next poll tick.
+    Returns True if the element showed up, False on timeout.
+    """
+    return driver.execute_async_script("""
+        const done = arguments[arguments.length - 1];
+        const sel = arguments[0];
+        const to = arguments[1];
+        if (document.querySelector(sel)) return done(true);
+        const obs = new MutationObserver(() => {
+            if (document.querySelector(sel)) { obs.disconnect(); done(true); }
+        });
+        obs.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+        setTimeout(() => { obs.disconnect(); done(false); }, to);
+    """, css, timeout_ms)
 
 def print_element_info(element, name):
     """Print information about a found element"""
@@ -22,8 +75,8 @@ def inspect_page(driver, url):
     """Inspect the page and print information about important elements"""
     print(f"\nInspecting page: {url}")
     driver.get(url)
-    time.sleep(5)  # Increased wait time for page load
-    
+    wait(driver).until(lambda d: d.execute_script("return document.readyState") == "complete")
+
     # Try to switch to frame if it exists
     try:
         frames = driver.find_elements(By.TAG_NAME, "frame")
@@ -54,9 +107,7 @@ def inspect_page(driver, url):
     
     for name, (by, value) in elements.items():
         try:
-            # Add a small delay between checks
-            time.sleep(1)
-            element = WebDriverWait(driver, 5).until(
+            element = wait(driver, 5).until(
                 EC.presence_of_element_located((by, value))
             )
             print_element_info(element, name)
@@ -67,77 +118,56 @@ def inspect_page(driver, url):
             print(driver.page_source[:500] + "...")
     
     # Take screenshot
-    timestamp = time.strftime("%Y%m%d_%H%M%S")
-    screenshot_path = f"screenshots/inspection_{timestamp}.png"
-    driver.save_screenshot(screenshot_path)
-    print(f"\nScreenshot saved as {screenshot_path}")
+    snap(driver, "inspection")
 
 def test_login_and_reservations(driver, url, username, password, area_value, date, time_slot):
     """Test login and navigate to reservations"""
     print(f"\nTesting login at: {url}")
     driver.get(url)
-    time.sleep(3)  # Wait for page load
-    
+
     try:
         # Login steps...
         print("Looking for username field...")
-        username_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='number'][id='number']"))
-        )
+        wait_for_selector_mo(driver, "input[name='number'][id='number']")
+        username_field = driver.find_element(By.CSS_SELECTOR, "input[name='number'][id='number']")
         username_field.clear()
         username_field.send_keys(username)
         print("✓ Username entered")
-        time.sleep(1)
-        
+
         print("Looking for password field...")
         password_field = driver.find_element(By.CSS_SELECTOR, "input[name='pass'][id='pass']")
         password_field.clear()
         password_field.send_keys(password)
         print("✓ Password entered")
-        time.sleep(1)
-        
+
         print("Looking for submit button...")
         submit_button = driver.find_element(By.CSS_SELECTOR, "input[type='submit'][class='btn1'][value='Ingresar']")
         submit_button.click()
         print("✓ Submit button clicked")
-        time.sleep(3)  # Wait for login to complete
-        
+        wait_for_selector_mo(driver, "a[href='pre_reservations.php']")  # Login landing page
+
         # Take screenshot after login
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        driver.save_screenshot(f"screenshots/after_login_{timestamp}.png")
+        snap(driver, "after_login")
         print(f"Current URL after login: {driver.current_url}")
         
         # Now find and click the Reservaciones link
         print("\nLooking for Reservaciones link...")
         try:
-            # Wait for the link to be present
-            reservations_link = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href='pre_reservations.php']"))
-            )
-            
-            # Scroll the element into view
-            driver.execute_script("arguments[0].scrollIntoView(true);", reservations_link)
-            time.sleep(1)
-            
-            # Click using JavaScript
-            driver.execute_script("arguments[0].click();", reservations_link)
-            print("✓ Clicked Reservaciones link using JavaScript")
-            time.sleep(3)
-            
+            click_when_ready(driver, (By.CSS_SELECTOR, "a[href='pre_reservations.php']"))
+            print("✓ Clicked Reservaciones link")
+
             # Wait for Shadowbox iframe to appear
             print("\nWaiting for Shadowbox iframe...")
-            iframe = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "sb-player"))
-            )
+            wait_for_selector_mo(driver, "#sb-player")
+            iframe = driver.find_element(By.ID, "sb-player")
             print("Found iframe, switching to it...")
             driver.switch_to.frame(iframe)
             print("✓ Switched to iframe")
             
             # Wait for the select element to be present
             print("\nLooking for area select...")
-            select_element = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "area"))
-            )
+            wait_for_selector_mo(driver, "#area")
+            select_element = driver.find_element(By.ID, "area")
             print("Found select element")
             
             # Print all options
@@ -146,114 +176,65 @@ def test_login_and_reservations(driver, url, username, password, area_value, dat
             for option in select.options:
                 print(f"- {option.text} (value: {option.get_attribute('value')})")
             
-            # Select the tennis court by value
-            select.select_by_value(area_value)  # Use the area_value parameter
+            # Select the tennis court by value (re-resolve if the node goes stale)
+            for _ in range(3):
+                try:
+                    select.select_by_value(area_value)  # Use the area_value parameter
+                    break
+                except StaleElementReferenceException:
+                    select = Select(driver.find_element(By.ID, "area"))
             print(f"✓ Selected area with value: {area_value}")
-            time.sleep(1)  # Wait for selection to register
-            
+
             # Click the "Aceptar y Continuar" button
             print("\nLooking for Aceptar y Continuar button...")
-            continue_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit'][class='btn2'][value='Aceptar y Continuar']"))
-            )
-            print("Found continue button, clicking...")
-            driver.execute_script("arguments[0].click();", continue_button)
+            click_when_ready(driver, (By.CSS_SELECTOR, "input[type='submit'][class='btn2'][value='Aceptar y Continuar']"))
             print("✓ Clicked Aceptar y Continuar button")
-            time.sleep(2)
-            
-            # After clicking continue button and waiting
-            time.sleep(2)
-            
-            # Click on the date using the date parameter
-            print(f"\nLooking for date: {date}")
-            try:
-                # Find the date cell by its onclick attribute that contains the exact date and area
-                date_cell = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, f"td[onclick*=\"f_change_reservation_day('{date}','{area_value}')\"]"))
-                )
-                print("Found date cell, clicking...")
-                driver.execute_script("arguments[0].click();", date_cell)
-                print(f"✓ Clicked date {date}")
-            except Exception as e:
-                print(f"Error clicking date: {str(e)}")
-                # Try alternative method using JavaScript directly
-                try:
-                    driver.execute_script(f"f_change_reservation_day('{date}','{area_value}')")
-                    print("✓ Selected date using JavaScript function")
-                except Exception as e2:
-                    print(f"JavaScript selection failed: {str(e2)}")
-                    raise
-            
-            time.sleep(3)  # Increased wait time
-            
-            # Click the "Solicitar Reserva" link using the exact selector from the recording
-            print("\nLooking for Solicitar Reserva link...")
+
+            # Run the whole date -> Solicitar Reserva -> time slot -> save
+            # sequence in one in-page script: each step here is JS-driven, so
+            # chaining them browser-side avoids a WebDriver round-trip (plus a
+            # sleep) per step
+            print(f"\nBooking date {date}, slot '{time_slot}'...")
             try:
-                # Use the exact selector from the recording
-                reservation_link = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "table a"))
-                )
-                print("Found reservation link, clicking...")
-                driver.execute_script("arguments[0].click();", reservation_link)
-                print("✓ Clicked Solicitar Reserva link")
-                time.sleep(2)  # Wait for the form to load
-                
-                # Take screenshot after clicking Solicitar Reserva
-                driver.save_screenshot(f"screenshots/after_solicitar_reserva_{timestamp}.png")
-                print(f"Current URL after clicking Solicitar Reserva: {driver.current_url}")
-                
-                # Now look for the time slot dropdown
-                print("\nLooking for time slot dropdown...")
-                time_select = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "schedule"))
-                )
-                print("Found time select element")
-                
-                # Print all available options
-                time_select_obj = Select(time_select)
-                print("\nAvailable time slots:")
-                for option in time_select_obj.options:
-                    print(f"- {option.text} (value: {option.get_attribute('value')})")
-                
-                # Select the time slot using the provided time_slot parameter
-                time_select_obj.select_by_visible_text(time_slot)
-                print(f"✓ Selected time slot: {time_slot}")
-                time.sleep(2)  # Wait for selection to register
-                
-                # Take screenshot after selecting time
-                driver.save_screenshot(f"screenshots/after_time_selection_{timestamp}.png")
-                print(f"Current URL after selecting time: {driver.current_url}")
-                
-                # Finally, click the "Guardar" button
-                print("\nLooking for Guardar button...")
-                try:
-                    # Wait for the save button to be clickable
-                    save_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit'][class='btn2'][id='save_btn'][value='Guardar']"))
-                    )
-                    print("Found save button, clicking...")
-                    driver.execute_script("arguments[0].click();", save_button)
-                    print("✓ Clicked Guardar button")
-                    time.sleep(2)
-                    
-                    # Take screenshot after clicking save
-                    driver.save_screenshot(f"screenshots/after_save_{timestamp}.png")
-                    print(f"Current URL after clicking save: {driver.current_url}")
-                    
-                except Exception as e:
-                    print(f"Error clicking save button: {str(e)}")
-                    # Try alternative method using JavaScript
-                    try:
-                        driver.execute_script("document.getElementById('save_btn').click();")
-                        print("✓ Clicked save button using JavaScript")
-                    except Exception as e2:
-                        print(f"JavaScript click failed: {str(e2)}")
-                        raise
-                
+                completed = driver.execute_async_script("""
+                    const done = arguments[arguments.length - 1];
+                    const date = arguments[0], area = arguments[1], slot = arguments[2];
+                    const waitFor = sel => new Promise(resolve => {
+                        const t = setInterval(() => {
+                            const el = document.querySelector(sel);
+                            if (el) { clearInterval(t); resolve(el); }
+                        }, 50);
+                    });
+                    f_change_reservation_day(date, area);
+                    waitFor('table a').then(a => {
+                        a.click();
+                        return waitFor('#schedule');
+                    }).then(s => {
+                        for (const o of s.options) {
+                            if (o.text === slot) {
+                                s.value = o.value;
+                                s.dispatchEvent(new Event('change', {bubbles: true}));
+                                break;
+                            }
+                        }
+                        return waitFor('#save_btn');
+                    }).then(b => {
+                        b.click();
+                        done(true);
+                    }).catch(() => done(false));
+                """, date, area_value, time_slot)
+                if not completed:
+                    raise RuntimeError("In-page booking sequence did not complete")
+                print("✓ Selected date, time slot and clicked Guardar")
+
+                # Take screenshot of the final state
+                snap(driver, "after_save")
+                print(f"Current URL after clicking save: {driver.current_url}")
+
             except Exception as e:
-                print(f"Error finding Solicitar Reserva link: {str(e)}")
+                print(f"Error during booking sequence: {str(e)}")
                 # Take a screenshot to see what's on the page
-                driver.save_screenshot(f"screenshots/error_finding_link_{time.strftime('%Y%m%d_%H%M%S')}.png")
+                driver.save_screenshot(f"screenshots/error_booking_sequence_{time.strftime('%Y%m%d_%H%M%S')}.png")
                 print("Took screenshot of error state")
                 raise
             
@@ -282,20 +263,10 @@ def main():
     driver = webdriver.Chrome(service=service, options=options)
     
     try:
-        # Load config
-        env_vars = {}
-        with open(".env", "r", encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if line and not line.startswith('#'):
-                    try:
-                        if '=' in line:  # Only process lines that contain '='
-                            key, value = line.split('=', 1)
-                            env_vars[key.strip()] = value.strip()
-                    except ValueError as e:
-                        print(f"Warning: Skipping invalid line: {line}")
-        
+        # Load config - dotenv handles comments, quoting and escapes
+        env_vars = dotenv_values(".env")
+
+
         # Get all required variables from environment
         website_url = env_vars.get("TENNIS_WEBSITE_URL")
         username = env_vars.get("TENNIS_USERNAME")
@@ -332,7 +303,8 @@ def main():
     except Exception as e:
         print(f"Test failed: {str(e)}")
     finally:
-        time.sleep(3)  # Give time to see the final state
+        if os.getenv("HEADED_DEBUG"):
+            time.sleep(3)  # Give time to see the final state
         driver.quit()
 
 if __name__ == "__main__":
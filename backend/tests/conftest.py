@@ -0,0 +1,364 @@
+# ABOUTME: Shared pytest fixtures for the backend test suites
+# ABOUTME: Session-scoped DAO instances so boto3 clients and their connection pools are built once per run
+
+import os
+import socket
+import subprocess
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+import logging
+
+import pytest
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from src.dao import UserConfigDAO, BookingRequestDAO, SystemConfigDAO
+from src.database.connection import get_client
+from src.factories.test_factories import (
+    UserConfigFactory,
+    BookingRequestFactory,
+    SystemConfigFactory
+)
+
+# Set up test environment
+if not os.getenv('USE_AWS_DYNAMODB') and not os.getenv('DYNAMODB_LOCAL_ENDPOINT'):
+    os.environ['DYNAMODB_LOCAL_ENDPOINT'] = 'http://localhost:8000'
+
+# Let the ops layer serve repeated same-key reads from its local TTL cache
+# during tests; writes invalidate, so read-after-write stays correct
+os.environ.setdefault('DDB_ENABLE_LOCAL_CACHE', '1')
+
+# Service-layer suites (user management, API) need the development
+# environment before their modules import; set here so every test file
+# inherits it instead of repeating the assignments at module top
+os.environ.setdefault('TENNIS_ENVIRONMENT', 'development')
+os.environ.setdefault('DYNAMODB_ENDPOINT', 'http://localhost:8000')
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "integration: needs a running DynamoDB (local or AWS)"
+    )
+    # Start the server before collection so the module-level reachability
+    # skips in the DB-bound test files see it running
+    config._dynamodb_local_server = _start_dynamodb_local()
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, '_dynamodb_local_server', None)
+    if server is not None and server.poll() is None:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def dynamodb_local_reachable(timeout: float = 0.5) -> bool:
+    """True when something is listening on the configured DynamoDB endpoint
+
+    A raw socket probe is much cheaper than letting boto3 wait out its
+    connect retries; used for the session truncate below and for
+    module-level skips in the DB-bound test files.
+    """
+    endpoint = os.getenv('DYNAMODB_LOCAL_ENDPOINT')
+    if not endpoint:
+        # Pointed at real AWS - assume reachable
+        return True
+    parsed = urlparse(endpoint)
+    with socket.socket() as probe:
+        probe.settimeout(timeout)
+        return probe.connect_ex((parsed.hostname, parsed.port or 80)) == 0
+
+
+def dao_tables_reachable(timeout: float = 0.5) -> bool:
+    """True when DynamoDB is up and UserConfigs is keyed the way the DAOs key it
+
+    Reachability alone is not enough for the DAO suite: a server someone
+    else started may have no tables, or only the camelCase-keyed
+    TableManager tables the operations layer provisions for itself. Every
+    DAO write would then fail on the missing user_id key, so the suite
+    checks the actual key schema before unskipping.
+    """
+    if not dynamodb_local_reachable(timeout=timeout):
+        return False
+    if os.getenv('USE_AWS_DYNAMODB'):
+        return True
+    try:
+        description = get_client().describe_table(TableName='UserConfigs')
+    except Exception:
+        return False
+    key_attrs = {key['AttributeName'] for key in description['Table']['KeySchema']}
+    return key_attrs == {'user_id'}
+
+
+@pytest.fixture(scope="session")
+def run_id():
+    """Short id unique to this test run
+
+    Keys prefixed with it can never collide with items leaked by a prior
+    run, so tests need no defensive pre-cleanup reads.
+    """
+    return uuid.uuid4().hex[:8]
+
+
+# Date strings relative to "now", frozen once per session so parametrized
+# date tests don't redo the datetime.now() + strftime dance per case.
+# Sessions never straddle midnight long enough for the values to go stale.
+
+@pytest.fixture(scope="session")
+def future_date_str():
+    """Tomorrow in YYYY-MM-DD form"""
+    return (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+
+
+@pytest.fixture(scope="session")
+def past_date_str():
+    """Yesterday in YYYY-MM-DD form"""
+    return (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+
+
+@pytest.fixture(scope="session")
+def today_str():
+    """Today in YYYY-MM-DD form"""
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+# Canonical valid model instances for read-only tests (create-valid
+# checks, DynamoDB conversion, factory smoke assertions). Built once per
+# worker so Pydantic validation runs once instead of in every test;
+# tests that mutate their instance must build their own.
+
+@pytest.fixture(scope="session")
+def canonical_user():
+    """Valid UserConfig shared by read-only tests"""
+    return UserConfigFactory.create()
+
+
+@pytest.fixture(scope="session")
+def canonical_booking():
+    """Valid BookingRequest shared by read-only tests"""
+    return BookingRequestFactory.create()
+
+
+@pytest.fixture(scope="session")
+def canonical_config():
+    """Valid SystemConfig shared by read-only tests"""
+    return SystemConfigFactory.create()
+
+
+@pytest.fixture(scope="session")
+def user_dao():
+    """UserConfigDAO shared across the whole test session"""
+    return UserConfigDAO()
+
+
+@pytest.fixture(scope="session")
+def booking_dao():
+    """BookingRequestDAO shared across the whole test session"""
+    return BookingRequestDAO()
+
+
+@pytest.fixture(scope="session")
+def config_dao():
+    """SystemConfigDAO shared across the whole test session"""
+    return SystemConfigDAO()
+
+
+# Key prefixes the suite's tests and factories generate; startup cleanup
+# deletes only items carrying one of them, so anything a developer put in
+# a shared local database by hand (or via setup_database.py, whose sample
+# ids use hyphens) is never touched
+_TEST_KEY_PREFIXES = ('test_', 'testrun_', 'template_', 'user_', 'req_', 'admin_')
+
+
+def _delete_test_items(dao, key_attr):
+    """Delete leaked test items from a DAO's table with one filtered scan
+
+    Restricted to the suite's own key prefixes; never a full truncate.
+    Tolerates a missing table (a running server that was never seeded).
+    """
+    condition = Attr(key_attr).begins_with(_TEST_KEY_PREFIXES[0])
+    for prefix in _TEST_KEY_PREFIXES[1:]:
+        condition = condition | Attr(key_attr).begins_with(prefix)
+
+    scan_kwargs = {'ProjectionExpression': key_attr, 'FilterExpression': condition}
+    while True:
+        try:
+            response = dao.table.scan(**scan_kwargs)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                return
+            raise
+        items = response.get('Items', [])
+        if items:
+            with dao.table.batch_writer() as batch:
+                for item in items:
+                    batch.delete_item(Key={key_attr: item[key_attr]})
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def _start_dynamodb_local():
+    """Start an in-memory DynamoDB Local container if none is running
+
+    File-backed DynamoDB Local fsyncs on every write, so the throwaway
+    test server runs -inMemory -sharedDb and every operation stays
+    CPU+loopback bound. A server someone already started (CI service
+    container, docker-compose) is left alone, and if Docker is missing
+    the suite falls back to its usual reachability skips.
+
+    Called from pytest_configure (not a fixture) so the server is already
+    reachable when the DB-bound test files evaluate their module-level
+    skip guards during collection. Returns the server process, or None
+    when an existing endpoint (or none at all) is used.
+    """
+    if os.getenv('USE_AWS_DYNAMODB') or dynamodb_local_reachable():
+        return None
+
+    endpoint = urlparse(os.environ['DYNAMODB_LOCAL_ENDPOINT'])
+    port = str(endpoint.port or 8000)
+    try:
+        server = subprocess.Popen(
+            [
+                'docker', 'run', '--rm', '-p', f'{port}:8000',
+                'amazon/dynamodb-local:latest',
+                '-jar', 'DynamoDBLocal.jar', '-inMemory', '-sharedDb'
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except OSError:
+        return None
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline and not dynamodb_local_reachable(timeout=0.25):
+        if server.poll() is not None:
+            break
+        time.sleep(0.3)
+
+    # A freshly started -inMemory container has no tables; create them so
+    # the session cleanup and the DAO suite find them in place
+    if dynamodb_local_reachable(timeout=0.25):
+        try:
+            _create_dao_tables()
+        except Exception as e:
+            logging.getLogger(__name__).warning(
+                "Could not create tables on fresh DynamoDB Local: %s", e
+            )
+
+    return server
+
+
+# Key schemas for the tables the DAO layer reads and writes. The DAOs key
+# items by the models' snake_case attributes (user_id, request_id,
+# config_key) — not the camelCase TableManager schemas, which the
+# database-operations suite provisions for itself under its own
+# DYNAMODB_TABLE_SUFFIX namespace. Provisioning TableManager tables here
+# would hand the DAO suite tables it cannot write to.
+_DAO_TABLE_SCHEMAS = (
+    {
+        'TableName': 'UserConfigs',
+        'KeySchema': [{'AttributeName': 'user_id', 'KeyType': 'HASH'}],
+        'AttributeDefinitions': [{'AttributeName': 'user_id', 'AttributeType': 'S'}],
+        'BillingMode': 'PAY_PER_REQUEST',
+    },
+    {
+        'TableName': 'BookingRequests',
+        'KeySchema': [{'AttributeName': 'request_id', 'KeyType': 'HASH'}],
+        'AttributeDefinitions': [{'AttributeName': 'request_id', 'AttributeType': 'S'}],
+        'BillingMode': 'PAY_PER_REQUEST',
+    },
+    {
+        'TableName': 'SystemConfig',
+        'KeySchema': [{'AttributeName': 'config_key', 'KeyType': 'HASH'}],
+        'AttributeDefinitions': [{'AttributeName': 'config_key', 'AttributeType': 'S'}],
+        'BillingMode': 'PAY_PER_REQUEST',
+    },
+)
+
+
+def _create_dao_tables():
+    """Create the DAO-layer tables on a freshly started DynamoDB Local"""
+    client = get_client()
+    for schema in _DAO_TABLE_SCHEMAS:
+        try:
+            client.create_table(**schema)
+            client.get_waiter('table_exists').wait(TableName=schema['TableName'])
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ResourceInUseException':
+                raise
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _clean_tables():
+    """Remove test items leaked by prior runs once at the start of the run
+
+    A single upfront filtered sweep replaces the defensive try/delete
+    block each test used to issue. Only items with the suite's key
+    prefixes are deleted, and never when pointed at real AWS; no-op when
+    DynamoDB is unreachable so unit-only runs are unaffected.
+    """
+    if os.getenv('USE_AWS_DYNAMODB') or not dynamodb_local_reachable():
+        return
+
+    try:
+        daos = (
+            (UserConfigDAO(), 'user_id'),
+            (BookingRequestDAO(), 'request_id'),
+            (SystemConfigDAO(), 'config_key'),
+        )
+    except Exception:
+        return
+
+    for dao, key_attr in daos:
+        _delete_test_items(dao, key_attr)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """Warm the shared connection pool with one cheap DescribeTable per table
+
+    The first DAO call otherwise pays the TCP handshake, endpoint discovery
+    and botocore model load inside whichever test happens to run first. DAOs
+    are built here rather than via the fixtures so unit-only runs with no
+    database never touch boto3.
+    """
+    if not dynamodb_local_reachable():
+        return
+
+    try:
+        daos = (UserConfigDAO(), BookingRequestDAO(), SystemConfigDAO())
+    except Exception:
+        return
+
+    for dao in daos:
+        try:
+            dao.table.load()
+        except Exception:
+            pass
+
+
+@pytest.fixture
+def created_keys(user_dao, booking_dao, config_dao):
+    """Registry of keys a test creates; everything registered is removed
+    in one batched delete per table at teardown"""
+    keys = defaultdict(list)
+
+    yield keys
+
+    cleanups = (
+        (user_dao, 'user_id', keys['user']),
+        (booking_dao, 'request_id', keys['booking']),
+        (config_dao, 'config_key', keys['config']),
+    )
+    for dao, key_attr, values in cleanups:
+        if values:
+            with dao.table.batch_writer() as batch:
+                for value in values:
+                    batch.delete_item(Key={key_attr: value})
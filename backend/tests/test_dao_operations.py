@@ -3,6 +3,7 @@
 
 import pytest
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
@@ -29,99 +30,122 @@ from src.factories.test_factories import (
 if not os.getenv('USE_AWS_DYNAMODB') and not os.getenv('DYNAMODB_LOCAL_ENDPOINT'):
     os.environ['DYNAMODB_LOCAL_ENDPOINT'] = 'http://localhost:8000'
 
+from tests.conftest import dao_tables_reachable
 
-@pytest.fixture(scope="module")
-def user_dao():
-    """UserConfigDAO instance for testing"""
-    return UserConfigDAO()
+# These tests hit real DynamoDB semantics (conditional writes, filters);
+# the pure request/response plumbing is covered without a database in
+# test_dao_stubbed.py. Skip the whole file after one quick probe instead
+# of paying a boto3 connect timeout in every test when the DB is down —
+# and check the key schema too, so a server carrying only the operations
+# layer's camelCase tables skips instead of failing every write.
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(
+        not dao_tables_reachable(timeout=0.25),
+        reason="DynamoDB Local with DAO-keyed tables not reachable"
+    ),
+]
 
+# user_dao / booking_dao / config_dao come from the session-scoped
+# fixtures in conftest.py so every module shares one set of boto3 clients
 
-@pytest.fixture(scope="module")
-def booking_dao():
-    """BookingRequestDAO instance for testing"""
-    return BookingRequestDAO()
+# Each test class below works against its own DynamoDB table, so under
+# pytest-xdist (`pytest -n 3 --dist=loadgroup`) the classes run in parallel
+# while the xdist_group marks keep tests that share a table on one worker,
+# avoiding write-write conflicts
 
 
-@pytest.fixture(scope="module")
-def config_dao():
-    """SystemConfigDAO instance for testing"""
-    return SystemConfigDAO()
+@pytest.fixture
+def fresh_user(user_dao, request):
+    """A user already inserted for the test and deleted on teardown
 
+    Keyed off the test name so ids never collide, this replaces the
+    create/try-delete boilerplate each test carried and drops the per-test
+    DAO calls from three (delete-if-exists, create, final delete) to two.
+    """
+    name = request.node.name
+    user = UserConfigFactory.create_minimal(
+        user_id=name,
+        username=name,
+        email=f"{name}@test.com"
+    )
+    # Setup write, not code under test: skip the validation layers
+    user_dao._raw_put(user.to_dynamodb_item())
+    yield user
+    # delete_user returns False for a missing key, so no guard is needed
+    user_dao.delete_user(user.user_id)
 
+
+@pytest.fixture(scope="class")
+def seeded_user(user_dao):
+    """One user shared by all read-only tests in a class
+
+    Seeding once amortizes the create/delete pair across every read
+    assertion; tests that mutate their user keep using fresh_user.
+    """
+    user = UserConfigFactory.create_minimal(
+        user_id="seed",
+        username="seed_uname",
+        email="seed@e.com"
+    )
+    # Setup write, not code under test: skip the validation layers
+    user_dao._raw_put(user.to_dynamodb_item())
+    yield user
+    user_dao.delete_user(user.user_id)
+
+
+@pytest.mark.xdist_group(name="users")
 class TestUserConfigDAO:
     """Test UserConfigDAO operations"""
     
-    def test_create_user(self, user_dao):
-        """Test creating a user"""
+    def test_user_lifecycle(self, user_dao):
+        """Test the full create/exists/get/delete sequence on one user
+
+        One lifecycle pass covers what separate create, exists and delete
+        tests each paid their own setup and teardown writes for.
+        """
         user = UserConfigFactory.create_minimal(
-            user_id="test_create_user",
-            username="test_create_user",
-            email="test_create@test.com"
+            user_id="test_user_lifecycle",
+            username="test_user_lifecycle",
+            email="test_lifecycle@test.com"
         )
-        
-        # Clean up first
-        try:
-            user_dao.delete_user(user.user_id)
-        except:
-            pass
-        
+
+        # Create user
         created_user = user_dao.create_user(user)
         assert created_user.user_id == user.user_id
         assert created_user.username == user.username
-        
-        # Clean up
-        user_dao.delete_user(user.user_id)
-    
-    def test_get_user(self, user_dao):
-        """Test getting a user by ID"""
-        user = UserConfigFactory.create_minimal(
-            user_id="test_get_user",
-            username="test_get_user",
-            email="test_get@test.com"
-        )
-        
-        # Clean up first
-        try:
-            user_dao.delete_user(user.user_id)
-        except:
-            pass
-        
-        # Create user
-        user_dao.create_user(user)
-        
+
+        # User should exist now
+        assert user_dao.user_exists(user.user_id) is True
+        assert user_dao.user_exists("non_existent_user") is False
+
         # Get user
         retrieved_user = user_dao.get_user(user.user_id)
         assert retrieved_user is not None
         assert retrieved_user.user_id == user.user_id
-        
+
+        # Delete user and verify it is gone
+        assert user_dao.delete_user(user.user_id) is True
+        assert user_dao.user_exists(user.user_id) is False
+
+        # Deleting again reports nothing to delete
+        assert user_dao.delete_user(user.user_id) is False
+
+    def test_get_user(self, user_dao, seeded_user):
+        """Test getting a user by ID"""
+        retrieved_user = user_dao.get_user(seeded_user.user_id)
+        assert retrieved_user is not None
+        assert retrieved_user.user_id == seeded_user.user_id
+
         # Test non-existent user
         non_existent = user_dao.get_user("non_existent_user")
         assert non_existent is None
-        
-        # Clean up
-        user_dao.delete_user(user.user_id)
-    
-    def test_update_user(self, user_dao):
+
+    def test_update_user(self, user_dao, fresh_user):
         """Test updating a user"""
-        user = UserConfigFactory.create_minimal(
-            user_id="test_update_user",
-            username="test_update_user",
-            email="test_update@test.com"
-        )
-        
-        # Clean up first
-        try:
-            user_dao.delete_user(user.user_id)
-        except:
-            pass
-        
-        # Create user
-        user_dao.create_user(user)
-        
-        # Update user
-        user.first_name = "Updated"
-        user.last_name = "Name"
-        updated_user = user_dao.update_user(user)
+        fresh_user.first_name = "Updated"
+        fresh_user.last_name = "Name"
+        updated_user = user_dao.update_user(fresh_user)
         
         assert updated_user.first_name == "Updated"
         assert updated_user.last_name == "Name"
@@ -130,197 +154,70 @@ class TestUserConfigDAO:
         non_existent_user = UserConfigFactory.create_minimal(user_id="non_existent")
         with pytest.raises(NotFoundError):
             user_dao.update_user(non_existent_user)
-        
-        # Clean up
-        user_dao.delete_user(user.user_id)
-    
-    def test_delete_user(self, user_dao):
-        """Test deleting a user"""
-        user = UserConfigFactory.create_minimal(
-            user_id="test_delete_user",
-            username="test_delete_user",
-            email="test_delete@test.com"
-        )
-        
-        # Create user
-        user_dao.create_user(user)
-        
-        # Delete user
-        deleted = user_dao.delete_user(user.user_id)
-        assert deleted is True
-        
-        # Verify user is deleted
-        retrieved_user = user_dao.get_user(user.user_id)
-        assert retrieved_user is None
-        
-        # Test deleting non-existent user
-        deleted_again = user_dao.delete_user(user.user_id)
-        assert deleted_again is False
-    
-    def test_user_exists(self, user_dao):
-        """Test checking if user exists"""
-        user = UserConfigFactory.create_minimal(
-            user_id="test_exists_user",
-            username="test_exists_user",
-            email="test_exists@test.com"
-        )
-        
-        # Clean up first
-        try:
-            user_dao.delete_user(user.user_id)
-        except:
-            pass
-        
-        # User should not exist
-        assert user_dao.user_exists(user.user_id) is False
-        
-        # Create user
-        user_dao.create_user(user)
-        
-        # User should exist
-        assert user_dao.user_exists(user.user_id) is True
-        
-        # Clean up
-        user_dao.delete_user(user.user_id)
     
-    def test_get_user_by_username(self, user_dao):
+    def test_get_user_by_username(self, user_dao, seeded_user):
         """Test getting user by username"""
-        user = UserConfigFactory.create_minimal(
-            user_id="test_username_user",
-            username="unique_test_username",
-            email="test_username@test.com"
-        )
-        
-        # Clean up first
-        try:
-            user_dao.delete_user(user.user_id)
-        except:
-            pass
-        
-        # Create user
-        user_dao.create_user(user)
-        
-        # Get by username
-        retrieved_user = user_dao.get_user_by_username("unique_test_username")
+        retrieved_user = user_dao.get_user_by_username(seeded_user.username)
         assert retrieved_user is not None
-        assert retrieved_user.username == "unique_test_username"
-        
+        assert retrieved_user.username == seeded_user.username
+
         # Test non-existent username
         non_existent = user_dao.get_user_by_username("non_existent_username")
         assert non_existent is None
-        
-        # Clean up
-        user_dao.delete_user(user.user_id)
-    
-    def test_get_user_by_email(self, user_dao):
+
+    def test_get_user_by_email(self, user_dao, seeded_user):
         """Test getting user by email"""
-        user = UserConfigFactory.create_minimal(
-            user_id="test_email_user",
-            username="test_email_user",
-            email="unique_test@email.com"
-        )
-        
-        # Clean up first
-        try:
-            user_dao.delete_user(user.user_id)
-        except:
-            pass
-        
-        # Create user
-        user_dao.create_user(user)
-        
-        # Get by email
-        retrieved_user = user_dao.get_user_by_email("unique_test@email.com")
+        retrieved_user = user_dao.get_user_by_email(seeded_user.email)
         assert retrieved_user is not None
-        assert retrieved_user.email == "unique_test@email.com"
-        
+        assert retrieved_user.email == seeded_user.email
+
         # Test non-existent email
         non_existent = user_dao.get_user_by_email("non_existent@email.com")
         assert non_existent is None
-        
-        # Clean up
-        user_dao.delete_user(user.user_id)
-    
-    def test_activate_deactivate_user(self, user_dao):
+
+    def test_activate_deactivate_user(self, user_dao, fresh_user):
         """Test activating and deactivating users"""
-        user = UserConfigFactory.create_minimal(
-            user_id="test_activate_user",
-            username="test_activate_user",
-            email="test_activate@test.com"
-        )
-        
-        # Clean up first
-        try:
-            user_dao.delete_user(user.user_id)
-        except:
-            pass
-        
-        # Create user
-        user_dao.create_user(user)
-        
-        # Deactivate user
-        result = user_dao.deactivate_user(user.user_id)
-        assert result is True
-        
-        # Verify user is deactivated
-        updated_user = user_dao.get_user(user.user_id)
+        # Deactivate user - UpdateItem returns the updated attributes, so
+        # no follow-up get_user is needed
+        updated_user = user_dao.deactivate_user(fresh_user.user_id)
         assert updated_user.is_active is False
-        
+
         # Activate user
-        result = user_dao.activate_user(user.user_id)
-        assert result is True
-        
-        # Verify user is activated
-        updated_user = user_dao.get_user(user.user_id)
+        updated_user = user_dao.activate_user(fresh_user.user_id)
         assert updated_user.is_active is True
-        
+
         # Test with non-existent user
         with pytest.raises(NotFoundError):
             user_dao.deactivate_user("non_existent_user")
-        
-        # Clean up
-        user_dao.delete_user(user.user_id)
 
 
+@pytest.mark.xdist_group(name="booking_requests")
 class TestBookingRequestDAO:
     """Test BookingRequestDAO operations"""
     
-    def test_create_booking_request(self, booking_dao):
+    def test_create_booking_request(self, booking_dao, created_keys):
         """Test creating a booking request"""
         booking = BookingRequestFactory.create(
             request_id="test_create_booking",
             user_id="test_user"
         )
-        
-        # Clean up first
-        try:
-            booking_dao.delete_booking_request(booking.request_id)
-        except:
-            pass
-        
+
+        created_keys['booking'].append(booking.request_id)
         created_booking = booking_dao.create_booking_request(booking)
         assert created_booking.request_id == booking.request_id
         assert created_booking.requested_at is not None
         assert created_booking.expires_at is not None
-        
-        # Clean up
-        booking_dao.delete_booking_request(booking.request_id)
     
-    def test_get_booking_request(self, booking_dao):
+    def test_get_booking_request(self, booking_dao, created_keys):
         """Test getting a booking request by ID"""
         booking = BookingRequestFactory.create(
             request_id="test_get_booking",
             user_id="test_user"
         )
-        
-        # Clean up first
-        try:
-            booking_dao.delete_booking_request(booking.request_id)
-        except:
-            pass
-        
+
         # Create booking
         booking_dao.create_booking_request(booking)
+        created_keys['booking'].append(booking.request_id)
         
         # Get booking
         retrieved_booking = booking_dao.get_booking_request(booking.request_id)
@@ -330,25 +227,17 @@ class TestBookingRequestDAO:
         # Test non-existent booking
         non_existent = booking_dao.get_booking_request("non_existent_booking")
         assert non_existent is None
-        
-        # Clean up
-        booking_dao.delete_booking_request(booking.request_id)
     
-    def test_update_booking_request(self, booking_dao):
+    def test_update_booking_request(self, booking_dao, created_keys):
         """Test updating a booking request"""
         booking = BookingRequestFactory.create_pending(
             request_id="test_update_booking",
             user_id="test_user"
         )
-        
-        # Clean up first
-        try:
-            booking_dao.delete_booking_request(booking.request_id)
-        except:
-            pass
-        
+
         # Create booking
         booking_dao.create_booking_request(booking)
+        created_keys['booking'].append(booking.request_id)
         
         # Update booking
         booking.status = BookingStatus.CONFIRMED
@@ -362,25 +251,17 @@ class TestBookingRequestDAO:
         non_existent_booking = BookingRequestFactory.create(request_id="non_existent")
         with pytest.raises(NotFoundError):
             booking_dao.update_booking_request(non_existent_booking)
-        
-        # Clean up
-        booking_dao.delete_booking_request(booking.request_id)
     
-    def test_mark_request_status(self, booking_dao):
+    def test_mark_request_status(self, booking_dao, created_keys):
         """Test marking request status"""
         booking = BookingRequestFactory.create_pending(
             request_id="test_mark_status",
             user_id="test_user"
         )
-        
-        # Clean up first
-        try:
-            booking_dao.delete_booking_request(booking.request_id)
-        except:
-            pass
-        
+
         # Create booking
         booking_dao.create_booking_request(booking)
+        created_keys['booking'].append(booking.request_id)
         
         # Mark as confirmed
         confirmed_booking = booking_dao.mark_request_as_confirmed(
@@ -398,6 +279,7 @@ class TestBookingRequestDAO:
             user_id="test_user"
         )
         booking_dao.create_booking_request(failed_booking)
+        created_keys['booking'].append(failed_booking.request_id)
         
         # Mark as failed
         failed_result = booking_dao.mark_request_as_failed(
@@ -406,29 +288,24 @@ class TestBookingRequestDAO:
         )
         assert failed_result.status == BookingStatus.FAILED
         assert failed_result.error_message == "Error occurred"
-        
-        # Clean up
-        booking_dao.delete_booking_request(booking.request_id)
-        booking_dao.delete_booking_request(failed_booking.request_id)
     
-    def test_get_user_booking_requests(self, booking_dao):
+    def test_get_user_booking_requests(self, booking_dao, run_id):
         """Test getting booking requests for a user"""
-        user_id = "test_user_bookings"
-        
-        # Clean up any existing bookings for this user
-        existing_bookings = booking_dao.get_user_booking_requests(user_id)
-        for booking in existing_bookings:
-            booking_dao.delete_booking_request(booking.request_id)
-        
-        # Create multiple bookings for user
-        bookings = []
-        for i in range(3):
-            booking = BookingRequestFactory.create(
-                request_id=f"user_booking_{i}",
+        # Run-unique ids make collisions with prior runs impossible, so no
+        # pre-cleanup read is needed
+        user_id = f"testrun_{run_id}_user_bookings"
+
+        # Create multiple bookings for user - the writes are independent,
+        # so issue them concurrently instead of paying three round-trips
+        bookings = [
+            BookingRequestFactory.create(
+                request_id=f"testrun_{run_id}_booking_{i}",
                 user_id=user_id
             )
-            booking_dao.create_booking_request(booking)
-            bookings.append(booking)
+            for i in range(3)
+        ]
+        with ThreadPoolExecutor(max_workers=len(bookings)) as pool:
+            list(pool.map(booking_dao.create_booking_request, bookings))
         
         # Get user bookings
         user_bookings = booking_dao.get_user_booking_requests(user_id)
@@ -441,50 +318,39 @@ class TestBookingRequestDAO:
             status=BookingStatus.PENDING
         )
         assert all(booking.status == BookingStatus.PENDING for booking in pending_bookings)
-        
-        # Clean up
-        for booking in bookings:
-            booking_dao.delete_booking_request(booking.request_id)
+
+        # Clean up - one BatchWriteItem instead of a DeleteItem per booking
+        with booking_dao.table.batch_writer() as batch:
+            for booking in bookings:
+                batch.delete_item(Key={'request_id': booking.request_id})
 
 
+@pytest.mark.xdist_group(name="system_configs")
 class TestSystemConfigDAO:
     """Test SystemConfigDAO operations"""
     
-    def test_create_config(self, config_dao):
+    def test_create_config(self, config_dao, created_keys):
         """Test creating a configuration"""
         config = SystemConfigFactory.create(
             config_key="test_create_config",
             config_value="test_value"
         )
-        
-        # Clean up first
-        try:
-            config_dao.delete_config(config.config_key)
-        except:
-            pass
-        
+
+        created_keys['config'].append(config.config_key)
         created_config = config_dao.create_config(config)
         assert created_config.config_key == config.config_key
         assert created_config.config_value == config.config_value
-        
-        # Clean up
-        config_dao.delete_config(config.config_key)
     
-    def test_get_config(self, config_dao):
+    def test_get_config(self, config_dao, created_keys):
         """Test getting a configuration"""
         config = SystemConfigFactory.create(
             config_key="test_get_config",
             config_value="test_value"
         )
-        
-        # Clean up first
-        try:
-            config_dao.delete_config(config.config_key)
-        except:
-            pass
-        
+
         # Create config
         config_dao.create_config(config)
+        created_keys['config'].append(config.config_key)
         
         # Get config
         retrieved_config = config_dao.get_config(config.config_key)
@@ -494,25 +360,17 @@ class TestSystemConfigDAO:
         # Test non-existent config
         non_existent = config_dao.get_config("non_existent_config")
         assert non_existent is None
-        
-        # Clean up
-        config_dao.delete_config(config.config_key)
     
-    def test_get_config_value(self, config_dao):
+    def test_get_config_value(self, config_dao, created_keys):
         """Test getting configuration value"""
         config = SystemConfigFactory.create_integer_config(
             config_key="test_get_value",
             value=42
         )
-        
-        # Clean up first
-        try:
-            config_dao.delete_config(config.config_key)
-        except:
-            pass
-        
+
         # Create config
         config_dao.create_config(config)
+        created_keys['config'].append(config.config_key)
         
         # Get config value
         value = config_dao.get_config_value(config.config_key)
@@ -521,20 +379,12 @@ class TestSystemConfigDAO:
         # Test non-existent config
         with pytest.raises(NotFoundError):
             config_dao.get_config_value("non_existent_config")
-        
-        # Clean up
-        config_dao.delete_config(config.config_key)
     
-    def test_set_config(self, config_dao):
+    def test_set_config(self, config_dao, created_keys):
         """Test setting configuration value"""
         config_key = "test_set_config"
-        
-        # Clean up first
-        try:
-            config_dao.delete_config(config_key)
-        except:
-            pass
-        
+        created_keys['config'].append(config_key)
+
         # Set new config
         config = config_dao.set_config(
             config_key,
@@ -548,9 +398,6 @@ class TestSystemConfigDAO:
         # Update existing config
         updated_config = config_dao.set_config(config_key, "updated_value")
         assert updated_config.config_value == "updated_value"
-        
-        # Clean up
-        config_dao.delete_config(config_key)
     
     def test_get_configs_by_category(self, config_dao):
         """Test getting configurations by category"""
@@ -558,46 +405,54 @@ class TestSystemConfigDAO:
         config_keys = []
         
         try:
-            # Create multiple configs in same category
-            for i in range(3):
-                config_key = f"test_category_{i}"
-                config_keys.append(config_key)
-                config_dao.set_config(
-                    config_key,
-                    f"value_{i}",
-                    category=category
-                )
-            
-            # Get configs by category
-            configs = config_dao.get_configs_by_category(category)
-            category_configs = [c for c in configs if c.config_key.startswith("test_category_")]
-            assert len(category_configs) == 3
-            assert all(config.category == category for config in category_configs)
+            # Create multiple configs in same category - one BatchWriteItem
+            # instead of a round trip per config
+            config_keys = [f"test_category_{i}" for i in range(3)]
+            config_dao.batch_set_configs([
+                (f"test_category_{i}", f"value_{i}", category)
+                for i in range(3)
+            ])
+
+            # Get configs by category - the key prefix is filtered
+            # server-side instead of post-filtering in Python
+            configs = config_dao.get_configs_by_category(category, key_prefix="test_category_")
+            assert len(configs) == 3
+            assert all(config.category == category for config in configs)
             
         finally:
-            # Clean up
-            for config_key in config_keys:
-                try:
-                    config_dao.delete_config(config_key)
-                except:
-                    pass
+            # Clean up - one BatchWriteItem instead of a DeleteItem per config
+            with config_dao.table.batch_writer() as batch:
+                for config_key in config_keys:
+                    batch.delete_item(Key={'config_key': config_key})
     
-    def test_activate_deactivate_config(self, config_dao):
+    def test_batch_set_configs(self, config_dao, created_keys):
+        """Test creating multiple configurations in one batched write"""
+        items = [
+            ("test_batch_a", "value_a", ConfigCategory.SYSTEM),
+            ("test_batch_b", 7, ConfigCategory.SYSTEM),
+        ]
+        for config_key, _, _ in items:
+            created_keys['config'].append(config_key)
+
+        created = config_dao.batch_set_configs(items)
+        assert len(created) == 2
+        assert config_dao.get_config_value("test_batch_b") == 7
+
+        # BatchWriteItem is put-only: re-batching a key overwrites the item
+        config_dao.batch_set_configs([("test_batch_a", "replaced", ConfigCategory.SYSTEM)])
+        assert config_dao.get_config_value("test_batch_a") == "replaced"
+
+    def test_activate_deactivate_config(self, config_dao, created_keys):
         """Test activating and deactivating configurations"""
         config = SystemConfigFactory.create(
             config_key="test_activate_config",
             config_value="test_value",
             is_required=False
         )
-        
-        # Clean up first
-        try:
-            config_dao.delete_config(config.config_key)
-        except:
-            pass
-        
+
         # Create config
         config_dao.create_config(config)
+        created_keys['config'].append(config.config_key)
         
         # Deactivate config
         deactivated_config = config_dao.deactivate_config(config.config_key)
@@ -606,11 +461,8 @@ class TestSystemConfigDAO:
         # Activate config
         activated_config = config_dao.activate_config(config.config_key)
         assert activated_config.is_active is True
-        
-        # Clean up
-        config_dao.delete_config(config.config_key)
     
-    def test_config_validation(self, config_dao):
+    def test_config_validation(self, config_dao, created_keys):
         """Test configuration validation"""
         config = SystemConfigFactory.create_integer_config(
             config_key="test_validation_config",
@@ -618,15 +470,10 @@ class TestSystemConfigDAO:
             min_value=1,
             max_value=100
         )
-        
-        # Clean up first
-        try:
-            config_dao.delete_config(config.config_key)
-        except:
-            pass
-        
+
         # Create config
         config_dao.create_config(config)
+        created_keys['config'].append(config.config_key)
         
         # Valid update
         config.update_value(75)
@@ -636,11 +483,9 @@ class TestSystemConfigDAO:
         # Invalid update should raise error
         with pytest.raises(ValueError):
             config.update_value(150)  # Above max
-        
-        # Clean up
-        config_dao.delete_config(config.config_key)
 
 
+@pytest.mark.xdist_group(name="users")
 class TestDAOErrorHandling:
     """Test DAO error handling"""
     
@@ -0,0 +1,223 @@
+# ABOUTME: Unit tests for DAO CRUD plumbing against a stubbed botocore client
+# ABOUTME: Every RPC is an in-process lookup, so no DynamoDB (local or AWS) is needed
+
+import boto3
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+from botocore.stub import Stubber
+
+from src.dao import UserConfigDAO, EncryptedUserConfigDAO, NotFoundError, ConflictError
+from src.factories.test_factories import UserConfigFactory
+
+# Expected params are checked before the resource layer serializes them, so
+# they stay plain dicts; stubbed responses travel the wire format, so items
+# there need the low-level AttributeValue encoding.
+_SERIALIZER = TypeSerializer()
+
+
+def _typed(item):
+    """Encode a plain item dict in the low-level AttributeValue format"""
+    return {key: _SERIALIZER.serialize(value) for key, value in item.items()}
+
+
+@pytest.fixture
+def stubbed_user_dao():
+    """UserConfigDAO backed by a botocore Stubber
+
+    The injected resource never touches the global connection, so these
+    tests validate the DAO layer itself with zero network I/O.
+    """
+    resource = boto3.resource(
+        'dynamodb',
+        region_name='us-east-1',
+        aws_access_key_id='fake',
+        aws_secret_access_key='fake'
+    )
+    dao = UserConfigDAO(resource=resource)
+    with Stubber(resource.meta.client) as stubber:
+        yield dao, stubber
+        stubber.assert_no_pending_responses()
+
+
+class TestStubbedUserConfigDAO:
+    """Exercise UserConfigDAO request/response handling without a database"""
+
+    def test_create_user_sends_conditional_put(self, stubbed_user_dao):
+        dao, stubber = stubbed_user_dao
+        user = UserConfigFactory.create_minimal(user_id="stub_user")
+
+        stubber.add_response(
+            'put_item',
+            {},
+            expected_params={
+                'TableName': 'UserConfigs',
+                'Item': user.to_dynamodb_item(),
+                'ConditionExpression': 'attribute_not_exists(user_id)'
+            }
+        )
+
+        created = dao.create_user(user)
+        assert created.user_id == "stub_user"
+
+    def test_create_user_conflict_maps_to_conflict_error(self, stubbed_user_dao):
+        dao, stubber = stubbed_user_dao
+        user = UserConfigFactory.create_minimal(user_id="stub_user")
+
+        stubber.add_client_error('put_item', 'ConditionalCheckFailedException')
+
+        with pytest.raises(ConflictError):
+            dao.create_user(user)
+
+    def test_get_user_roundtrips_item(self, stubbed_user_dao):
+        dao, stubber = stubbed_user_dao
+        user = UserConfigFactory.create_minimal(user_id="stub_user")
+
+        stubber.add_response(
+            'get_item',
+            {'Item': _typed(user.to_dynamodb_item())},
+            expected_params={
+                'TableName': 'UserConfigs',
+                'Key': {'user_id': 'stub_user'}
+            }
+        )
+
+        retrieved = dao.get_user("stub_user")
+        assert retrieved is not None
+        assert retrieved.user_id == user.user_id
+        assert retrieved.username == user.username
+
+    def test_get_user_missing_returns_none(self, stubbed_user_dao):
+        dao, stubber = stubbed_user_dao
+
+        stubber.add_response('get_item', {})
+
+        assert dao.get_user("non_existent_user") is None
+
+    def test_delete_user_reports_whether_item_existed(self, stubbed_user_dao):
+        dao, stubber = stubbed_user_dao
+        user = UserConfigFactory.create_minimal(user_id="stub_user")
+
+        stubber.add_response(
+            'delete_item',
+            {'Attributes': _typed(user.to_dynamodb_item())}
+        )
+        stubber.add_response('delete_item', {})
+
+        assert dao.delete_user("stub_user") is True
+        assert dao.delete_user("stub_user") is False
+
+    def test_user_exists_uses_key_projection(self, stubbed_user_dao):
+        dao, stubber = stubbed_user_dao
+
+        stubber.add_response(
+            'get_item',
+            {'Item': _typed({'user_id': 'stub_user'})},
+            expected_params={
+                'TableName': 'UserConfigs',
+                'Key': {'user_id': 'stub_user'},
+                'ProjectionExpression': 'user_id'
+            }
+        )
+
+        assert dao.user_exists("stub_user") is True
+
+    def test_is_active_projects_single_attribute(self, stubbed_user_dao):
+        dao, stubber = stubbed_user_dao
+
+        stubber.add_response(
+            'get_item',
+            {'Item': _typed({'is_active': False})},
+            expected_params={
+                'TableName': 'UserConfigs',
+                'Key': {'user_id': 'stub_user'},
+                'ProjectionExpression': 'is_active'
+            }
+        )
+
+        assert dao.is_active("stub_user") is False
+
+    def test_update_user_missing_raises_not_found(self, stubbed_user_dao):
+        dao, stubber = stubbed_user_dao
+        user = UserConfigFactory.create_minimal(user_id="stub_user")
+
+        # update_user first reads the user; an empty get means not found
+        stubber.add_response('get_item', {})
+
+        with pytest.raises(NotFoundError):
+            dao.update_user(user)
+
+
+@pytest.fixture
+def stubbed_encrypted_user_dao():
+    """EncryptedUserConfigDAO backed by a botocore Stubber"""
+    resource = boto3.resource(
+        'dynamodb',
+        region_name='us-east-1',
+        aws_access_key_id='fake',
+        aws_secret_access_key='fake'
+    )
+    dao = EncryptedUserConfigDAO(resource=resource)
+    with Stubber(resource.meta.client) as stubber:
+        yield dao, stubber
+        stubber.assert_no_pending_responses()
+
+
+class TestStubbedEncryptedUserConfigDAO:
+    """Exercise EncryptedUserConfigDAO request handling without a database"""
+
+    def test_get_user_defaults_to_eventually_consistent_read(self, stubbed_encrypted_user_dao):
+        dao, stubber = stubbed_encrypted_user_dao
+
+        stubber.add_response(
+            'get_item',
+            {},
+            expected_params={
+                'TableName': 'UserConfigs',
+                'Key': {'user_id': 'stub_user'},
+                'ConsistentRead': False
+            }
+        )
+
+        assert dao.get_user("stub_user") is None
+
+    def test_get_user_projects_requested_fields(self, stubbed_encrypted_user_dao):
+        dao, stubber = stubbed_encrypted_user_dao
+
+        # Requested fields come first, then the attributes the model
+        # cannot validate without (user_id is deduplicated into place)
+        projected = ['venue', 'user_id', 'username', 'password', 'email',
+                     'first_name', 'last_name']
+        names = {f'#f{i}': name for i, name in enumerate(projected)}
+
+        stubber.add_response(
+            'get_item',
+            {},
+            expected_params={
+                'TableName': 'UserConfigs',
+                'Key': {'user_id': 'stub_user'},
+                'ConsistentRead': False,
+                'ProjectionExpression': ', '.join(names),
+                'ExpressionAttributeNames': names
+            }
+        )
+
+        assert dao.get_user("stub_user", fields=['venue']) is None
+
+    def test_get_user_strong_consistency_opt_in(self, stubbed_encrypted_user_dao):
+        dao, stubber = stubbed_encrypted_user_dao
+
+        stubber.add_response(
+            'get_item',
+            {},
+            expected_params={
+                'TableName': 'UserConfigs',
+                'Key': {'user_id': 'stub_user'},
+                'ConsistentRead': True
+            }
+        )
+
+        assert dao.get_user("stub_user", strong_consistency=True) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,11 +1,16 @@
 # ABOUTME: Unit tests for DynamoDB operations and CRUD functionality
 # ABOUTME: Tests UserConfig, BookingRequest, and SystemConfig operations
 
+import itertools
 import pytest
 import os
-import uuid
 from datetime import datetime, timezone
-from src.database.operations import UserConfigOperations, BookingRequestOperations, SystemConfigOperations
+from src.database.operations import (
+    UserConfigOperations,
+    BookingRequestOperations,
+    SystemConfigOperations,
+    create_user_config_and_booking_atomically,
+)
 from src.database.schemas import TableManager
 
 # Set up test environment
@@ -13,45 +18,173 @@ from src.database.schemas import TableManager
 if not os.getenv('USE_AWS_DYNAMODB') and not os.getenv('DYNAMODB_LOCAL_ENDPOINT'):
     os.environ['DYNAMODB_LOCAL_ENDPOINT'] = 'http://localhost:8000'
 
+# Give each xdist worker its own table namespace (UserConfigs_gw0, ...) so the
+# session-scoped table setup/teardown below never races another worker's.
+# Single-process runs get the 'gw0' suffix, keeping names stable either way.
+_worker = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+os.environ.setdefault('DYNAMODB_TABLE_SUFFIX', f'_{_worker}')
+
+from tests.conftest import dynamodb_local_reachable
+
+# Keep the whole module on one worker under --dist=loadgroup so its tests
+# share the session fixture (and its tables) instead of re-creating them.
+# Like test_dao_operations.py, skip the file after one cheap probe rather
+# than letting every fixture error out when no DynamoDB is running.
+pytestmark = [
+    pytest.mark.xdist_group(name="database_operations"),
+    pytest.mark.integration,
+    pytest.mark.skipif(
+        not dynamodb_local_reachable(timeout=0.25),
+        reason="DynamoDB Local not reachable"
+    ),
+]
+
 @pytest.fixture(scope="session")
 def setup_test_tables():
     """Set up test tables before running tests"""
     table_manager = TableManager()
-    
-    # Only clean up for local development, not AWS
-    if not os.getenv('USE_AWS_DYNAMODB'):
-        # Clean up any existing tables
-        table_manager.delete_all_tables()
-    
-    # Create fresh tables (or use existing ones for AWS)
-    success = table_manager.create_tables()
+
+    if os.getenv('USE_AWS_DYNAMODB'):
+        # AWS tables are long-lived; just make sure they exist
+        success = table_manager.create_tables()
+    else:
+        # Reuse existing local tables when the schema fingerprint matches,
+        # paying drop + CreateTable only after a schema change
+        success = table_manager.ensure_tables()
     assert success, "Failed to create test tables"
-    
+
     yield
-    
-    # Only cleanup after tests for local development
-    if not os.getenv('USE_AWS_DYNAMODB'):
-        table_manager.delete_all_tables()
 
-@pytest.fixture
-def user_config_ops():
-    """UserConfigOperations instance for testing"""
-    return UserConfigOperations()
+    # No table drop on teardown: per-test rollback already batch-deletes
+    # every key a test wrote, so the tables end the session empty and the
+    # next run skips their CreateTable cost. Works for AWS runs too, where
+    # dropping tables was never an option.
 
-@pytest.fixture
-def booking_ops():
-    """BookingRequestOperations instance for testing"""
-    return BookingRequestOperations()
+class _RecordingUserOps(UserConfigOperations):
+    """UserConfigOperations that records every written userId"""
+
+    def __init__(self, written):
+        super().__init__()
+        self._written = written
+
+    def create_user_config(self, user_id, config_data):
+        self._written.add(user_id)
+        return super().create_user_config(user_id, config_data)
+
+    def create_user_config_and_return(self, user_id, config_data):
+        self._written.add(user_id)
+        return super().create_user_config_and_return(user_id, config_data)
+
+class _RecordingBookingOps(BookingRequestOperations):
+    """BookingRequestOperations that records every written (requestId, userId)"""
+
+    def __init__(self, written):
+        super().__init__()
+        self._written = written
+
+    def create_booking_request(self, user_id, request_data):
+        request_id = super().create_booking_request(user_id, request_data)
+        if request_id is not None:
+            self._written.add((request_id, user_id))
+        return request_id
+
+    def create_booking_request_and_return(self, user_id, request_data):
+        item = super().create_booking_request_and_return(user_id, request_data)
+        if item is not None:
+            self._written.add((item['requestId'], user_id))
+        return item
+
+    def create_booking_requests_batch(self, user_id, requests_data):
+        request_ids = super().create_booking_requests_batch(user_id, requests_data)
+        self._written.update((request_id, user_id) for request_id in request_ids)
+        return request_ids
+
+class _RecordingConfigOps(SystemConfigOperations):
+    """SystemConfigOperations that records every written configKey"""
+
+    def __init__(self, written):
+        super().__init__()
+        self._written = written
+
+    def set_config(self, config_key, config_value, description=""):
+        self._written.add(config_key)
+        return super().set_config(config_key, config_value, description)
+
+    def set_configs(self, configs, description_template="Default {key} configuration"):
+        self._written.update(configs.keys())
+        return super().set_configs(configs, description_template)
+
+class TrackedOps:
+    """Ops bundle whose writes are rolled back after each test
+
+    Each test deletes exactly the keys it wrote instead of leaving items
+    for the session-end table teardown, so scans and status queries see
+    only the current test's data and can assert exact counts.
+    """
+
+    def __init__(self):
+        self._user_keys = set()
+        self._booking_keys = set()
+        self._config_keys = set()
+        self.user = _RecordingUserOps(self._user_keys)
+        self.booking = _RecordingBookingOps(self._booking_keys)
+        self.config = _RecordingConfigOps(self._config_keys)
+
+    def create_user_and_booking_atomically(self, user_id, config_data, request_data):
+        """Transactional user + booking create with both keys tracked"""
+        success, request_id = create_user_config_and_booking_atomically(
+            self.user, self.booking, user_id, config_data, request_data
+        )
+        if success:
+            self._user_keys.add(user_id)
+            self._booking_keys.add((request_id, user_id))
+        return success, request_id
+
+    def rollback(self):
+        """Purge the recorded keys with batched deletes"""
+        if self._user_keys:
+            with self.user.table.batch_writer() as batch:
+                for user_id in self._user_keys:
+                    batch.delete_item(Key={'userId': user_id})
+            self._user_keys.clear()
+
+        if self._booking_keys:
+            with self.booking.table.batch_writer() as batch:
+                for request_id, user_id in self._booking_keys:
+                    batch.delete_item(Key={'requestId': request_id, 'userId': user_id})
+            self._booking_keys.clear()
+
+        if self._config_keys:
+            with self.config.table.batch_writer() as batch:
+                for config_key in self._config_keys:
+                    batch.delete_item(Key={'configKey': config_key})
+            self._config_keys.clear()
+
+@pytest.fixture(scope="session")
+def _session_ops(setup_test_tables):
+    """One TrackedOps bundle shared by the whole session
+
+    The three ops objects (and the boto3 resource behind them, a
+    process-wide singleton from get_resource) are built exactly once, so
+    no test pays credential resolution or TLS setup again.
+    """
+    return TrackedOps()
 
 @pytest.fixture
-def system_config_ops():
-    """SystemConfigOperations instance for testing"""
-    return SystemConfigOperations()
+def tracked_ops(_session_ops):
+    """Per-test view of the session ops with rollback on teardown"""
+    yield _session_ops
+    _session_ops.rollback()
+
+# IDs only need to be unique within a run: a counter plus the worker id
+# (namespace suffix set above) is enough, deterministic, and skips the
+# per-test /dev/urandom read a uuid4 would cost.
+_user_id_counter = itertools.count()
 
 @pytest.fixture
 def test_user_id():
     """Generate unique test user ID"""
-    return f"test-user-{str(uuid.uuid4())[:8]}"
+    return f"test-user-{next(_user_id_counter):08x}-{_worker}"
 
 @pytest.fixture
 def test_user_config():
@@ -67,6 +200,16 @@ def test_user_config():
         'headless': True
     }
 
+@pytest.fixture(scope="session")
+def complex_data():
+    """Nested config value, built once instead of per test run"""
+    return {
+        'list': [1, 2, 3, 4, 5],
+        'dict': {'nested': 'value'},
+        'bool': True,
+        'number': 42
+    }
+
 @pytest.fixture
 def test_booking_request():
     """Test booking request data"""
@@ -79,14 +222,11 @@ def test_booking_request():
 
 class TestUserConfigOperations:
     """Test UserConfig CRUD operations"""
-    
-    def test_create_user_config(self, setup_test_tables, user_config_ops, test_user_id, test_user_config):
+
+    def test_create_user_config(self, tracked_ops, test_user_id, test_user_config):
         """Test creating a user configuration"""
-        result = user_config_ops.create_user_config(test_user_id, test_user_config)
-        assert result is True
-        
-        # Verify the config was created
-        config = user_config_ops.get_user_config(test_user_id)
+        # Conditional put writes and verifies in one round-trip
+        config = tracked_ops.user.create_user_config_and_return(test_user_id, test_user_config)
         assert config is not None
         assert config['userId'] == test_user_id
         assert config['username'] == test_user_config['username']
@@ -95,65 +235,58 @@ class TestUserConfigOperations:
         assert 'createdAt' in config
         assert 'updatedAt' in config
         assert config['version'] == 1
-    
-    def test_get_user_config_not_found(self, setup_test_tables, user_config_ops):
+
+    def test_get_user_config_not_found(self, tracked_ops):
         """Test getting a non-existent user configuration"""
-        config = user_config_ops.get_user_config('non-existent-user')
+        config = tracked_ops.user.get_user_config('non-existent-user')
         assert config is None
-    
-    def test_update_user_config(self, setup_test_tables, user_config_ops, test_user_id, test_user_config):
+
+    def test_update_user_config(self, tracked_ops, test_user_id, test_user_config):
         """Test updating a user configuration"""
         # Create initial config
-        user_config_ops.create_user_config(test_user_id, test_user_config)
-        
+        tracked_ops.user.create_user_config(test_user_id, test_user_config)
+
         # Update config
         updates = {
             'venue': 'Updated Tennis Club',
             'preferred_court': 17,
             'headless': False
         }
-        
-        result = user_config_ops.update_user_config(test_user_id, updates)
+
+        result = tracked_ops.user.update_user_config(test_user_id, updates)
         assert result is True
-        
+
         # Verify updates
-        config = user_config_ops.get_user_config(test_user_id)
+        config = tracked_ops.user.get_user_config(test_user_id)
         assert config['venue'] == 'Updated Tennis Club'
         assert config['preferredCourt'] == 17
         assert config['headless'] is False
         assert config['version'] == 2
         assert config['username'] == test_user_config['username']  # Unchanged
-    
-    def test_delete_user_config(self, setup_test_tables, user_config_ops, test_user_id, test_user_config):
+
+    def test_delete_user_config(self, tracked_ops, test_user_id, test_user_config):
         """Test deleting a user configuration"""
-        # Create config
-        user_config_ops.create_user_config(test_user_id, test_user_config)
-        
-        # Verify it exists
-        config = user_config_ops.get_user_config(test_user_id)
+        # Create config; the conditional put doubles as the existence check
+        config = tracked_ops.user.create_user_config_and_return(test_user_id, test_user_config)
         assert config is not None
-        
+
         # Delete config
-        result = user_config_ops.delete_user_config(test_user_id)
+        result = tracked_ops.user.delete_user_config(test_user_id)
         assert result is True
-        
+
         # Verify it's gone
-        config = user_config_ops.get_user_config(test_user_id)
+        config = tracked_ops.user.get_user_config(test_user_id)
         assert config is None
 
 class TestBookingRequestOperations:
     """Test BookingRequest CRUD operations"""
-    
-    def test_create_booking_request(self, setup_test_tables, booking_ops, test_user_id, test_booking_request):
+
+    def test_create_booking_request(self, tracked_ops, test_user_id, test_booking_request):
         """Test creating a booking request"""
-        request_id = booking_ops.create_booking_request(test_user_id, test_booking_request)
-        assert request_id is not None
-        assert isinstance(request_id, str)
-        
-        # Verify the request was created
-        request = booking_ops.get_booking_request(request_id, test_user_id)
+        # Conditional put writes and verifies in one round-trip
+        request = tracked_ops.booking.create_booking_request_and_return(test_user_id, test_booking_request)
         assert request is not None
-        assert request['requestId'] == request_id
+        assert isinstance(request['requestId'], str)
         assert request['userId'] == test_user_id
         assert request['courtId'] == test_booking_request['court_id']
         assert request['date'] == test_booking_request['date']
@@ -161,102 +294,92 @@ class TestBookingRequestOperations:
         assert request['status'] == 'pending'
         assert 'createdAt' in request
         assert 'ttl' in request
-    
-    def test_get_booking_request_not_found(self, setup_test_tables, booking_ops, test_user_id):
+
+    def test_get_booking_request_not_found(self, tracked_ops, test_user_id):
         """Test getting a non-existent booking request"""
-        request = booking_ops.get_booking_request('non-existent-id', test_user_id)
+        request = tracked_ops.booking.get_booking_request('non-existent-id', test_user_id)
         assert request is None
-    
-    def test_update_booking_status(self, setup_test_tables, booking_ops, test_user_id, test_booking_request):
+
+    def test_update_booking_status(self, tracked_ops, test_user_id, test_booking_request):
         """Test updating booking request status"""
         # Create request
-        request_id = booking_ops.create_booking_request(test_user_id, test_booking_request)
-        
+        request_id = tracked_ops.booking.create_booking_request(test_user_id, test_booking_request)
+
         # Update status
         result_data = {'screenshot_path': '/path/to/screenshot.png', 'confirmation_number': 'ABC123'}
-        result = booking_ops.update_booking_status(request_id, test_user_id, 'completed', result_data)
+        result = tracked_ops.booking.update_booking_status(request_id, test_user_id, 'completed', result_data)
         assert result is True
-        
+
         # Verify update
-        request = booking_ops.get_booking_request(request_id, test_user_id)
+        request = tracked_ops.booking.get_booking_request(request_id, test_user_id)
         assert request['status'] == 'completed'
         assert request['resultData'] == result_data
         assert 'updatedAt' in request
-    
-    def test_get_user_booking_requests(self, setup_test_tables, booking_ops, test_user_id, test_booking_request):
+
+    def test_get_user_booking_requests(self, tracked_ops, test_user_id, test_booking_request):
         """Test getting user's booking requests"""
-        # Create multiple requests
-        request_ids = []
-        for i in range(3):
-            request_data = test_booking_request.copy()
-            request_data['court_id'] = 7 + i
-            request_id = booking_ops.create_booking_request(test_user_id, request_data)
-            request_ids.append(request_id)
-        
+        # Create multiple requests with one batched write; the dict-splat
+        # comprehension builds each payload without copy-then-mutate churn
+        payloads = [{**test_booking_request, 'court_id': 7 + i} for i in range(3)]
+        request_ids = tracked_ops.booking.create_booking_requests_batch(test_user_id, payloads)
+        assert len(request_ids) == 3
+
         # Get user's requests
-        requests = booking_ops.get_user_booking_requests(test_user_id)
+        requests = tracked_ops.booking.get_user_booking_requests(test_user_id)
         assert len(requests) == 3
-        
+
         # Verify all requests belong to the user
         for request in requests:
             assert request['userId'] == test_user_id
             assert request['requestId'] in request_ids
-    
-    def test_get_requests_by_status(self, setup_test_tables, booking_ops, test_user_id, test_booking_request):
+
+    def test_get_requests_by_status(self, tracked_ops, test_user_id, test_booking_request):
         """Test getting requests by status"""
         # Create requests with different statuses
-        request_id1 = booking_ops.create_booking_request(test_user_id, test_booking_request)
-        request_id2 = booking_ops.create_booking_request(test_user_id, test_booking_request)
-        
+        request_id1 = tracked_ops.booking.create_booking_request(test_user_id, test_booking_request)
+        request_id2 = tracked_ops.booking.create_booking_request(test_user_id, test_booking_request)
+
         # Update one to completed
-        booking_ops.update_booking_status(request_id1, test_user_id, 'completed')
-        
-        # Get pending requests
-        pending_requests = booking_ops.get_requests_by_status('pending')
-        assert len(pending_requests) >= 1
-        assert all(req['status'] == 'pending' for req in pending_requests)
-        
-        # Get completed requests
-        completed_requests = booking_ops.get_requests_by_status('completed')
-        assert len(completed_requests) >= 1
-        assert all(req['status'] == 'completed' for req in completed_requests)
+        tracked_ops.booking.update_booking_status(request_id1, test_user_id, 'completed')
+
+        # GSI query scoped to this user returns exactly its matching rows
+        pending_requests = tracked_ops.booking.query_by_status_and_user('pending', test_user_id)
+        assert len(pending_requests) == 1
+        assert pending_requests[0]['requestId'] == request_id2
+
+        completed_requests = tracked_ops.booking.query_by_status_and_user('completed', test_user_id)
+        assert len(completed_requests) == 1
+        assert completed_requests[0]['requestId'] == request_id1
 
 class TestSystemConfigOperations:
     """Test SystemConfig CRUD operations"""
-    
-    def test_set_and_get_config(self, setup_test_tables, system_config_ops):
+
+    def test_set_and_get_config(self, tracked_ops):
         """Test setting and getting system configuration"""
         # Set config
-        result = system_config_ops.set_config('test_key', 'test_value', 'Test configuration')
+        result = tracked_ops.config.set_config('test_key', 'test_value', 'Test configuration')
         assert result is True
-        
+
         # Get config
-        value = system_config_ops.get_config('test_key')
+        value = tracked_ops.config.get_config('test_key')
         assert value == 'test_value'
-    
-    def test_set_config_with_complex_data(self, setup_test_tables, system_config_ops):
+
+    def test_set_config_with_complex_data(self, tracked_ops, complex_data):
         """Test setting configuration with complex data types"""
-        complex_data = {
-            'list': [1, 2, 3, 4, 5],
-            'dict': {'nested': 'value'},
-            'bool': True,
-            'number': 42
-        }
-        
         # Set complex config
-        result = system_config_ops.set_config('complex_key', complex_data, 'Complex configuration')
+        result = tracked_ops.config.set_config('complex_key', complex_data, 'Complex configuration')
         assert result is True
-        
+
         # Get and verify
-        value = system_config_ops.get_config('complex_key')
+        value = tracked_ops.config.get_config('complex_key')
         assert value == complex_data
-    
-    def test_get_config_not_found(self, setup_test_tables, system_config_ops):
+
+    def test_get_config_not_found(self, tracked_ops):
         """Test getting non-existent configuration"""
-        value = system_config_ops.get_config('non_existent_key')
+        value = tracked_ops.config.get_config('non_existent_key')
         assert value is None
-    
-    def test_get_all_configs(self, setup_test_tables, system_config_ops):
+
+    def test_get_all_configs(self, tracked_ops):
         """Test getting all configurations"""
         # Set multiple configs
         configs = {
@@ -264,71 +387,75 @@ class TestSystemConfigOperations:
             'key2': 'value2',
             'key3': {'nested': 'value3'}
         }
-        
-        for key, value in configs.items():
-            system_config_ops.set_config(key, value, f'Description for {key}')
-        
+
+        # One batched write instead of a round-trip per key
+        result = tracked_ops.config.set_configs(configs, 'Description for {key}')
+        assert result is True
+
         # Get all configs
-        all_configs = system_config_ops.get_all_configs()
-        
-        # Verify all configs are present
+        all_configs = tracked_ops.config.get_all_configs()
+
+        # Verify exactly these configs are present
+        assert len(all_configs) == len(configs)
         for key, value in configs.items():
             assert key in all_configs
             assert all_configs[key] == value
-    
-    def test_delete_config(self, setup_test_tables, system_config_ops):
+
+    def test_delete_config(self, tracked_ops):
         """Test deleting configuration"""
         # Set config
-        system_config_ops.set_config('delete_me', 'delete_value', 'To be deleted')
-        
+        tracked_ops.config.set_config('delete_me', 'delete_value', 'To be deleted')
+
         # Verify it exists
-        value = system_config_ops.get_config('delete_me')
+        value = tracked_ops.config.get_config('delete_me')
         assert value == 'delete_value'
-        
+
         # Delete config
-        result = system_config_ops.delete_config('delete_me')
+        result = tracked_ops.config.delete_config('delete_me')
         assert result is True
-        
+
         # Verify it's gone
-        value = system_config_ops.get_config('delete_me')
+        value = tracked_ops.config.get_config('delete_me')
         assert value is None
 
 class TestDatabaseIntegration:
     """Integration tests for database operations"""
-    
-    def test_user_config_and_booking_request_integration(self, setup_test_tables, user_config_ops, booking_ops, test_user_id, test_user_config, test_booking_request):
+
+    def test_user_config_and_booking_request_integration(self, tracked_ops, test_user_id, test_user_config, test_booking_request):
         """Test integration between user config and booking requests"""
-        # Create user config
-        user_config_ops.create_user_config(test_user_id, test_user_config)
-        
-        # Create booking request
-        request_id = booking_ops.create_booking_request(test_user_id, test_booking_request)
-        
+        # One TransactWriteItems creates both records atomically
+        success, request_id = tracked_ops.create_user_and_booking_atomically(
+            test_user_id, test_user_config, test_booking_request
+        )
+        assert success is True
+
         # Verify both exist and are linked
-        config = user_config_ops.get_user_config(test_user_id)
-        request = booking_ops.get_booking_request(request_id, test_user_id)
-        
+        config = tracked_ops.user.get_user_config(test_user_id)
+        request = tracked_ops.booking.get_booking_request(request_id, test_user_id)
+
         assert config is not None
         assert request is not None
         assert config['userId'] == request['userId']
         assert config['venue'] == request['venue']
-    
-    def test_system_config_for_validation(self, setup_test_tables, system_config_ops):
+
+    def test_system_config_for_validation(self, tracked_ops):
         """Test using system config for validation"""
-        # Set validation configs
-        system_config_ops.set_config('available_courts', [5, 7, 17, 19, 23], 'Available courts')
-        system_config_ops.set_config('available_time_slots', [
-            'De 08:00 AM a 09:00 AM',
-            'De 09:00 AM a 10:00 AM',
-            'De 10:00 AM a 11:00 AM'
-        ], 'Available time slots')
-        
+        # Seed both validation configs in one batched write
+        tracked_ops.config.set_configs({
+            'available_courts': [5, 7, 17, 19, 23],
+            'available_time_slots': [
+                'De 08:00 AM a 09:00 AM',
+                'De 09:00 AM a 10:00 AM',
+                'De 10:00 AM a 11:00 AM'
+            ]
+        })
+
         # Get configs for validation
-        available_courts = system_config_ops.get_config('available_courts')
-        available_time_slots = system_config_ops.get_config('available_time_slots')
-        
+        available_courts = tracked_ops.config.get_config('available_courts')
+        available_time_slots = tracked_ops.config.get_config('available_time_slots')
+
         # Verify validation data
         assert 7 in available_courts
         assert 99 not in available_courts
         assert 'De 08:00 AM a 09:00 AM' in available_time_slots
-        assert 'De 11:00 PM a 12:00 AM' not in available_time_slots
\ No newline at end of file
+        assert 'De 11:00 PM a 12:00 AM' not in available_time_slots
@@ -55,6 +55,41 @@ class TestEncryptionService:
             assert service.kms_client is not None
             assert service.master_key_id == 'test-key-id'
             
+    def test_kms_fields_share_one_data_key(self):
+        """Test that fields encrypted together decrypt with a single KMS call"""
+        with patch('boto3.client') as mock_client:
+            kms = Mock()
+            mock_client.return_value = kms
+            os.environ['TENNIS_PROD_KMS_KEY_ID'] = 'test-key-id'
+
+            data_key = os.urandom(32)
+            kms.generate_data_key.return_value = {
+                'Plaintext': data_key,
+                'CiphertextBlob': b'encrypted-data-key'
+            }
+            kms.decrypt.return_value = {'Plaintext': data_key}
+
+            writer = EncryptionService(environment="production")
+            encrypted = writer.encrypt_sensitive_data(
+                {'username': 'user', 'password': 'pass', 'email': 'user@example.com'},
+                ['username', 'password', 'email']
+            )
+
+            # One envelope key covers all three fields
+            kms.generate_data_key.assert_called_once()
+
+            # A fresh service (cold data-key cache, as after a restart)
+            # unwraps the shared key once and decrypts the rest locally
+            reader = EncryptionService(environment="production")
+            decrypted = reader.decrypt_sensitive_data(
+                encrypted, ['username', 'password', 'email']
+            )
+
+            assert decrypted['username'] == 'user'
+            assert decrypted['password'] == 'pass'
+            assert decrypted['email'] == 'user@example.com'
+            kms.decrypt.assert_called_once()
+
     def test_local_encryption_decryption(self):
         """Test local encryption and decryption"""
         service = EncryptionService(environment="development")
@@ -2,6 +2,7 @@
 # ABOUTME: Tests UserConfig, BookingRequest, SystemConfig validation and business logic
 
 import pytest
+import re
 import uuid
 from datetime import datetime, timedelta
 from pydantic import ValidationError
@@ -24,246 +25,257 @@ from src.factories.test_factories import (
 )
 
 
+# Expected-error patterns for pytest.raises(match=...), compiled once so
+# parametrized cases don't recompile them per invocation
+_FUTURE_MSG_RE = re.compile("Date must be in the future")
+_TIME_ORDER_RE = re.compile("End time must be after start time")
+
+# Enum membership sets, built once instead of materializing a fresh
+# __members__.values() view on every assertion
+_BOOKING_STATUSES = frozenset(BookingStatus.__members__.values())
+_CONFIG_VALUE_TYPES = frozenset(ConfigValueType.__members__.values())
+_CONFIG_CATEGORIES = frozenset(ConfigCategory.__members__.values())
+
+# Over-limit inputs built once at import instead of per parametrize
+# evaluation; each sits just past its validator's length cap
+_OVERLONG_USERNAME = "a" * 51
+_OVERLONG_PASSWORD = "a" * 129
+_OVERLONG_EMAIL = "a" * 250 + "@domain.com"
+
+# Known-good booking fields reused by the negative BookingRequest cases,
+# so each parametrized row only states the field it breaks
+_VALID_SLOT = "De 08:00 AM a 09:00 AM"
+_VALID_COURT = 5
+
+
+@pytest.mark.xdist_group(name="validators")
 class TestDateValidator:
     """Test date validation functionality"""
-    
-    def test_valid_date_format(self):
+
+    @pytest.mark.parametrize("date", ["2025-01-15", "2025-12-31", "2026-06-15"])
+    def test_valid_date_format(self, date):
         """Test valid date format validation"""
-        valid_dates = ["2025-01-15", "2025-12-31", "2026-06-15"]
-        for date in valid_dates:
-            result = DateValidator.validate_date_format(date)
-            assert result == date
-    
-    def test_invalid_date_format(self):
+        assert DateValidator.validate_date_format(date) == date
+
+    @pytest.mark.parametrize("date", [
+        "25-01-15",  # Wrong year format
+        "2025/01/15",  # Wrong separators
+        "2025-1-15",  # Missing zero padding
+        "2025-13-01",  # Invalid month
+        "2025-02-30",  # Invalid day
+        "not-a-date",  # Not a date
+        123,  # Not a string
+        None  # None value
+    ])
+    def test_invalid_date_format(self, date):
         """Test invalid date format validation"""
-        invalid_dates = [
-            "25-01-15",  # Wrong year format
-            "2025/01/15",  # Wrong separators
-            "2025-1-15",  # Missing zero padding
-            "2025-13-01",  # Invalid month
-            "2025-02-30",  # Invalid day
-            "not-a-date",  # Not a date
-            123,  # Not a string
-            None  # None value
-        ]
-        
-        for date in invalid_dates:
-            with pytest.raises(CustomValidationError):
-                DateValidator.validate_date_format(date)
+        with pytest.raises(CustomValidationError):
+            DateValidator.validate_date_format(date)
     
-    def test_future_date_validation(self):
+    def test_future_date_validation(self, future_date_str, past_date_str, today_str):
         """Test future date validation"""
         # Valid future date
-        future_date = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        result = DateValidator.validate_future_date(future_date)
-        assert result == future_date
-        
+        assert DateValidator.validate_future_date(future_date_str) == future_date_str
+
         # Invalid past date
-        past_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        with pytest.raises(CustomValidationError, match="Date must be in the future"):
-            DateValidator.validate_future_date(past_date)
-        
+        with pytest.raises(CustomValidationError, match=_FUTURE_MSG_RE):
+            DateValidator.validate_future_date(past_date_str)
+
         # Invalid today's date
-        today = datetime.now().strftime('%Y-%m-%d')
-        with pytest.raises(CustomValidationError, match="Date must be in the future"):
-            DateValidator.validate_future_date(today)
+        with pytest.raises(CustomValidationError, match=_FUTURE_MSG_RE):
+            DateValidator.validate_future_date(today_str)
 
 
+@pytest.mark.xdist_group(name="validators")
 class TestTimeValidator:
     """Test time validation functionality"""
-    
-    def test_valid_time_slot(self):
+
+    @pytest.mark.parametrize("slot", [
+        "De 08:00 AM a 09:00 AM",
+        "De 12:00 PM a 01:00 PM",
+        "De 07:00 PM a 08:00 PM",
+        "De 11:30 AM a 12:30 PM"
+    ])
+    def test_valid_time_slot(self, slot):
         """Test valid time slot validation"""
-        valid_slots = [
-            "De 08:00 AM a 09:00 AM",
-            "De 12:00 PM a 01:00 PM",
-            "De 07:00 PM a 08:00 PM",
-            "De 11:30 AM a 12:30 PM"
-        ]
-        
-        for slot in valid_slots:
-            result = TimeValidator.validate_time_slot(slot)
-            assert result == slot
-    
-    def test_invalid_time_slot_format(self):
+        assert TimeValidator.validate_time_slot(slot) == slot
+
+    @pytest.mark.parametrize("slot", [
+        "8:00 AM to 9:00 AM",  # Wrong format
+        "De 08:00 a 09:00",  # Missing AM/PM
+        "De 25:00 AM a 09:00 AM",  # Invalid hour
+        "De 08:60 AM a 09:00 AM",  # Invalid minute
+        "From 08:00 AM to 09:00 AM",  # Wrong prefix
+        123,  # Not a string
+        None  # None value
+    ])
+    def test_invalid_time_slot_format(self, slot):
         """Test invalid time slot format validation"""
-        invalid_slots = [
-            "8:00 AM to 9:00 AM",  # Wrong format
-            "De 08:00 a 09:00",  # Missing AM/PM
-            "De 25:00 AM a 09:00 AM",  # Invalid hour
-            "De 08:60 AM a 09:00 AM",  # Invalid minute
-            "From 08:00 AM to 09:00 AM",  # Wrong prefix
-            123,  # Not a string
-            None  # None value
-        ]
-        
-        for slot in invalid_slots:
-            with pytest.raises(CustomValidationError):
-                TimeValidator.validate_time_slot(slot)
-    
-    def test_invalid_time_order(self):
+        with pytest.raises(CustomValidationError):
+            TimeValidator.validate_time_slot(slot)
+
+    @pytest.mark.parametrize("slot", [
+        "De 09:00 AM a 08:00 AM",  # End before start
+        "De 08:00 AM a 08:00 AM",  # Same time
+    ])
+    def test_invalid_time_order(self, slot):
         """Test that end time must be after start time"""
-        invalid_slots = [
-            "De 09:00 AM a 08:00 AM",  # End before start
-            "De 08:00 AM a 08:00 AM",  # Same time
-        ]
-        
-        for slot in invalid_slots:
-            with pytest.raises(CustomValidationError, match="End time must be after start time"):
-                TimeValidator.validate_time_slot(slot)
+        with pytest.raises(CustomValidationError, match=_TIME_ORDER_RE):
+            TimeValidator.validate_time_slot(slot)
 
 
+@pytest.mark.xdist_group(name="validators")
 class TestCourtValidator:
     """Test court validation functionality"""
-    
-    def test_valid_court_id(self):
+
+    @pytest.mark.parametrize("court", [5, 7, 17, 19, 23])
+    def test_valid_court_id(self, court):
         """Test valid court ID validation"""
-        valid_courts = [5, 7, 17, 19, 23]
-        for court in valid_courts:
-            result = CourtValidator.validate_court_id(court)
-            assert result == court
-    
-    def test_invalid_court_id(self):
+        assert CourtValidator.validate_court_id(court) == court
+
+    @pytest.mark.parametrize("court", [1, 3, 10, 25, 100, "5", None])
+    def test_invalid_court_id(self, court):
         """Test invalid court ID validation"""
-        invalid_courts = [1, 3, 10, 25, 100, "5", None]
-        
-        for court in invalid_courts:
-            with pytest.raises(CustomValidationError):
-                CourtValidator.validate_court_id(court)
-    
-    def test_valid_court_list(self):
+        with pytest.raises(CustomValidationError):
+            CourtValidator.validate_court_id(court)
+
+    @pytest.mark.parametrize("court_list", [
+        [5],
+        [5, 7],
+        [5, 7, 17, 19, 23],
+        [23, 17, 5]  # Order doesn't matter
+    ])
+    def test_valid_court_list(self, court_list):
         """Test valid court list validation"""
-        valid_lists = [
-            [5],
-            [5, 7],
-            [5, 7, 17, 19, 23],
-            [23, 17, 5]  # Order doesn't matter
-        ]
-        
-        for court_list in valid_lists:
-            result = CourtValidator.validate_court_list(court_list)
-            assert result == court_list
-    
-    def test_invalid_court_list(self):
+        assert CourtValidator.validate_court_list(court_list) == court_list
+
+    @pytest.mark.parametrize("court_list", [
+        [],  # Empty list
+        [1, 2, 3],  # Invalid court IDs
+        [5, 1],  # Mix of valid and invalid
+        "not a list",  # Not a list
+        None  # None value
+    ])
+    def test_invalid_court_list(self, court_list):
         """Test invalid court list validation"""
-        invalid_lists = [
-            [],  # Empty list
-            [1, 2, 3],  # Invalid court IDs
-            [5, 1],  # Mix of valid and invalid
-            "not a list",  # Not a list
-            None  # None value
-        ]
-        
-        for court_list in invalid_lists:
-            with pytest.raises(CustomValidationError):
-                CourtValidator.validate_court_list(court_list)
+        with pytest.raises(CustomValidationError):
+            CourtValidator.validate_court_list(court_list)
 
 
+@pytest.mark.xdist_group(name="validators")
 class TestCredentialValidator:
     """Test credential validation functionality"""
-    
-    def test_valid_username(self):
+
+    @pytest.mark.parametrize("username", [
+        "john_doe",
+        "user123",
+        "test-user",
+        "a.b.c",
+        "user_123_test"
+    ])
+    def test_valid_username(self, username):
         """Test valid username validation"""
-        valid_usernames = [
-            "john_doe",
-            "user123",
-            "test-user",
-            "a.b.c",
-            "user_123_test"
-        ]
-        
-        for username in valid_usernames:
-            result = CredentialValidator.validate_username(username)
-            assert result == username
-    
-    def test_invalid_username(self):
+        assert CredentialValidator.validate_username(username) == username
+
+    @pytest.mark.parametrize("username", [
+        "ab",  # Too short
+        _OVERLONG_USERNAME,  # Too long
+        "user@domain",  # Invalid character
+        "user space",  # Space not allowed
+        "",  # Empty
+        123,  # Not a string
+        None  # None value
+    ])
+    def test_invalid_username(self, username):
         """Test invalid username validation"""
-        invalid_usernames = [
-            "ab",  # Too short
-            "a" * 51,  # Too long
-            "user@domain",  # Invalid character
-            "user space",  # Space not allowed
-            "",  # Empty
-            123,  # Not a string
-            None  # None value
-        ]
-        
-        for username in invalid_usernames:
-            with pytest.raises(CustomValidationError):
-                CredentialValidator.validate_username(username)
-    
-    def test_valid_password(self):
+        with pytest.raises(CustomValidationError):
+            CredentialValidator.validate_username(username)
+
+    @pytest.mark.parametrize("password", [
+        "Password123",
+        "SecurePass1!",
+        "MyPassword1",
+        "Abc123def"
+    ])
+    def test_valid_password(self, password):
         """Test valid password validation"""
-        valid_passwords = [
-            "Password123",
-            "SecurePass1!",
-            "MyPassword1",
-            "Abc123def"
-        ]
-        
-        for password in valid_passwords:
-            result = CredentialValidator.validate_password(password)
-            assert result == password
-    
-    def test_invalid_password(self):
+        assert CredentialValidator.validate_password(password) == password
+
+    @pytest.mark.parametrize("password", [
+        "short",  # Too short
+        "nouppercase123",  # No uppercase
+        "NOLOWERCASE123",  # No lowercase
+        "NoDigitsHere",  # No digits
+        _OVERLONG_PASSWORD,  # Too long
+        "",  # Empty
+        123,  # Not a string
+        None  # None value
+    ])
+    def test_invalid_password(self, password):
         """Test invalid password validation"""
-        invalid_passwords = [
-            "short",  # Too short
-            "nouppercase123",  # No uppercase
-            "NOLOWERCASE123",  # No lowercase
-            "NoDigitsHere",  # No digits
-            "a" * 129,  # Too long
-            "",  # Empty
-            123,  # Not a string
-            None  # None value
-        ]
-        
-        for password in invalid_passwords:
-            with pytest.raises(CustomValidationError):
-                CredentialValidator.validate_password(password)
+        with pytest.raises(CustomValidationError):
+            CredentialValidator.validate_password(password)
 
 
+@pytest.mark.xdist_group(name="validators")
 class TestEmailValidator:
     """Test email validation functionality"""
-    
-    def test_valid_email(self):
+
+    @pytest.mark.parametrize("email", [
+        "test@example.com",
+        "user.name@domain.co.uk",
+        "user+tag@test.org",
+        "123@numbers.com"
+    ])
+    def test_valid_email(self, email):
         """Test valid email validation"""
-        valid_emails = [
-            "test@example.com",
-            "user.name@domain.co.uk",
-            "user+tag@test.org",
-            "123@numbers.com"
-        ]
-        
-        for email in valid_emails:
-            result = EmailValidator.validate_email(email)
-            assert result == email
-    
-    def test_invalid_email(self):
+        assert EmailValidator.validate_email(email) == email
+
+    @pytest.mark.parametrize("email", [
+        "notanemail",  # No @ symbol
+        "@domain.com",  # No local part
+        "user@",  # No domain
+        "user@domain",  # No TLD
+        "user space@domain.com",  # Space in local part
+        _OVERLONG_EMAIL,  # Too long
+        "",  # Empty
+        123,  # Not a string
+        None  # None value
+    ])
+    def test_invalid_email(self, email):
         """Test invalid email validation"""
-        invalid_emails = [
-            "notanemail",  # No @ symbol
-            "@domain.com",  # No local part
-            "user@",  # No domain
-            "user@domain",  # No TLD
-            "user space@domain.com",  # Space in local part
-            "a" * 250 + "@domain.com",  # Too long
-            "",  # Empty
-            123,  # Not a string
-            None  # None value
-        ]
-        
-        for email in invalid_emails:
-            with pytest.raises(CustomValidationError):
-                EmailValidator.validate_email(email)
+        with pytest.raises(CustomValidationError):
+            EmailValidator.validate_email(email)
+
 
+@pytest.mark.xdist_group(name="validators")
+class TestValidatorRegexCaching:
+    """Guard against regressing to per-call re.compile in the validators"""
 
+    @pytest.mark.parametrize("pattern", [
+        DateValidator._DATE_RE,
+        TimeValidator._SLOT_RE,
+        CredentialValidator._USERNAME_RE,
+        CredentialValidator._UPPERCASE_RE,
+        CredentialValidator._LOWERCASE_RE,
+        CredentialValidator._DIGIT_RE,
+        EmailValidator._EMAIL_RE,
+    ])
+    def test_compiled_pattern_is_cached(self, pattern):
+        """Each validator exposes one import-time compiled pattern"""
+        assert isinstance(pattern, re.Pattern)
+        # re.compile caches by pattern string, so an identical compile
+        # returning the same object proves no fresh compilation happens
+        assert re.compile(pattern.pattern) is pattern
+
+
+@pytest.mark.xdist_group(name="user_config")
 class TestUserConfig:
     """Test UserConfig model validation and functionality"""
     
-    def test_create_valid_user_config(self):
+    def test_create_valid_user_config(self, canonical_user):
         """Test creating a valid UserConfig"""
-        user = UserConfigFactory.create()
+        user = canonical_user
         assert user.user_id is not None
         assert user.username is not None
         assert user.email is not None
@@ -334,10 +346,10 @@ class TestUserConfig:
         user.activate()
         assert user.is_active is True
     
-    def test_user_config_dynamodb_conversion(self):
+    def test_user_config_dynamodb_conversion(self, canonical_user):
         """Test UserConfig DynamoDB conversion"""
-        user = UserConfigFactory.create()
-        
+        user = canonical_user
+
         # Test to_dynamodb_item
         item = user.to_dynamodb_item()
         assert isinstance(item, dict)
@@ -352,51 +364,39 @@ class TestUserConfig:
         assert user.get_table_name() == "UserConfigs"
 
 
+@pytest.mark.xdist_group(name="booking")
 class TestBookingRequest:
     """Test BookingRequest model validation and functionality"""
     
-    def test_create_valid_booking_request(self):
+    def test_create_valid_booking_request(self, canonical_booking):
         """Test creating a valid BookingRequest"""
-        booking = BookingRequestFactory.create()
+        booking = canonical_booking
         assert booking.request_id is not None
         assert booking.user_id is not None
         assert booking.booking_date is not None
         assert booking.time_slot is not None
         assert booking.court_id in [5, 7, 17, 19, 23]
-        assert booking.status in BookingStatus.__members__.values()
-    
-    def test_booking_request_validation_errors(self):
+        assert booking.status in _BOOKING_STATUSES
+    
+    @pytest.mark.parametrize("field,bad_value", [
+        ("booking_date", None),  # None stands in for the past-date fixture
+        ("time_slot", "8:00 AM to 9:00 AM"),  # Wrong format
+        ("court_id", 99),  # Invalid court
+    ])
+    def test_booking_request_validation_errors(self, field, bad_value,
+                                               future_date_str, past_date_str):
         """Test BookingRequest validation errors"""
-        # Invalid date (past date)
-        past_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        with pytest.raises(ValidationError):
-            BookingRequest(
-                request_id="test",
-                user_id="user1",
-                booking_date=past_date,
-                time_slot="De 08:00 AM a 09:00 AM",
-                court_id=5
-            )
-        
-        # Invalid time slot
-        with pytest.raises(ValidationError):
-            BookingRequest(
-                request_id="test",
-                user_id="user1",
-                booking_date=(datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d'),
-                time_slot="8:00 AM to 9:00 AM",  # Wrong format
-                court_id=5
-            )
-        
-        # Invalid court ID
+        fields = {
+            "request_id": "test",
+            "user_id": "user1",
+            "booking_date": future_date_str,
+            "time_slot": _VALID_SLOT,
+            "court_id": _VALID_COURT,
+        }
+        fields[field] = past_date_str if bad_value is None else bad_value
+
         with pytest.raises(ValidationError):
-            BookingRequest(
-                request_id="test",
-                user_id="user1",
-                booking_date=(datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d'),
-                time_slot="De 08:00 AM a 09:00 AM",
-                court_id=99  # Invalid court
-            )
+            BookingRequest(**fields)
     
     def test_booking_request_status_methods(self):
         """Test BookingRequest status check methods"""
@@ -458,10 +458,10 @@ class TestBookingRequest:
         booking3.mark_as_cancelled()
         assert booking3.is_cancelled() is True
     
-    def test_booking_request_dynamodb_conversion(self):
+    def test_booking_request_dynamodb_conversion(self, canonical_booking):
         """Test BookingRequest DynamoDB conversion"""
-        booking = BookingRequestFactory.create()
-        
+        booking = canonical_booking
+
         # Test to_dynamodb_item
         item = booking.to_dynamodb_item()
         assert isinstance(item, dict)
@@ -476,33 +476,28 @@ class TestBookingRequest:
         assert booking.get_table_name() == "BookingRequests"
 
 
+@pytest.mark.xdist_group(name="system_config")
 class TestSystemConfig:
     """Test SystemConfig model validation and functionality"""
     
-    def test_create_valid_system_config(self):
+    def test_create_valid_system_config(self, canonical_config):
         """Test creating a valid SystemConfig"""
-        config = SystemConfigFactory.create()
+        config = canonical_config
         assert config.config_key is not None
         assert config.config_value is not None
-        assert config.value_type in ConfigValueType.__members__.values()
-        assert config.category in ConfigCategory.__members__.values()
-    
-    def test_system_config_type_validation(self):
+        assert config.value_type in _CONFIG_VALUE_TYPES
+        assert config.category in _CONFIG_CATEGORIES
+    
+    @pytest.mark.parametrize("factory,vtype,val", [
+        (SystemConfigFactory.create_string_config, ConfigValueType.STRING, "test_value"),
+        (SystemConfigFactory.create_integer_config, ConfigValueType.INTEGER, 42),
+        (SystemConfigFactory.create_boolean_config, ConfigValueType.BOOLEAN, True),
+    ])
+    def test_system_config_type_validation(self, factory, vtype, val):
         """Test SystemConfig type validation"""
-        # String config
-        string_config = SystemConfigFactory.create_string_config("test_value")
-        assert string_config.value_type == ConfigValueType.STRING
-        assert string_config.get_typed_value() == "test_value"
-        
-        # Integer config
-        int_config = SystemConfigFactory.create_integer_config(42)
-        assert int_config.value_type == ConfigValueType.INTEGER
-        assert int_config.get_typed_value() == 42
-        
-        # Boolean config
-        bool_config = SystemConfigFactory.create_boolean_config(True)
-        assert bool_config.value_type == ConfigValueType.BOOLEAN
-        assert bool_config.get_typed_value() is True
+        config = factory(val)
+        assert config.value_type == vtype
+        assert config.get_typed_value() == val
     
     def test_system_config_validation_errors(self):
         """Test SystemConfig validation errors"""
@@ -569,10 +564,10 @@ class TestSystemConfig:
         config.reset_to_default()
         assert config.config_value == "default_value"
     
-    def test_system_config_dynamodb_conversion(self):
+    def test_system_config_dynamodb_conversion(self, canonical_config):
         """Test SystemConfig DynamoDB conversion"""
-        config = SystemConfigFactory.create()
-        
+        config = canonical_config
+
         # Test to_dynamodb_item
         item = config.to_dynamodb_item()
         assert isinstance(item, dict)
@@ -587,16 +582,16 @@ class TestSystemConfig:
         assert config.get_table_name() == "SystemConfig"
 
 
+@pytest.mark.xdist_group(name="factories")
 class TestFactories:
     """Test factory methods"""
     
-    def test_user_config_factory(self):
+    def test_user_config_factory(self, canonical_user):
         """Test UserConfigFactory methods"""
-        # Test basic creation
-        user = UserConfigFactory.create()
-        assert user.user_id is not None
-        assert user.is_active is True
-        
+        # Basic creation is covered by the shared canonical instance
+        assert canonical_user.user_id is not None
+        assert canonical_user.is_active is True
+
         # Test minimal creation
         minimal_user = UserConfigFactory.create_minimal()
         assert minimal_user.first_name == "Test"
@@ -610,14 +605,13 @@ class TestFactories:
         # Test batch creation
         users = UserConfigFactory.create_batch(3)
         assert len(users) == 3
-        assert all(isinstance(user, UserConfig) for user in users)
+        assert {type(user) for user in users} == {UserConfig}
     
-    def test_booking_request_factory(self):
+    def test_booking_request_factory(self, canonical_booking):
         """Test BookingRequestFactory methods"""
-        # Test basic creation
-        booking = BookingRequestFactory.create()
-        assert booking.request_id is not None
-        
+        # Basic creation is covered by the shared canonical instance
+        assert canonical_booking.request_id is not None
+
         # Test status-specific creation
         pending = BookingRequestFactory.create_pending()
         assert pending.status == BookingStatus.PENDING
@@ -633,14 +627,13 @@ class TestFactories:
         # Test batch creation
         bookings = BookingRequestFactory.create_batch(5)
         assert len(bookings) == 5
-        assert all(isinstance(booking, BookingRequest) for booking in bookings)
+        assert {type(booking) for booking in bookings} == {BookingRequest}
     
-    def test_system_config_factory(self):
+    def test_system_config_factory(self, canonical_config):
         """Test SystemConfigFactory methods"""
-        # Test basic creation
-        config = SystemConfigFactory.create()
-        assert config.config_key is not None
-        
+        # Basic creation is covered by the shared canonical instance
+        assert canonical_config.config_key is not None
+
         # Test type-specific creation
         string_config = SystemConfigFactory.create_string_config()
         assert string_config.value_type == ConfigValueType.STRING
@@ -656,7 +649,7 @@ class TestFactories:
         # Test batch creation
         configs = SystemConfigFactory.create_batch(3)
         assert len(configs) == 3
-        assert all(isinstance(config, SystemConfig) for config in configs)
+        assert {type(config) for config in configs} == {SystemConfig}
 
 
 if __name__ == "__main__":
@@ -2,8 +2,11 @@
 # ABOUTME: Tests configuration loading, court mapping, validation, and error handling scenarios
 
 import pytest
+import asyncio
 import os
+import queue
 import sys
+import threading
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
@@ -15,38 +18,93 @@ import tennis
 from src.models import BookingRequest as BookingRequestModel, EncryptedUserConfig
 from src.api.models import BookingStatus
 
+_TEST_USER_ID = "test_user_123"
+
+
+@pytest.fixture(scope="module")
+def now():
+    """Clock frozen once per module
+
+    A fully fixed date would fail the model's future-date validation as
+    the calendar advances, so 'now' is captured once and every timestamp
+    in the module derives from it instead of re-querying the system clock.
+    """
+    return datetime.now()
+
+
+@pytest.fixture(scope="module")
+def future_date(now):
+    """Booking date safely in the future, computed once per module"""
+    return (now + timedelta(days=5)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture(scope="module")
+def booking_request(now, future_date):
+    """Canonical pending booking shared by the module's tests
+
+    Pydantic validation runs once instead of in every setup; the tests
+    treat it as read-only, so anything that mutates must build its own.
+    """
+    return BookingRequestModel(
+        request_id="req_123",
+        user_id=_TEST_USER_ID,
+        court_id=1,
+        booking_date=future_date,
+        time_slot="De 09:00 AM a 10:00 AM",
+        status=BookingStatus.PENDING,
+        created_at=now,
+        updated_at=now
+    )
+
+
+@pytest.fixture(scope="module")
+def make_booking(booking_request):
+    """Clone the canonical booking with per-test overrides
+
+    model_copy skips Pydantic re-validation, so variants differing only in
+    request_id/court_id don't pay the full construction cost again.
+    """
+    def _make(**overrides):
+        return booking_request.model_copy(update=overrides)
+
+    return _make
+
+
+@pytest.fixture
+def user_config_mock():
+    """Fresh mock user config per test (mocks accumulate call history)"""
+    user_config = Mock()
+    user_config.user_id = _TEST_USER_ID
+    user_config.username = "testuser"
+    user_config.password = "testpass123"  # Already "decrypted" in mock
+    # Set attributes directly on the mock object
+    user_config.website_url = "https://parquesdelsol.sasweb.net/"
+    user_config.venue = "Parques del Sol"
+    user_config.headless = True
+    user_config.preferred_courts = [1]
+    user_config.default_date = "2025-04-01"
+    user_config.default_time = "De 08:00 AM a 09:00 AM"
+    return user_config
+
+
 class TestTennisScriptConfiguration:
     """Test suite for tennis script configuration loading and validation"""
-    
-    def setup_method(self):
-        """Set up test environment before each test"""
-        self.test_user_id = "test_user_123"
-        # Use a future date for booking_date validation
-        self.future_date = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
-        self.test_booking_request = BookingRequestModel(
-            request_id="req_123",
-            user_id=self.test_user_id,
-            court_id=1,
-            booking_date=self.future_date,
-            time_slot="De 09:00 AM a 10:00 AM",
-            status=BookingStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
-        # Create a mock user config instead of actual EncryptedUserConfig
-        self.test_user_config = Mock()
-        self.test_user_config.user_id = self.test_user_id
-        self.test_user_config.username = "testuser"
-        self.test_user_config.password = "testpass123"  # Already "decrypted" in mock
-        # Set attributes directly on the mock object
-        self.test_user_config.website_url = "https://parquesdelsol.sasweb.net/"
-        self.test_user_config.venue = "Parques del Sol"
-        self.test_user_config.headless = True
-        self.test_user_config.preferred_courts = [1]
-        self.test_user_config.default_date = "2025-04-01"
-        self.test_user_config.default_time = "De 08:00 AM a 09:00 AM"
-        
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, future_date, booking_request, user_config_mock):
+        """Wire the shared fixtures and reset the script's memoized state"""
+        self.test_user_id = _TEST_USER_ID
+        self.future_date = future_date
+        self.test_booking_request = booking_request
+        self.test_user_config = user_config_mock
+
+        # The script memoizes the DAO instance, recent user lookups and
+        # validated config digests; reset them so each test's patched DAO
+        # class takes effect and validation always runs
+        tennis._USER_DAO = None
+        tennis._user_cache.clear()
+        tennis._VALIDATED_DIGESTS.clear()
+
     @patch('tennis.DYNAMODB_AVAILABLE', True)
     @patch('tennis.load_config_from_dynamodb')
     @patch('tennis.validate_config')
@@ -82,64 +140,32 @@ class TestTennisScriptConfiguration:
         mock_load_config_from_dynamodb.assert_called_once_with(self.test_user_id, self.test_booking_request)
         mock_validate_config.assert_called_once_with(expected_config)
         
+    @pytest.mark.parametrize("court_id,expected_area", [(1, 5), (2, 7)])
     @patch('tennis.DYNAMODB_AVAILABLE', True)
     @patch('tennis.EncryptedUserConfigDAO')
-    def test_load_config_court_mapping(self, mock_dao_class):
+    def test_load_config_court_mapping(self, mock_dao_class, court_id, expected_area, make_booking):
         """Test court ID to area value mapping"""
         mock_dao = Mock()
         mock_dao.get_user.return_value = self.test_user_config
         mock_dao_class.return_value = mock_dao
-        
-        # Test Court 1 -> Area 5
-        booking_court_1 = BookingRequestModel(
-            request_id="req_1",
-            user_id=self.test_user_id,
-            court_id=1,
-            booking_date=self.future_date,
-            time_slot="De 09:00 AM a 10:00 AM",
-            status=BookingStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
-        config = tennis.load_config_from_dynamodb(self.test_user_id, booking_court_1)
-        assert config['area_value'] == 5
-        
-        # Test Court 2 -> Area 7
-        booking_court_2 = BookingRequestModel(
-            request_id="req_2",
-            user_id=self.test_user_id,
-            court_id=2,
-            booking_date=self.future_date,
-            time_slot="De 09:00 AM a 10:00 AM",
-            status=BookingStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
-        config = tennis.load_config_from_dynamodb(self.test_user_id, booking_court_2)
-        assert config['area_value'] == 7
+
+        booking = make_booking(request_id=f"req_{court_id}", court_id=court_id)
+
+        config = tennis.load_config_from_dynamodb(self.test_user_id, booking)
+        assert config['area_value'] == expected_area
         
     @patch('tennis.DYNAMODB_AVAILABLE', True)
     @patch('tennis.EncryptedUserConfigDAO')
-    def test_load_config_invalid_court_id(self, mock_dao_class):
+    def test_load_config_invalid_court_id(self, mock_dao_class, make_booking):
         """Test error handling for invalid court ID"""
         mock_dao = Mock()
         mock_dao.get_user.return_value = self.test_user_config
         mock_dao_class.return_value = mock_dao
-        
-        # Test invalid court ID
-        booking_invalid_court = BookingRequestModel(
-            request_id="req_invalid",
-            user_id=self.test_user_id,
-            court_id=999,  # Invalid court ID
-            booking_date=self.future_date,
-            time_slot="De 09:00 AM a 10:00 AM",
-            status=BookingStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
+
+        # model_copy skips validation, which is what lets an invalid
+        # court_id through to load_config_from_dynamodb's own check
+        booking_invalid_court = make_booking(request_id="req_invalid", court_id=999)
+
         with pytest.raises(ValueError, match="Invalid court_id: 999"):
             tennis.load_config_from_dynamodb(self.test_user_id, booking_invalid_court)
             
@@ -277,41 +303,37 @@ class TestTennisScriptConfiguration:
         with pytest.raises(ValueError, match="Invalid area_value: 999"):
             tennis.validate_config(invalid_config)
             
-    def test_validate_config_valid_area_values(self):
+    @pytest.mark.parametrize("area_value", [5, 7])  # Only tennis courts
+    def test_validate_config_valid_area_values(self, area_value):
         """Test configuration validation with valid area values"""
-        for area_value in [5, 7]:  # Only tennis courts
-            valid_config = {
-                'username': 'testuser',
-                'password': 'testpass',
-                'website_url': 'https://example.com',
-                'area_value': area_value,
-                'date': '2025-04-01',
-                'time_slot': 'De 09:00 AM a 10:00 AM'
-            }
-            
-            # Should not raise any exception
-            tennis.validate_config(valid_config)
+        valid_config = {
+            'username': 'testuser',
+            'password': 'testpass',
+            'website_url': 'https://example.com',
+            'area_value': area_value,
+            'date': '2025-04-01',
+            'time_slot': 'De 09:00 AM a 10:00 AM'
+        }
+
+        # Should not raise any exception
+        tennis.validate_config(valid_config)
 
 
 class TestTennisScriptExecution:
     """Test suite for tennis script execution and reservation functionality"""
-    
-    def setup_method(self):
-        """Set up test environment before each test"""
-        self.test_user_id = "test_user_123"
-        # Use a future date for booking_date validation
-        self.future_date = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
-        self.test_booking_request = BookingRequestModel(
-            request_id="req_123",
-            user_id=self.test_user_id,
-            court_id=1,
-            booking_date=self.future_date,
-            time_slot="De 09:00 AM a 10:00 AM",
-            status=BookingStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, future_date, booking_request):
+        """Wire the shared fixtures and reset the script's driver state"""
+        self.test_user_id = _TEST_USER_ID
+        self.future_date = future_date
+        self.test_booking_request = booking_request
+        # Start each test with an empty driver pool so warm drivers from
+        # earlier tests are never reused, and drop the cached chromedriver
+        # path so driver-resolution mocks take effect
+        tennis._DRIVER_POOL = queue.Queue()
+        tennis._DRIVER_PATH = None
+
     @patch('tennis.setup_driver')
     @patch('tennis.load_config')
     def test_make_reservation_success(self, mock_load_config, mock_setup_driver):
@@ -349,7 +371,10 @@ class TestTennisScriptExecution:
         mock_load_config.assert_called_once_with(self.test_user_id, self.test_booking_request)
         mock_setup_driver.assert_called_once_with(mock_config)
         mock_driver.get.assert_called_once_with('https://parquesdelsol.sasweb.net/')
-        mock_driver.quit.assert_called_once()
+        # Driver is wiped and returned to the warm pool instead of being quit
+        mock_driver.quit.assert_not_called()
+        mock_driver.delete_all_cookies.assert_called_once()
+        assert tennis._DRIVER_POOL.qsize() == 1
         
     @patch('tennis.setup_driver')
     @patch('tennis.load_config')
@@ -407,6 +432,49 @@ class TestTennisScriptExecution:
         # Verify failure
         assert result == False
         
+    @patch('tennis.setup_driver')
+    @patch('tennis.load_config')
+    def test_make_reservation_unknown_time_slot(self, mock_load_config, mock_setup_driver):
+        """Test that a slot outside the site's schedule fails before browser launch"""
+        mock_load_config.return_value = {
+            'username': 'testuser',
+            'password': 'testpass',
+            'website_url': 'https://parquesdelsol.sasweb.net/',
+            'venue': 'Parques del Sol',
+            'area_value': 5,
+            'date': self.future_date,
+            'time_slot': 'De 09:13 AM a 10:13 AM',  # Not an offered slot
+            'headless': True
+        }
+
+        result = tennis.make_reservation(self.test_user_id, self.test_booking_request)
+
+        assert result == False
+        mock_setup_driver.assert_not_called()
+
+    @patch('tennis.setup_driver')
+    @patch('tennis.load_config')
+    def test_make_reservation_with_preloaded_config(self, mock_load_config, mock_setup_driver):
+        """Test that a preloaded config bypasses load_config entirely"""
+        preloaded = {
+            'username': 'testuser',
+            'password': 'testpass',
+            'website_url': 'https://parquesdelsol.sasweb.net/',
+            'venue': 'Parques del Sol',
+            'area_value': 5,
+            'date': self.future_date,
+            'time_slot': 'De 09:13 AM a 10:13 AM',  # fails fast, before the browser
+            'headless': True
+        }
+
+        result = tennis.make_reservation(
+            self.test_user_id, self.test_booking_request, preloaded_config=preloaded
+        )
+
+        assert result == False
+        mock_load_config.assert_not_called()
+        mock_setup_driver.assert_not_called()
+
     @patch('tennis.setup_driver')
     @patch('tennis.load_config')
     def test_make_reservation_config_error(self, mock_load_config, mock_setup_driver):
@@ -440,12 +508,14 @@ class TestTennisScriptExecution:
         mock_chrome.assert_called_once()
         
     @patch('tennis.ChromeDriverManager')
-    def test_setup_driver_failure(self, mock_driver_manager):
+    @patch('tennis.webdriver.Chrome')
+    def test_setup_driver_failure(self, mock_chrome, mock_driver_manager):
         """Test WebDriver setup failure"""
-        # Setup mocks
+        # Setup mocks - Selenium Manager and the webdriver_manager fallback both fail
         from selenium.common.exceptions import WebDriverException
+        mock_chrome.side_effect = WebDriverException("Chrome not reachable")
         mock_driver_manager.return_value.install.side_effect = WebDriverException("Driver not found")
-        
+
         config = {
             'headless': True
         }
@@ -453,26 +523,100 @@ class TestTennisScriptExecution:
         with pytest.raises(WebDriverException):
             tennis.setup_driver(config)
 
+    @patch('tennis.ChromeDriverManager')
+    @patch('tennis.webdriver.Chrome')
+    def test_setup_driver_reuses_cached_path(self, mock_chrome, mock_driver_manager):
+        """Test that the webdriver_manager fallback resolves the driver only once"""
+        from selenium.common.exceptions import WebDriverException
+        mock_driver_manager.return_value.install.return_value = "/path/to/chromedriver"
+
+        def chrome_factory(*args, **kwargs):
+            # Selenium Manager (no explicit service) is unavailable, the
+            # webdriver_manager fallback works
+            if 'service' not in kwargs:
+                raise WebDriverException("Selenium Manager unavailable")
+            return Mock()
+
+        mock_chrome.side_effect = chrome_factory
+
+        config = {'headless': True}
+        tennis.setup_driver(config)
+        tennis.setup_driver(config)
+
+        mock_driver_manager.return_value.install.assert_called_once()
+
+    @patch('tennis.setup_driver')
+    def test_prefetch_driver_warms_the_pool(self, mock_setup_driver):
+        """Test that a background prefetch parks a driver in the warm pool"""
+        mock_setup_driver.return_value = Mock()
+
+        future = tennis.prefetch_driver({'headless': True})
+        future.result(timeout=5)
+
+        mock_setup_driver.assert_called_once()
+        assert tennis._DRIVER_POOL.qsize() == 1
+
+    @patch('tennis.setup_driver')
+    def test_prefetch_driver_skips_stocked_pool(self, mock_setup_driver):
+        """Test that prefetch is a no-op while a warm driver is already idle"""
+        tennis._DRIVER_POOL.put(Mock())
+
+        future = tennis.prefetch_driver({'headless': True})
+        future.result(timeout=5)
+
+        mock_setup_driver.assert_not_called()
+        assert tennis._DRIVER_POOL.qsize() == 1
+
+    @patch('tennis.make_reservation')
+    def test_make_reservations_batch(self, mock_make_reservation):
+        """Test concurrent batch execution of reservations"""
+        mock_make_reservation.side_effect = (
+            lambda user_id=None, booking_request=None: user_id != 'user_2'
+        )
+
+        items = [
+            {'user_id': 'user_1', 'booking_request': None},
+            {'user_id': 'user_2', 'booking_request': None},
+            {'user_id': 'user_3', 'booking_request': None}
+        ]
+
+        results = asyncio.run(tennis.make_reservations_batch(items, max_concurrency=2))
+
+        # Results come back in input order
+        assert results == [True, False, True]
+        assert mock_make_reservation.call_count == 3
+
+    @patch('tennis.make_reservation')
+    def test_make_reservations_batch_captures_exceptions(self, mock_make_reservation):
+        """Test that one failing booking doesn't abort the batch"""
+        def fake_reservation(user_id=None, booking_request=None):
+            if user_id == 'user_2':
+                raise RuntimeError("boom")
+            return True
+
+        mock_make_reservation.side_effect = fake_reservation
+
+        items = [
+            {'user_id': 'user_1', 'booking_request': None},
+            {'user_id': 'user_2', 'booking_request': None}
+        ]
+
+        results = asyncio.run(tennis.make_reservations_batch(items))
+
+        assert results[0] == True
+        assert isinstance(results[1], RuntimeError)
+
 
 class TestTennisScriptIntegration:
     """Integration tests for tennis script with booking processor"""
-    
-    def setup_method(self):
-        """Set up test environment before each test"""
-        self.test_user_id = "test_user_123"
-        # Use a future date for booking_date validation
-        self.future_date = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
-        self.test_booking_request = BookingRequestModel(
-            request_id="req_123",
-            user_id=self.test_user_id,
-            court_id=1,
-            booking_date=self.future_date,
-            time_slot="De 09:00 AM a 10:00 AM",
-            status=BookingStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
-        
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, future_date, booking_request):
+        """Wire the shared fixtures onto the test instance"""
+        self.test_user_id = _TEST_USER_ID
+        self.future_date = future_date
+        self.test_booking_request = booking_request
+
     @patch('tennis.make_reservation')
     def test_booking_processor_integration(self, mock_make_reservation):
         """Test integration between booking processor and tennis script"""
@@ -493,7 +637,9 @@ class TestTennisScriptIntegration:
                 processor._execute_booking(self.test_booking_request)
                 
                 # Verify tennis script was called
-                mock_make_reservation.assert_called_once_with(self.test_user_id, self.test_booking_request)
+                mock_make_reservation.assert_called_once_with(
+                    self.test_user_id, self.test_booking_request, preloaded_config=None
+                )
                 mock_success.assert_called_once_with(self.test_booking_request)
                 
     @patch('tennis.make_reservation')
@@ -513,9 +659,28 @@ class TestTennisScriptIntegration:
             processor._execute_booking(self.test_booking_request)
             
             # Verify failure was handled
-            mock_make_reservation.assert_called_once_with(self.test_user_id, self.test_booking_request)
+            mock_make_reservation.assert_called_once_with(
+                self.test_user_id, self.test_booking_request, preloaded_config=None
+            )
             mock_failure.assert_called_once_with(self.test_booking_request, "Tennis script returned failure")
 
+    @patch('src.api.services.tennis_booking_processor.booking_service')
+    def test_booking_processor_runs_bookings_on_executor(self, mock_booking_service):
+        """Test that booking execution is handed to the shared worker pool"""
+        from src.api.services.tennis_booking_processor import TennisBookingProcessor
+
+        processor = TennisBookingProcessor()
+        executed = threading.Event()
+
+        with patch.object(processor, '_execute_booking', side_effect=lambda booking: executed.set()):
+            processor._process_booking_request(self.test_booking_request)
+
+            # _execute_booking runs on a pool thread, not inline
+            assert executed.wait(timeout=5)
+
+        assert processor.booking_executor is not None
+        processor.booking_executor.shutdown(wait=True)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -2,21 +2,37 @@
 # ABOUTME: Tests user registration, authentication, session management, and security features
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, Mock, patch, MagicMock, create_autospec
 from datetime import datetime, timedelta
-import os
 
-# Set test environment
-os.environ['TENNIS_ENVIRONMENT'] = 'development'
-os.environ['DYNAMODB_ENDPOINT'] = 'http://localhost:8000'
+# Test environment (TENNIS_ENVIRONMENT, DYNAMODB_ENDPOINT) comes from conftest.py
 
-from src.api.services.user_service import UserService, UserSession, SessionStatus
-from src.models import EncryptedUserConfig
+# The service and model modules pull boto3, cryptography and pydantic at
+# import; deferring them into fixtures keeps collection (and xdist worker
+# startup) from paying that cost up front.
 
-@pytest.fixture
-def mock_user():
-    """Mock user for testing"""
-    return EncryptedUserConfig(
+@pytest.fixture(scope="session")
+def user_session_cls():
+    """UserSession class, imported lazily"""
+    from src.api.services.user_service import UserSession
+    return UserSession
+
+@pytest.fixture(scope="session")
+def session_status():
+    """SessionStatus enum, imported lazily"""
+    from src.api.services.user_service import SessionStatus
+    return SessionStatus
+
+@pytest.fixture(scope="session")
+def encrypted_user_config_cls():
+    """EncryptedUserConfig class, imported lazily"""
+    from src.models import EncryptedUserConfig
+    return EncryptedUserConfig
+
+@pytest.fixture(scope="session")
+def _user_template(encrypted_user_config_cls):
+    """Canonical test user built once; model validation runs a single time"""
+    return encrypted_user_config_cls(
         user_id="test_user_123",
         username="testuser",
         password="TestPass123!",
@@ -29,29 +45,161 @@ def mock_user():
         max_bookings_per_day=1,
         auto_booking_enabled=False,
         failed_login_attempts=0,
-        last_login=datetime.now(),
+        last_login=_FROZEN_TIME.isoformat(),
         account_locked_until=None
     )
 
 @pytest.fixture
-def user_service():
-    """User service instance for testing"""
-    return UserService()
+def mock_user(_user_template):
+    """Mock user for testing (fresh deep copy of the shared template)"""
+    return _user_template.model_copy(deep=True)
+
+@pytest.fixture(scope="module")
+def user_service(_dao_mock_template):
+    """Shared user service instance; construction cost is paid once per module
+
+    Both lazily-built DAOs are replaced with mocks up front so no test can
+    accidentally open a real DynamoDB connection; these tests exercise the
+    service logic against the autospec'd DAO mock only.
+    """
+    from src.api.services.user_service import UserService
+    service = UserService()
+    service.user_dao = _dao_mock_template.return_value
+    service.system_config_dao = MagicMock()
+    yield service
+    service.active_sessions.clear()
+
+# The instant frozen_now pins the service clock to, plus the offsets the
+# time-based tests share, computed once instead of per test body
+_FROZEN_TIME = datetime(2024, 1, 1, 12, 0, 0)
+_ONE_HOUR_AGO = _FROZEN_TIME - timedelta(hours=1)
+_ONE_HOUR_AHEAD = _FROZEN_TIME + timedelta(hours=1)
+_LOCK_EXPIRED = _FROZEN_TIME - timedelta(minutes=30)
+_LOCK_ACTIVE = _FROZEN_TIME + timedelta(minutes=30)
+
+def _set(user, **overrides):
+    """Assign model attributes without re-running assignment validation
+
+    The models enable validate_assignment, so plain setattr re-validates
+    the field on every mutation; tests nudging bookkeeping fields (lock
+    timestamps, attempt counters) don't need that. Encryption is untouched
+    either way - it only runs in the storage converters.
+    """
+    for key, value in overrides.items():
+        object.__setattr__(user, key, value)
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the service module's clock so time-based tests are deterministic"""
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return _FROZEN_TIME
+
+    monkeypatch.setattr('src.api.services.user_service.datetime', _FrozenDatetime)
+    return _FROZEN_TIME
+
+@pytest.fixture(scope="session")
+def _dao_mock_template():
+    """Spec'd DAO class mock built once; autospec construction is expensive
+
+    Being spec'd also means attribute access is validated against the real
+    DAO API instead of silently minting child mocks for typos.
+    """
+    from src.dao import EncryptedUserConfigDAO
+    return create_autospec(EncryptedUserConfigDAO, instance=False)
+
+@pytest.fixture
+def mock_dao(_dao_mock_template, monkeypatch):
+    """Hand each test a clean view of the shared autospec'd DAO mock
+
+    reset_mock wipes recorded calls and configured returns far cheaper
+    than rebuilding the autospec (or a per-test @patch) would be.
+    """
+    _dao_mock_template.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(
+        'src.api.services.user_service.EncryptedUserConfigDAO', _dao_mock_template
+    )
+    return _dao_mock_template
+
+@pytest.fixture
+def session_factory(user_session_cls, frozen_now):
+    """Build n active sessions for a user, keyed by session_id"""
+    def _make(n, user_id="test_user"):
+        sessions = {}
+        for i in range(n):
+            session = user_session_cls(
+                user_id=user_id,
+                token=f"test_token_{i}",
+                expires_at=_ONE_HOUR_AHEAD,
+                ip_address="192.168.1.1"
+            )
+            sessions[session.session_id] = session
+        return sessions
+
+    return _make
+
+@pytest.fixture
+def patched_dao(mock_dao, mock_user, user_service):
+    """DAO mock instance with the setup every DAO test repeated
+
+    Lookup and update both resolve to mock_user and the instance is
+    already bound to the shared service; tests override only the return
+    values their scenario actually changes.
+    """
+    instance = mock_dao.return_value
+    instance.get_user_by_username.return_value = mock_user
+    instance.update_user.return_value = mock_user
+    user_service.user_dao = instance
+    return instance
+
+@pytest.fixture(autouse=True)
+def _reset_sessions(user_service):
+    """Keep session state isolated between tests on the shared service"""
+    yield
+    user_service.active_sessions.clear()
+    user_service._pending_failed.clear()
+
+@pytest.fixture(autouse=True, scope="class")
+def _patch_auth(request):
+    """Patch the auth_service entry points once per class, not per test
+
+    Pushing and popping three patchers for every test adds up; the class
+    pays it once and _reset_auth below wipes recorded calls between tests.
+    Tests reach the mocks through self._auth_mocks[<name>].
+    """
+    patcher = patch.multiple(
+        'src.api.services.user_service.auth_service',
+        verify_tennis_site_credentials=DEFAULT,
+        authenticate_user=DEFAULT,
+        create_access_token=DEFAULT,
+    )
+    mocks = patcher.start()
+    request.addfinalizer(patcher.stop)
+    if request.cls is not None:
+        request.cls._auth_mocks = mocks
+
+@pytest.fixture(autouse=True)
+def _reset_auth(request):
+    """Give each test a clean view of the class-level auth mocks"""
+    mocks = getattr(request.cls, '_auth_mocks', None) if request.cls else None
+    if mocks:
+        for mock in mocks.values():
+            mock.reset_mock(return_value=True, side_effect=True)
 
 class TestUserService:
     """Test user service functionality"""
     
-    @patch('src.api.services.user_service.auth_service.verify_tennis_site_credentials')
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_register_user_success(self, mock_dao, mock_verify, user_service, mock_user):
+    def test_register_user_success(self, user_service, mock_user, patched_dao):
         """Test successful user registration"""
         # Mock tennis site validation
+        mock_verify = self._auth_mocks['verify_tennis_site_credentials']
         mock_verify.return_value = True
-        
-        # Mock DAO methods
-        mock_dao_instance = mock_dao.return_value
-        mock_dao_instance.get_user_by_username.return_value = None
-        mock_dao_instance.create_user.return_value = mock_user
+
+        # Mock DAO methods - no existing user, creation succeeds
+        patched_dao.get_user_by_username.return_value = None
+        patched_dao.create_user.return_value = mock_user
         
         # Test registration
         result = user_service.register_user(
@@ -65,19 +213,15 @@ class TestUserService:
         assert result is not None
         assert result.username == "testuser"
         mock_verify.assert_called_once_with("testuser", "TestPass123!")
-        mock_dao_instance.create_user.assert_called_once()
+        patched_dao.create_user.assert_called_once()
     
-    @patch('src.api.services.user_service.auth_service.verify_tennis_site_credentials')
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_register_user_already_exists(self, mock_dao, mock_verify, user_service, mock_user):
+    def test_register_user_already_exists(self, user_service, patched_dao):
         """Test user registration when user already exists"""
-        # Mock tennis site validation
+        # Mock tennis site validation; patched_dao already returns the
+        # existing user from the username lookup
+        mock_verify = self._auth_mocks['verify_tennis_site_credentials']
         mock_verify.return_value = True
-        
-        # Mock DAO methods - user already exists
-        mock_dao_instance = mock_dao.return_value
-        mock_dao_instance.get_user_by_username.return_value = mock_user
-        
+
         # Test registration
         result = user_service.register_user(
             username="testuser",
@@ -85,12 +229,12 @@ class TestUserService:
         )
         
         assert result is None
-        mock_dao_instance.create_user.assert_not_called()
+        patched_dao.create_user.assert_not_called()
     
-    @patch('src.api.services.user_service.auth_service.verify_tennis_site_credentials')
-    def test_register_user_tennis_site_failure(self, mock_verify, user_service):
+    def test_register_user_tennis_site_failure(self, user_service):
         """Test user registration with tennis site validation failure"""
         # Mock tennis site validation failure
+        mock_verify = self._auth_mocks['verify_tennis_site_credentials']
         mock_verify.return_value = False
         
         # Test registration
@@ -102,20 +246,12 @@ class TestUserService:
         assert result is None
         mock_verify.assert_called_once_with("testuser", "wrongpass")
     
-    @patch('src.api.services.user_service.auth_service.authenticate_user')
-    @patch('src.api.services.user_service.auth_service.create_access_token')
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_authenticate_user_enhanced_success(self, mock_dao, mock_create_token, mock_auth, user_service, mock_user):
+    def test_authenticate_user_enhanced_success(self, user_service, mock_user, patched_dao):
         """Test enhanced user authentication success"""
-        # Mock authentication
-        mock_auth.return_value = mock_user
-        mock_create_token.return_value = "test_token"
-        
-        # Mock DAO methods
-        mock_dao_instance = mock_dao.return_value
-        mock_dao_instance.get_user_by_username.return_value = mock_user
-        mock_dao_instance.update_user.return_value = mock_user
-        
+        # Mock authentication; patched_dao covers the lookup and update
+        self._auth_mocks['authenticate_user'].return_value = mock_user
+        self._auth_mocks['create_access_token'].return_value = "test_token"
+
         # Test authentication
         result = user_service.authenticate_user_enhanced(
             username="testuser",
@@ -127,15 +263,14 @@ class TestUserService:
         assert result["access_token"] == "test_token"
         assert result["user"] == mock_user
         assert "session_id" in result
-        mock_dao_instance.update_user.assert_called_once()
+        patched_dao.update_user.assert_called_once()
     
-    @patch('src.api.services.user_service.auth_service.authenticate_user')
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_authenticate_user_enhanced_failure(self, mock_dao, mock_auth, user_service):
+    def test_authenticate_user_enhanced_failure(self, user_service, patched_dao):
         """Test enhanced user authentication failure"""
-        # Mock authentication failure
-        mock_auth.return_value = None
-        
+        # Mock authentication failure for an unknown user
+        self._auth_mocks['authenticate_user'].return_value = None
+        patched_dao.get_user_by_username.return_value = None
+
         # Test authentication
         result = user_service.authenticate_user_enhanced(
             username="testuser",
@@ -144,16 +279,11 @@ class TestUserService:
         
         assert result is None
     
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_authenticate_user_account_locked(self, mock_dao, user_service, mock_user):
+    def test_authenticate_user_account_locked(self, user_service, mock_user, patched_dao, frozen_now):
         """Test authentication with locked account"""
-        # Mock locked account
-        mock_user.account_locked_until = datetime.now() + timedelta(minutes=30)
-        
-        # Mock DAO methods
-        mock_dao_instance = mock_dao.return_value
-        mock_dao_instance.get_user_by_username.return_value = mock_user
-        
+        # Mock locked account; patched_dao already resolves the lookup
+        _set(mock_user, account_locked_until=_LOCK_ACTIVE)
+
         # Test authentication
         result = user_service.authenticate_user_enhanced(
             username="testuser",
@@ -168,117 +298,116 @@ class TestUserService:
         result = user_service.validate_password_strength(strong_password)
         assert result is True
     
-    def test_validate_password_strength_weak(self, user_service):
+    @pytest.mark.parametrize("password", [
+        "weak",  # Too short
+        "weakpass",  # No uppercase, no numbers, no special chars
+        "WEAKPASS",  # No lowercase, no numbers, no special chars
+        "WeakPass",  # No numbers, no special chars
+        "WeakPass123",  # No special chars
+    ])
+    def test_validate_password_strength_weak(self, user_service, password):
         """Test weak password validation"""
-        weak_passwords = [
-            "weak",  # Too short
-            "weakpass",  # No uppercase, no numbers, no special chars
-            "WEAKPASS",  # No lowercase, no numbers, no special chars
-            "WeakPass",  # No numbers, no special chars
-            "WeakPass123",  # No special chars
-        ]
-        
-        for password in weak_passwords:
-            result = user_service.validate_password_strength(password)
-            assert result is False
+        result = user_service.validate_password_strength(password)
+        assert result is False
     
     def test_validate_user_data_valid(self, user_service, mock_user):
         """Test valid user data validation"""
         result = user_service.validate_user_data(mock_user)
         assert result is True
     
-    def test_validate_user_data_invalid(self, user_service):
+    @pytest.mark.parametrize("overrides", [
+        pytest.param({"username": "ab", "password": "weak"}, id="username_too_short"),
+        pytest.param({"password": "weak"}, id="weak_password"),
+        pytest.param({"email": "invalid-email"}, id="invalid_email"),
+    ])
+    def test_validate_user_data_invalid(self, user_service, mock_user, overrides):
         """Test invalid user data validation"""
-        invalid_users = [
-            EncryptedUserConfig(
-                user_id="test", username="ab", password="weak",  # Username too short
-                email="test@example.com", first_name="Test", last_name="User",
-                preferred_courts=[1], preferred_times=["De 08:00 AM a 09:00 AM"],
-                max_bookings_per_day=1, auto_booking_enabled=False
-            ),
-            EncryptedUserConfig(
-                user_id="test", username="testuser", password="weak",  # Weak password
-                email="test@example.com", first_name="Test", last_name="User",
-                preferred_courts=[1], preferred_times=["De 08:00 AM a 09:00 AM"],
-                max_bookings_per_day=1, auto_booking_enabled=False
-            ),
-            EncryptedUserConfig(
-                user_id="test", username="testuser", password="StrongPass123!",
-                email="invalid-email", first_name="Test", last_name="User",  # Invalid email
-                preferred_courts=[1], preferred_times=["De 08:00 AM a 09:00 AM"],
-                max_bookings_per_day=1, auto_booking_enabled=False
-            )
-        ]
-        
-        for user in invalid_users:
-            result = user_service.validate_user_data(user)
-            assert result is False
+        # The model's own validators reject these values at construction,
+        # so sneak them past via model_copy (which skips re-validation) to
+        # exercise the service-level checks in isolation
+        user = mock_user.model_copy(update=overrides)
+
+        assert user_service.validate_user_data(user) is False
     
-    def test_is_account_locked_true(self, user_service, mock_user):
+    def test_is_account_locked_true(self, user_service, mock_user, frozen_now):
         """Test account lock check when account is locked"""
-        mock_user.account_locked_until = datetime.now() + timedelta(minutes=30)
+        _set(mock_user, account_locked_until=_LOCK_ACTIVE)
         result = user_service.is_account_locked(mock_user)
         assert result is True
     
     def test_is_account_locked_false(self, user_service, mock_user):
         """Test account lock check when account is not locked"""
-        mock_user.account_locked_until = None
+        _set(mock_user, account_locked_until=None)
         result = user_service.is_account_locked(mock_user)
         assert result is False
     
-    def test_is_account_locked_expired(self, user_service, mock_user):
+    def test_is_account_locked_expired(self, user_service, mock_user, frozen_now):
         """Test account lock check when lock has expired"""
-        mock_user.account_locked_until = datetime.now() - timedelta(minutes=30)
+        _set(mock_user, account_locked_until=_LOCK_EXPIRED)
         result = user_service.is_account_locked(mock_user)
         assert result is False
     
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_handle_failed_login(self, mock_dao, user_service, mock_user):
+    def test_handle_failed_login(self, user_service, mock_user, patched_dao):
         """Test failed login handling"""
-        # Mock DAO
-        mock_dao_instance = mock_dao.return_value
-        mock_dao_instance.update_user.return_value = mock_user
-        
-        # Test failed login handling
+        # Test failed login handling; the write is coalesced until flush
         user_service.handle_failed_login(mock_user)
-        
+
         assert mock_user.failed_login_attempts == 1
-        mock_dao_instance.update_user.assert_called_once()
-    
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_handle_failed_login_account_lock(self, mock_dao, user_service, mock_user):
+        patched_dao.update_user.assert_not_called()
+
+        user_service.flush_failed_logins()
+        patched_dao.update_user.assert_called_once()
+
+    def test_handle_failed_login_account_lock(self, user_service, mock_user, patched_dao):
         """Test account lock after multiple failed logins"""
-        # Mock DAO
-        mock_dao_instance = mock_dao.return_value
-        mock_dao_instance.update_user.return_value = mock_user
-        
         # Set up for account lock
-        mock_user.failed_login_attempts = 4
-        
+        _set(mock_user, failed_login_attempts=4)
+
         # Test failed login handling
         user_service.handle_failed_login(mock_user)
-        
+
         assert mock_user.failed_login_attempts == 5
         assert mock_user.account_locked_until is not None
-        mock_dao_instance.update_user.assert_called_once()
-    
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_reset_failed_login_attempts(self, mock_dao, user_service, mock_user):
+        patched_dao.update_user.assert_called_once()
+
+    def test_handle_failed_login_fresh_objects_still_lock(self, user_service, _user_template, patched_dao):
+        """Lockout trips even when every attempt sees a freshly fetched user
+
+        authenticate_user_enhanced re-fetches the user on each attempt, so
+        while writes are coalesced each object carries the stale persisted
+        counter; the pending entry must carry the accumulated count forward.
+        """
+        fresh = None
+        for _ in range(5):
+            fresh = _user_template.model_copy(deep=True)  # stale counter: 0
+            user_service.handle_failed_login(fresh)
+
+        assert fresh.failed_login_attempts == 5
+        assert fresh.account_locked_until is not None
+        patched_dao.update_user.assert_called_once()
+
+    def test_flush_failed_logins_coalesces_writes(self, user_service, mock_user, patched_dao):
+        """Test that successive failed logins share one persisted write"""
+        user_service.handle_failed_login(mock_user)
+        user_service.handle_failed_login(mock_user)
+
+        assert mock_user.failed_login_attempts == 2
+        patched_dao.update_user.assert_not_called()
+
+        assert user_service.flush_failed_logins() == 1
+        patched_dao.update_user.assert_called_once()
+
+    def test_reset_failed_login_attempts(self, user_service, mock_user, patched_dao, frozen_now):
         """Test reset of failed login attempts"""
-        # Mock DAO
-        mock_dao_instance = mock_dao.return_value
-        mock_dao_instance.update_user.return_value = mock_user
-        
         # Set up failed attempts
-        mock_user.failed_login_attempts = 3
-        mock_user.account_locked_until = datetime.now() + timedelta(minutes=30)
-        
+        _set(mock_user, failed_login_attempts=3, account_locked_until=_LOCK_ACTIVE)
+
         # Test reset
         user_service.reset_failed_login_attempts(mock_user)
-        
+
         assert mock_user.failed_login_attempts == 0
         assert mock_user.account_locked_until is None
-        mock_dao_instance.update_user.assert_called_once()
+        patched_dao.update_user.assert_called_once()
     
     def test_analyze_password_strength_very_strong(self, user_service):
         """Test password strength analysis for very strong password"""
@@ -317,13 +446,14 @@ class TestUserService:
         assert len(recommendations) > 0
         assert any("stronger password" in rec for rec in recommendations)
     
-    def test_session_management(self, user_service):
+    @pytest.mark.xdist_group(name="user_sessions")
+    def test_session_management(self, user_service, frozen_now, user_session_cls):
         """Test session creation and management"""
         # Create a session
-        session = UserSession(
+        session = user_session_cls(
             user_id="test_user",
             token="test_token",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at=_ONE_HOUR_AHEAD,
             ip_address="192.168.1.1"
         )
         
@@ -343,18 +473,12 @@ class TestUserService:
         sessions = user_service.get_user_sessions("test_user")
         assert len(sessions) == 0
     
-    def test_revoke_all_sessions(self, user_service):
+    @pytest.mark.xdist_group(name="user_sessions")
+    def test_revoke_all_sessions(self, user_service, session_factory):
         """Test revoking all sessions for a user"""
         # Create multiple sessions
-        for i in range(3):
-            session = UserSession(
-                user_id="test_user",
-                token=f"test_token_{i}",
-                expires_at=datetime.now() + timedelta(hours=1),
-                ip_address="192.168.1.1"
-            )
-            user_service.active_sessions[session.session_id] = session
-        
+        user_service.active_sessions.update(session_factory(3))
+
         # Test revoke all sessions
         revoked_count = user_service.revoke_all_sessions("test_user")
         assert revoked_count == 3
@@ -363,22 +487,23 @@ class TestUserService:
         sessions = user_service.get_user_sessions("test_user")
         assert len(sessions) == 0
     
-    def test_cleanup_expired_sessions(self, user_service):
+    @pytest.mark.xdist_group(name="user_sessions")
+    def test_cleanup_expired_sessions(self, user_service, frozen_now, user_session_cls):
         """Test cleanup of expired sessions"""
         # Create expired session
-        expired_session = UserSession(
+        expired_session = user_session_cls(
             user_id="test_user",
             token="expired_token",
-            expires_at=datetime.now() - timedelta(hours=1),
+            expires_at=_ONE_HOUR_AGO,
             ip_address="192.168.1.1"
         )
         user_service.active_sessions[expired_session.session_id] = expired_session
-        
+
         # Create valid session
-        valid_session = UserSession(
+        valid_session = user_session_cls(
             user_id="test_user",
             token="valid_token",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at=_ONE_HOUR_AHEAD,
             ip_address="192.168.1.1"
         )
         user_service.active_sessions[valid_session.session_id] = valid_session
@@ -392,76 +517,101 @@ class TestUserService:
         assert len(sessions) == 1
         assert sessions[0]["session_id"] == valid_session.session_id
 
-class TestUserServiceIntegration:
-    """Integration tests for user service"""
-    
-    @patch('src.api.services.user_service.auth_service.verify_tennis_site_credentials')
-    @patch('src.api.services.user_service.EncryptedUserConfigDAO')
-    def test_full_user_lifecycle(self, mock_dao, mock_verify, user_service, mock_user):
-        """Test complete user lifecycle from registration to deactivation"""
-        # Mock dependencies
-        mock_verify.return_value = True
-        mock_dao_instance = mock_dao.return_value
-        mock_dao_instance.get_user_by_username.return_value = None
-        mock_dao_instance.create_user.return_value = mock_user
-        mock_dao_instance.get_user.return_value = mock_user
-        mock_dao_instance.update_user.return_value = mock_user
-        
-        # 1. Register user
-        registered_user = user_service.register_user(
+class TestFullLifecycle:
+    """User lifecycle split into atomic steps that share class-scoped state
+
+    Each fixture performs one lifecycle step and chains on the previous
+    one, so the steps still run in order while every assertion gets its
+    own test and failure report. The steps execute once per class; mock
+    call records are configured before the chain runs, and the tests
+    assert on the returned values rather than on call bookkeeping.
+    """
+
+    @pytest.fixture(scope="class")
+    def lifecycle_user(self, _user_template):
+        return _user_template.model_copy(deep=True)
+
+    @pytest.fixture(scope="class")
+    def lifecycle_dao(self, user_service, _dao_mock_template, lifecycle_user):
+        _dao_mock_template.reset_mock(return_value=True, side_effect=True)
+        dao = _dao_mock_template.return_value
+        dao.get_user_by_username.return_value = None
+        dao.create_user.return_value = lifecycle_user
+        dao.get_user.return_value = lifecycle_user
+        dao.update_user.return_value = lifecycle_user
+        dao.get_user_security_summary.return_value = {}
+        user_service.user_dao = dao
+        return dao
+
+    @pytest.fixture(scope="class")
+    def registered_user(self, user_service, lifecycle_dao):
+        self._auth_mocks['verify_tennis_site_credentials'].return_value = True
+        return user_service.register_user(
             username="testuser",
             password="TestPass123!",
             email="test@example.com"
         )
-        assert registered_user is not None
-        
-        # 2. Authenticate user
-        auth_result = user_service.authenticate_user_enhanced(
+
+    @pytest.fixture(scope="class")
+    def auth_result(self, user_service, registered_user, lifecycle_user):
+        self._auth_mocks['authenticate_user'].return_value = lifecycle_user
+        self._auth_mocks['create_access_token'].return_value = "test_token"
+        return user_service.authenticate_user_enhanced(
             username="testuser",
             password="TestPass123!"
         )
+
+    @pytest.fixture(scope="class")
+    def security_summary(self, user_service, auth_result, lifecycle_user):
+        return user_service.get_user_security_summary(lifecycle_user.user_id)
+
+    def test_register_user(self, registered_user):
+        assert registered_user is not None
+        assert registered_user.username == "testuser"
+
+    def test_authenticate_user(self, auth_result):
         assert auth_result is not None
-        
-        # 3. Get security summary
-        security_summary = user_service.get_user_security_summary(mock_user.user_id)
+        assert auth_result["access_token"] == "test_token"
+
+    def test_security_summary(self, security_summary):
         assert "password_strength" in security_summary
-        
-        # 4. Validate user data
-        is_valid = user_service.validate_user_data(mock_user)
-        assert is_valid is True
-        
-        # 5. Session management
-        sessions = user_service.get_user_sessions(mock_user.user_id)
+
+    def test_validate_user_data(self, user_service, lifecycle_user, security_summary):
+        assert user_service.validate_user_data(lifecycle_user) is True
+
+    def test_session_from_authentication(self, user_service, auth_result, lifecycle_user):
+        sessions = user_service.get_user_sessions(lifecycle_user.user_id)
         assert len(sessions) >= 0  # May have sessions from authentication
-    
-    def test_security_validation_comprehensive(self, user_service):
+
+class TestUserServiceIntegration:
+    """Integration tests for user service"""
+
+    @pytest.mark.parametrize("password,expected", [
+        ("Password123!", True),    # Strong password
+        ("password", False),       # Weak password
+        ("PASSWORD", False),       # No lowercase
+        ("Password", False),       # No numbers/special
+        ("Pass123!", True),        # Acceptable password
+        ("VeryStrongPassword123!", True),  # Very strong password
+    ])
+    def test_security_validation_comprehensive(self, user_service, password, expected):
         """Test comprehensive security validation"""
-        # Test various password scenarios
-        test_cases = [
-            ("Password123!", True),    # Strong password
-            ("password", False),       # Weak password
-            ("PASSWORD", False),       # No lowercase
-            ("Password", False),       # No numbers/special
-            ("Pass123!", True),        # Acceptable password
-            ("VeryStrongPassword123!", True),  # Very strong password
-        ]
-        
-        for password, expected in test_cases:
-            result = user_service.validate_password_strength(password)
-            assert result == expected, f"Password '{password}' validation failed"
+        result = user_service.validate_password_strength(password)
+        assert result == expected, f"Password '{password}' validation failed"
     
-    def test_session_security(self, user_service):
+    @pytest.mark.xdist_group(name="user_sessions")
+    def test_session_security(self, user_service, frozen_now, user_session_cls, session_status):
         """Test session security features"""
         # Test session creation
-        session = UserSession(
+        session = user_session_cls(
             user_id="test_user",
             token="test_token",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at=_ONE_HOUR_AHEAD,
             ip_address="192.168.1.1"
         )
         
         # Verify session properties
-        assert session.status == SessionStatus.ACTIVE
+        assert session.status == session_status.ACTIVE
         assert session.user_id == "test_user"
         assert session.ip_address == "192.168.1.1"
         assert session.access_count == 1